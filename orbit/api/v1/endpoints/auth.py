@@ -4,15 +4,12 @@ Authentication endpoints.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.dependencies import get_auth_service
 from orbit.core.exceptions import AuthenticationError
 from orbit.core.logging import get_logger
 from orbit.core.middleware import get_current_user
-from orbit.db.session import get_session
-from orbit.models.auth import User
-from orbit.repositories.user_repository import UserRepository
-from orbit.schemas.auth import Token, UserCreate, UserLogin, UserRead
+from orbit.schemas.auth import CurrentUser, Token, UserCreate, UserLogin, UserRead
 from orbit.services.auth_service import AuthService
 
 logger = get_logger("api.auth")
@@ -22,12 +19,10 @@ router = APIRouter()
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def register(
     user_in: UserCreate,
-    session: AsyncSession = Depends(get_session),
+    service: AuthService = Depends(get_auth_service),
 ):
     """Register a new user."""
     try:
-        user_repo = UserRepository(session)
-        service = AuthService(user_repo)
         user = await service.register_user(user_in)
         return user
     except AuthenticationError as e:
@@ -46,12 +41,10 @@ async def register(
 @router.post("/token", response_model=Token)
 async def login_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: AsyncSession = Depends(get_session),
+    service: AuthService = Depends(get_auth_service),
 ):
     """OAuth2 compatible token login, get an access token for future requests."""
     try:
-        user_repo = UserRepository(session)
-        service = AuthService(user_repo)
         user_login = UserLogin(username=form_data.username, password=form_data.password)
         user = await service.authenticate_user(user_login)
         return await service.create_tokens(user)
@@ -72,12 +65,10 @@ async def login_access_token(
 @router.post("/login", response_model=Token)
 async def login(
     user_in: UserLogin,
-    session: AsyncSession = Depends(get_session),
+    service: AuthService = Depends(get_auth_service),
 ):
     """JSON login, get an access token for future requests."""
     try:
-        user_repo = UserRepository(session)
-        service = AuthService(user_repo)
         user = await service.authenticate_user(user_in)
         return await service.create_tokens(user)
     except AuthenticationError as e:
@@ -96,7 +87,7 @@ async def login(
 
 @router.get("/me", response_model=UserRead)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Get current user information."""
     return current_user
@@ -6,25 +6,57 @@ Provides audit trail and debugging capabilities.
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import selectinload
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
-from orbit.db.session import get_session
-from orbit.models.execution_history import TaskExecution, WorkflowExecution
+from orbit.core.pagination import decode_cursor, encode_cursor
+from orbit.core.responses import ORJSONResponse
+from orbit.db.session import get_readonly_session, get_session
+from orbit.models.execution_history import WorkflowExecution
 
 logger = get_logger("api.history")
 router = APIRouter()
 
+# Columns returned by the execution list endpoints; rows are zipped with the
+# field names so no ORM objects are built and orjson formats UUIDs/datetimes
+_EXECUTION_COLUMNS = (
+    WorkflowExecution.id,
+    WorkflowExecution.workflow_id,
+    WorkflowExecution.workflow_name,
+    WorkflowExecution.status,
+    WorkflowExecution.started_at,
+    WorkflowExecution.completed_at,
+    WorkflowExecution.duration_seconds,
+    WorkflowExecution.error_message,
+)
+_EXECUTION_FIELDS = tuple(column.key for column in _EXECUTION_COLUMNS)
+
+
+def _execution_dict(row: tuple) -> dict:
+    """Map a row of _EXECUTION_COLUMNS to a field-name dict."""
+    return dict(zip(_EXECUTION_FIELDS, row, strict=True))
+
+
+def _cutoff(hours: int) -> datetime:
+    """Start of a look-back window (execution timestamps are stored as naive UTC)."""
+    return utcnow() - timedelta(hours=hours)
+
 
 @router.get("/workflows/{workflow_id}/history")
 async def get_workflow_execution_history(
     workflow_id: UUID,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     status: str | None = Query(default=None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
 ):
     """
     Get execution history for a workflow.
@@ -32,38 +64,50 @@ async def get_workflow_execution_history(
     Args:
         workflow_id: Workflow UUID
         limit: Maximum number of results
-        offset: Pagination offset
+        offset: Pagination offset (ignored when a cursor is given)
+        cursor: Keyset cursor returned as next_cursor by the previous page
         status: Filter by status (queued, running, completed, failed, cancelled)
     """
-    statement = select(WorkflowExecution).where(
+    statement = select(*_EXECUTION_COLUMNS).where(
         WorkflowExecution.workflow_id == workflow_id
     )
 
     if status:
         statement = statement.where(WorkflowExecution.status == status)
 
-    statement = statement.order_by(WorkflowExecution.started_at.desc())
-    statement = statement.offset(offset).limit(limit)
+    statement = statement.order_by(
+        WorkflowExecution.started_at.desc(), WorkflowExecution.id.desc()
+    )
 
-    result = await session.exec(statement)
-    executions = result.all()
+    if cursor:
+        try:
+            cursor_started_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        statement = statement.where(
+            tuple_(WorkflowExecution.started_at, WorkflowExecution.id)
+            < tuple_(cursor_started_at, cursor_id)
+        )
+    else:
+        statement = statement.offset(offset)
 
-    return {
-        "workflow_id": str(workflow_id),
-        "total": len(executions),
-        "executions": [
-            {
-                "id": str(exec.id),
-                "workflow_name": exec.workflow_name,
-                "status": exec.status,
-                "started_at": exec.started_at.isoformat(),
-                "completed_at": exec.completed_at.isoformat() if exec.completed_at else None,
-                "duration_seconds": exec.duration_seconds,
-                "error_message": exec.error_message,
-            }
-            for exec in executions
-        ],
-    }
+    statement = statement.limit(limit)
+
+    result = await session.exec(statement)
+    executions = [_execution_dict(row) for row in result.all()]
+
+    next_cursor = None
+    if len(executions) == limit:
+        last = executions[-1]
+        next_cursor = encode_cursor(last["started_at"], last["id"])
+
+    return ORJSONResponse(
+        {
+            "workflow_id": workflow_id,
+            "next_cursor": next_cursor,
+            "executions": executions,
+        }
+    )
 
 
 @router.get("/workflows/{workflow_id}/executions/{execution_id}")
@@ -73,51 +117,49 @@ async def get_workflow_execution_details(
     session: AsyncSession = Depends(get_session),
 ):
     """Get detailed information about a specific execution."""
-    # Get workflow execution
-    workflow_statement = select(WorkflowExecution).where(
-        WorkflowExecution.id == execution_id,
-        WorkflowExecution.workflow_id == workflow_id,
+    # Load the execution and its task executions together
+    statement = (
+        select(WorkflowExecution)
+        .where(
+            WorkflowExecution.id == execution_id,
+            WorkflowExecution.workflow_id == workflow_id,
+        )
+        .options(selectinload(WorkflowExecution.tasks))
     )
-    workflow_result = await session.exec(workflow_statement)
-    workflow_exec = workflow_result.first()
+    result = await session.exec(statement)
+    workflow_exec = result.first()
 
     if not workflow_exec:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Execution not found")
 
-    # Get task executions
-    task_statement = select(TaskExecution).where(
-        TaskExecution.workflow_execution_id == execution_id
-    ).order_by(TaskExecution.started_at)
-
-    task_result = await session.exec(task_statement)
-    task_execs = task_result.all()
-
-    return {
-        "id": str(workflow_exec.id),
-        "workflow_id": str(workflow_exec.workflow_id),
-        "workflow_name": workflow_exec.workflow_name,
-        "status": workflow_exec.status,
-        "started_at": workflow_exec.started_at.isoformat(),
-        "completed_at": workflow_exec.completed_at.isoformat() if workflow_exec.completed_at else None,
-        "duration_seconds": workflow_exec.duration_seconds,
-        "error_message": workflow_exec.error_message,
-        "metadata": workflow_exec.metadata,
-        "tasks": [
-            {
-                "id": str(task.id),
-                "task_name": task.task_name,
-                "attempt_number": task.attempt_number,
-                "status": task.status,
-                "started_at": task.started_at.isoformat(),
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "duration_seconds": task.duration_seconds,
-                "error_message": task.error_message,
-                "result": task.result,
-            }
-            for task in task_execs
-        ],
-    }
+    # Raw UUIDs and datetimes are serialized natively by orjson
+    return ORJSONResponse(
+        {
+            "id": workflow_exec.id,
+            "workflow_id": workflow_exec.workflow_id,
+            "workflow_name": workflow_exec.workflow_name,
+            "status": workflow_exec.status,
+            "started_at": workflow_exec.started_at,
+            "completed_at": workflow_exec.completed_at,
+            "duration_seconds": workflow_exec.duration_seconds,
+            "error_message": workflow_exec.error_message,
+            "metadata": workflow_exec.extra_data,
+            "tasks": [
+                {
+                    "id": task.id,
+                    "task_name": task.task_name,
+                    "attempt_number": task.attempt_number,
+                    "status": task.status,
+                    "started_at": task.started_at,
+                    "completed_at": task.completed_at,
+                    "duration_seconds": task.duration_seconds,
+                    "error_message": task.error_message,
+                    "result": task.result,
+                }
+                for task in workflow_exec.tasks
+            ],
+        }
+    )
 
 
 @router.get("/history/recent")
@@ -125,7 +167,7 @@ async def get_recent_executions(
     limit: int = Query(default=20, le=100),
     hours: int = Query(default=24, le=168),  # Max 1 week
     status: str | None = Query(default=None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
 ):
     """
     Get recent workflow executions across all workflows.
@@ -135,9 +177,9 @@ async def get_recent_executions(
         hours: Look back this many hours
         status: Filter by status
     """
-    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    cutoff_time = _cutoff(hours)
 
-    statement = select(WorkflowExecution).where(
+    statement = select(*_EXECUTION_COLUMNS).where(
         WorkflowExecution.started_at >= cutoff_time
     )
 
@@ -148,31 +190,64 @@ async def get_recent_executions(
     statement = statement.limit(limit)
 
     result = await session.exec(statement)
-    executions = result.all()
+    executions = [_execution_dict(row) for row in result.all()]
+
+    return ORJSONResponse(
+        {
+            "period_hours": hours,
+            "total": len(executions),
+            "executions": executions,
+        }
+    )
 
-    return {
-        "period_hours": hours,
-        "total": len(executions),
-        "executions": [
-            {
-                "id": str(exec.id),
-                "workflow_id": str(exec.workflow_id),
-                "workflow_name": exec.workflow_name,
-                "status": exec.status,
-                "started_at": exec.started_at.isoformat(),
-                "completed_at": exec.completed_at.isoformat() if exec.completed_at else None,
-                "duration_seconds": exec.duration_seconds,
-                "error_message": exec.error_message,
-            }
-            for exec in executions
-        ],
-    }
+
+@router.get("/history/recent.ndjson")
+async def stream_recent_executions(
+    limit: int = Query(default=1000, le=10000),
+    hours: int = Query(default=24, le=168),  # Max 1 week
+    status: str | None = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Stream recent workflow executions as newline-delimited JSON.
+
+    Rows are written as they arrive from a server-side cursor, so large
+    audit windows are exported without building the full list in memory.
+    Cursors need a transaction, so this uses get_session rather than the
+    autocommit read-only session.
+
+    Args:
+        limit: Maximum number of results
+        hours: Look back this many hours
+        status: Filter by status
+    """
+    cutoff_time = _cutoff(hours)
+
+    statement = select(*_EXECUTION_COLUMNS).where(
+        WorkflowExecution.started_at >= cutoff_time
+    )
+
+    if status:
+        statement = statement.where(WorkflowExecution.status == status)
+
+    statement = statement.order_by(WorkflowExecution.started_at.desc())
+    statement = statement.limit(limit)
+
+    # Runs after the handler returns; the request's session is only closed
+    # once the response has been sent (FastAPI >= 0.118)
+    async def stream():
+        result = await session.stream(statement)
+        async for row in result:
+            body = orjson.dumps(_execution_dict(row), option=orjson.OPT_NAIVE_UTC)
+            yield body + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @router.get("/history/stats")
 async def get_execution_stats(
     hours: int = Query(default=24, le=168),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
 ):
     """
     Get execution statistics.
@@ -180,29 +255,33 @@ async def get_execution_stats(
     Args:
         hours: Look back this many hours
     """
-    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-    statement = select(WorkflowExecution).where(
-        WorkflowExecution.started_at >= cutoff_time
+    cutoff_time = _cutoff(hours)
+
+    # Aggregate per status in the database; at most one row per status comes back
+    statement = (
+        select(
+            WorkflowExecution.status,
+            func.count(),
+            func.avg(WorkflowExecution.duration_seconds),
+        )
+        .where(WorkflowExecution.started_at >= cutoff_time)
+        .group_by(WorkflowExecution.status)
     )
 
     result = await session.exec(statement)
-    executions = list(result.all())
-
-    # Calculate stats
-    total = len(executions)
-    completed = sum(1 for e in executions if e.status == "completed")
-    failed = sum(1 for e in executions if e.status == "failed")
-    running = sum(1 for e in executions if e.status == "running")
-    cancelled = sum(1 for e in executions if e.status == "cancelled")
-
-    # Calculate average duration for completed workflows
-    completed_execs = [e for e in executions if e.status == "completed" and e.duration_seconds]
-    avg_duration = (
-        sum(e.duration_seconds for e in completed_execs) / len(completed_execs)
-        if completed_execs
-        else 0
-    )
+
+    counts: dict[str, int] = {}
+    avg_duration = 0.0
+    for row_status, count, avg in result.all():
+        counts[row_status] = count
+        if row_status == "completed" and avg is not None:
+            avg_duration = float(avg)
+
+    total = sum(counts.values())
+    completed = counts.get("completed", 0)
+    failed = counts.get("failed", 0)
+    running = counts.get("running", 0)
+    cancelled = counts.get("cancelled", 0)
 
     success_rate = (completed / total * 100) if total > 0 else 0
 
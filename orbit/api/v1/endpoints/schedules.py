@@ -5,11 +5,13 @@ API endpoints for workflow scheduling.
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import select
+from sqlalchemy import bindparam, lambda_stmt
+from sqlmodel import delete, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
-from orbit.db.session import get_session
+from orbit.db.session import get_readonly_session, get_session
 from orbit.models.schedule import WorkflowSchedule
 from orbit.models.workflow import Workflow
 from orbit.schemas.schedule import ScheduleCreate, ScheduleRead, ScheduleUpdate
@@ -17,6 +19,23 @@ from orbit.schemas.schedule import ScheduleCreate, ScheduleRead, ScheduleUpdate
 logger = get_logger("api.schedules")
 router = APIRouter()
 
+# Hot read queries are built once; only the workflow_id parameter varies
+_workflow_schedule_check_stmt = lambda_stmt(
+    lambda: select(Workflow.id, WorkflowSchedule.id)
+    .select_from(Workflow)
+    .join(
+        WorkflowSchedule,
+        WorkflowSchedule.workflow_id == Workflow.id,
+        isouter=True,
+    )
+    .where(Workflow.id == bindparam("workflow_id"))
+)
+_get_schedule_stmt = lambda_stmt(
+    lambda: select(WorkflowSchedule).where(
+        WorkflowSchedule.workflow_id == bindparam("workflow_id")
+    )
+)
+
 
 @router.post("/{workflow_id}/schedule", response_model=ScheduleRead, status_code=201)
 async def create_schedule(
@@ -27,22 +46,16 @@ async def create_schedule(
     """
     Create a schedule for a workflow.
     """
-    # Verify workflow exists
-    workflow_statement = select(Workflow).where(Workflow.id == workflow_id)
-    workflow_result = await session.exec(workflow_statement)
-    workflow = workflow_result.first()
+    # Verify workflow exists and has no schedule yet in a single query
+    result = await session.exec(
+        _workflow_schedule_check_stmt, params={"workflow_id": workflow_id}
+    )
+    row = result.first()
 
-    if not workflow:
+    if row is None:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
-    # Check if schedule already exists
-    existing_statement = select(WorkflowSchedule).where(
-        WorkflowSchedule.workflow_id == workflow_id
-    )
-    existing_result = await session.exec(existing_statement)
-    existing = existing_result.first()
-
-    if existing:
+    if row[1] is not None:
         raise HTTPException(
             status_code=400, detail="Schedule already exists for this workflow"
         )
@@ -60,7 +73,6 @@ async def create_schedule(
 
     session.add(schedule)
     await session.commit()
-    await session.refresh(schedule)
 
     logger.info(
         f"Created schedule for workflow {workflow_id}: {schedule.cron_expression}"
@@ -72,16 +84,15 @@ async def create_schedule(
 @router.get("/{workflow_id}/schedule", response_model=ScheduleRead)
 async def get_schedule(
     workflow_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
 ):
     """
     Get the schedule for a workflow.
     """
-    statement = select(WorkflowSchedule).where(
-        WorkflowSchedule.workflow_id == workflow_id
+    result = await session.exec(
+        _get_schedule_stmt, params={"workflow_id": workflow_id}
     )
-    result = await session.exec(statement)
-    schedule = result.first()
+    schedule = result.scalars().first()
 
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
@@ -97,30 +108,29 @@ async def update_schedule(
 ):
     """
     Update a workflow schedule.
+
+    Applied as a single UPDATE ... RETURNING so the change is atomic and
+    needs no prior SELECT or refresh.
     """
-    statement = select(WorkflowSchedule).where(
-        WorkflowSchedule.workflow_id == workflow_id
+    values = schedule_update.model_dump(exclude_none=True)
+    if "cron_expression" in values:
+        # Recalculate next run
+        values["next_run"] = WorkflowSchedule.next_run_for(values["cron_expression"])
+    values["updated_at"] = utcnow()
+
+    statement = (
+        update(WorkflowSchedule)
+        .where(WorkflowSchedule.workflow_id == workflow_id)
+        .values(**values)
+        .returning(WorkflowSchedule)
     )
     result = await session.exec(statement)
-    schedule = result.first()
+    schedule = result.scalars().one_or_none()
 
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
-    # Update fields
-    if schedule_update.cron_expression is not None:
-        schedule.cron_expression = schedule_update.cron_expression
-        schedule.update_next_run()  # Recalculate next run
-
-    if schedule_update.timezone is not None:
-        schedule.timezone = schedule_update.timezone
-
-    if schedule_update.enabled is not None:
-        schedule.enabled = schedule_update.enabled
-
-    session.add(schedule)
     await session.commit()
-    await session.refresh(schedule)
 
     logger.info(f"Updated schedule for workflow {workflow_id}")
 
@@ -135,16 +145,16 @@ async def delete_schedule(
     """
     Delete a workflow schedule.
     """
-    statement = select(WorkflowSchedule).where(
-        WorkflowSchedule.workflow_id == workflow_id
+    statement = (
+        delete(WorkflowSchedule)
+        .where(WorkflowSchedule.workflow_id == workflow_id)
+        .returning(WorkflowSchedule.id)
     )
     result = await session.exec(statement)
-    schedule = result.first()
 
-    if not schedule:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
-    await session.delete(schedule)
     await session.commit()
 
     logger.info(f"Deleted schedule for workflow {workflow_id}")
@@ -2,14 +2,22 @@
 API endpoints for workflow templates.
 """
 
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel.ext.asyncio.session import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from orbit.core.cache import TTLCache
+from orbit.core.dependencies import (
+    get_readonly_template_service,
+    get_template_service,
+    get_workflow_service,
+)
+from orbit.core.http_cache import is_not_modified
 from orbit.core.logging import get_logger
-from orbit.db.session import get_session
-from orbit.repositories.workflow_repository import TaskRepository, WorkflowRepository
 from orbit.schemas.templates import (
     TemplateCreate,
     TemplateInstantiate,
@@ -17,18 +25,65 @@ from orbit.schemas.templates import (
 )
 from orbit.schemas.workflow import WorkflowRead
 from orbit.services.template_service import TemplateService
+from orbit.services.workflow_service import WorkflowService
 
 logger = get_logger("api.templates")
 router = APIRouter()
 
+# Rendered template reads as (etag, body); cleared on every template write.
+# ETags are content hashes, so they stay valid across workers. Clears are
+# per-process: other workers can serve a deleted or updated template for up
+# to TEMPLATE_CACHE_TTL seconds.
+TEMPLATE_CACHE_TTL = 60
+
+_template_cache = TTLCache(maxsize=1024, ttl=TEMPLATE_CACHE_TTL)
+
+
+def clear_template_cache() -> None:
+    """Drop all cached template responses."""
+    _template_cache.clear()
+
+
+async def _conditional_response(
+    request: Request,
+    cache_key: Hashable,
+    load: Callable[[], Awaitable[Any]],
+) -> Response | None:
+    """
+    Serve a cached JSON body with an ETag, or 304 if the client has it.
+
+    Args:
+        request: Incoming request
+        cache_key: Key for the rendered body
+        load: Coroutine function producing the payload (None if not found)
+
+    Returns:
+        Response, or None when load found nothing
+    """
+    entry = _template_cache.get(cache_key)
+    if entry is None:
+        payload = await load()
+        if payload is None:
+            return None
+        body = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        entry = (etag, body)
+        _template_cache.set(cache_key, entry)
+
+    etag, body = entry
+    headers = {"ETag": etag}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.post("/", response_model=TemplateRead, status_code=201)
 async def create_template(
     template_in: TemplateCreate,
-    session: AsyncSession = Depends(get_session),
+    service: TemplateService = Depends(get_template_service),
 ):
     """Create a new workflow template."""
-    service = TemplateService(session)
 
     # Check if template name already exists
     existing = await service.get_template_by_name(template_in.name)
@@ -43,55 +98,68 @@ async def create_template(
         category=template_in.category,
         tags=template_in.tags,
     )
+    clear_template_cache()
 
     return template
 
 
 @router.get("/", response_model=list[TemplateRead])
 async def list_templates(
+    request: Request,
     category: str | None = Query(default=None),
     tag: str | None = Query(default=None),
     active_only: bool = Query(default=True),
-    session: AsyncSession = Depends(get_session),
+    service: TemplateService = Depends(get_readonly_template_service),
 ):
     """List all workflow templates."""
-    service = TemplateService(session)
-    templates = await service.list_templates(
-        category=category,
-        tag=tag,
-        active_only=active_only,
+
+    async def load() -> list[dict[str, Any]]:
+        templates = await service.list_templates(
+            category=category,
+            tag=tag,
+            active_only=active_only,
+        )
+        return [TemplateRead.model_validate(t).model_dump() for t in templates]
+
+    return await _conditional_response(
+        request, ("list", category, tag, active_only), load
     )
-    return templates
 
 
 @router.get("/{template_id}", response_model=TemplateRead)
 async def get_template(
     template_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    service: TemplateService = Depends(get_readonly_template_service),
 ):
     """Get a specific template."""
-    service = TemplateService(session)
-    template = await service.get_template(template_id)
 
-    if not template:
+    async def load() -> dict[str, Any] | None:
+        template = await service.get_template(template_id)
+        if not template:
+            return None
+        return TemplateRead.model_validate(template).model_dump()
+
+    response = await _conditional_response(request, ("get", template_id), load)
+
+    if response is None:
         raise HTTPException(status_code=404, detail="Template not found")
 
-    return template
+    return response
 
 
 @router.post("/{template_id}/instantiate", response_model=WorkflowRead, status_code=201)
 async def instantiate_template(
     template_id: UUID,
     instantiate_in: TemplateInstantiate,
-    session: AsyncSession = Depends(get_session),
+    template_service: TemplateService = Depends(get_template_service),
+    workflow_service: WorkflowService = Depends(get_workflow_service),
 ):
     """
     Instantiate a template to create a workflow.
 
     This creates a new workflow from the template with the provided parameters.
     """
-    template_service = TemplateService(session)
-
     try:
         # Instantiate template
         workflow_create = await template_service.instantiate_template(
@@ -99,12 +167,10 @@ async def instantiate_template(
             parameters=instantiate_in.parameters,
             workflow_name=instantiate_in.workflow_name,
         )
+        # Usage tracking changed the template
+        clear_template_cache()
 
         # Create workflow using workflow service
-        workflow_repo = WorkflowRepository(session)
-        task_repo = TaskRepository(session)
-        from orbit.services.workflow_service import WorkflowService
-        workflow_service = WorkflowService(workflow_repo, task_repo)
         workflow = await workflow_service.create_workflow(workflow_create)
 
         return workflow
@@ -119,11 +185,11 @@ async def instantiate_template(
 @router.delete("/{template_id}", status_code=204)
 async def delete_template(
     template_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    service: TemplateService = Depends(get_template_service),
 ):
     """Delete a template."""
-    service = TemplateService(session)
     deleted = await service.delete_template(template_id)
+    clear_template_cache()
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Template not found")
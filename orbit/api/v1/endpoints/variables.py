@@ -7,9 +7,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.http_cache import CACHE_SHORT, cache_control
+from orbit.core.idempotency import IdempotentRequest, idempotent
 from orbit.core.logging import get_logger
 from orbit.db.session import get_session
+from orbit.models.variables import WorkflowSecret
 from orbit.schemas.variables import (
+    MASKED,
     SecretCreate,
     SecretRead,
     VariableCreate,
@@ -21,14 +25,29 @@ logger = get_logger("api.variables")
 router = APIRouter()
 
 
+def _mask(secret: WorkflowSecret) -> SecretRead:
+    """Render a stored secret with its value masked (rows are not revalidated)."""
+    return SecretRead.model_construct(
+        id=secret.id,
+        key=secret.key,
+        value_masked=MASKED,
+        description=secret.description,
+    )
+
+
 # Workflow Variables
 @router.post("/{workflow_id}/variables", response_model=VariableRead, status_code=201)
 async def create_workflow_variable(
     workflow_id: UUID,
     variable_in: VariableCreate,
     session: AsyncSession = Depends(get_session),
+    idempotency: IdempotentRequest = Depends(idempotent),
 ):
     """Create a workflow variable."""
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
     service = VariableService(session)
     variable = await service.create_workflow_variable(
         workflow_id=workflow_id,
@@ -36,10 +55,16 @@ async def create_workflow_variable(
         value=variable_in.value,
         description=variable_in.description,
     )
-    return variable
+    variable_read = VariableRead.model_validate(variable)
+    await idempotency.store(variable_read, status_code=201)
+    return variable_read
 
 
-@router.get("/{workflow_id}/variables", response_model=list[VariableRead])
+@router.get(
+    "/{workflow_id}/variables",
+    response_model=list[VariableRead],
+    dependencies=[Depends(cache_control(CACHE_SHORT))],
+)
 async def get_workflow_variables(
     workflow_id: UUID,
     session: AsyncSession = Depends(get_session),
@@ -70,8 +95,13 @@ async def create_workflow_secret(
     workflow_id: UUID,
     secret_in: SecretCreate,
     session: AsyncSession = Depends(get_session),
+    idempotency: IdempotentRequest = Depends(idempotent),
 ):
     """Create an encrypted workflow secret."""
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
     service = VariableService(session)
     secret = await service.create_workflow_secret(
         workflow_id=workflow_id,
@@ -79,12 +109,9 @@ async def create_workflow_secret(
         value=secret_in.value,
         description=secret_in.description,
     )
-    return SecretRead(
-        id=secret.id,
-        key=secret.key,
-        value_masked="***ENCRYPTED***",
-        description=secret.description,
-    )
+    secret_read = _mask(secret)
+    await idempotency.store(secret_read, status_code=201)
+    return secret_read
 
 
 @router.get("/{workflow_id}/secrets", response_model=list[SecretRead])
@@ -95,15 +122,7 @@ async def get_workflow_secrets(
     """Get all secrets for a workflow (values are masked)."""
     service = VariableService(session)
     secrets = await service.get_workflow_secrets(workflow_id)
-    return [
-        SecretRead(
-            id=secret.id,
-            key=secret.key,
-            value_masked="***ENCRYPTED***",
-            description=secret.description,
-        )
-        for secret in secrets
-    ]
+    return [_mask(secret) for secret in secrets]
 
 
 @router.delete("/{workflow_id}/secrets/{key}", status_code=204)
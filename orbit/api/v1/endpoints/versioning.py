@@ -4,9 +4,19 @@ API endpoints for workflow versioning.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.http_cache import (
+    CACHE_SHORT,
+    CACHE_VERSIONED,
+    cache_control,
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
+from orbit.core.idempotency import IdempotentRequest, idempotent
 from orbit.core.logging import get_logger
 from orbit.db.session import get_session
 from orbit.repositories.workflow_repository import WorkflowRepository
@@ -18,7 +28,12 @@ from orbit.schemas.versioning import (
     VersionRead,
     VersionRollback,
 )
-from orbit.services.versioning_service import VersioningService
+from orbit.services.versioning_service import (
+    VersioningService,
+    cache_active_version,
+    forget_active_version,
+    get_cached_active_version,
+)
 
 logger = get_logger("api.versioning")
 router = APIRouter()
@@ -29,12 +44,17 @@ async def create_version(
     workflow_id: UUID,
     version_in: VersionCreate,
     session: AsyncSession = Depends(get_session),
+    idempotency: IdempotentRequest = Depends(idempotent),
 ):
     """
     Create a new version of a workflow.
 
     This captures the current state of the workflow as a version.
     """
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
     # Get workflow
     workflow_repo = WorkflowRepository(session)
     workflow = await workflow_repo.get_by_id(workflow_id)
@@ -50,11 +70,18 @@ async def create_version(
         version_tag=version_in.version_tag,
         is_draft=version_in.is_draft,
     )
+    forget_active_version(workflow_id)
 
-    return version
+    version_read = VersionRead.model_validate(version)
+    await idempotency.store(version_read, status_code=201)
+    return version_read
 
 
-@router.get("/{workflow_id}/versions", response_model=list[VersionListItem])
+@router.get(
+    "/{workflow_id}/versions",
+    response_model=list[VersionListItem],
+    dependencies=[Depends(cache_control(CACHE_VERSIONED))],
+)
 async def list_versions(
     workflow_id: UUID,
     include_drafts: bool = Query(default=False),
@@ -72,34 +99,67 @@ async def list_versions(
     return versions
 
 
-@router.get("/{workflow_id}/versions/active", response_model=VersionRead)
+@router.get(
+    "/{workflow_id}/versions/active",
+    response_model=VersionRead,
+    dependencies=[Depends(cache_control(CACHE_SHORT))],
+)
 async def get_active_version(
     workflow_id: UUID,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get the currently active version of a workflow."""
+    """
+    Get the currently active version of a workflow.
+
+    Served from a per-process cache. Writes handled by another worker,
+    including deleting the workflow, are visible here only after the entry
+    expires (up to ACTIVE_VERSION_CACHE_TTL seconds).
+    """
+    cached = get_cached_active_version(workflow_id)
+    if cached is not None:
+        return cached
+
     versioning_service = VersioningService(session)
     version = await versioning_service.get_active_version(workflow_id)
 
     if not version:
         raise HTTPException(status_code=404, detail="No active version found")
 
-    return version
+    version_read = VersionRead.model_validate(version)
+    cache_active_version(workflow_id, version_read)
+    return version_read
 
 
-@router.get("/{workflow_id}/versions/{version_number}", response_model=VersionRead)
+@router.head("/{workflow_id}/versions/{version_number}", include_in_schema=False)
+@router.get(
+    "/{workflow_id}/versions/{version_number}",
+    response_model=VersionRead,
+    dependencies=[Depends(cache_control(CACHE_VERSIONED))],
+)
 async def get_version(
     workflow_id: UUID,
     version_number: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get a specific version of a workflow."""
+    """
+    Get a specific version of a workflow.
+
+    A version's content never changes; only is_active flips when a newer
+    version is activated, so the ETag is built from those two values.
+    """
     versioning_service = VersioningService(session)
     version = await versioning_service.get_version(workflow_id, version_number)
 
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
 
+    etag = weak_etag(version.id, version.is_active)
+    set_validators(response, etag)
+    if is_not_modified(request, etag):
+        return not_modified(response)
+
     return version
 
 
@@ -122,6 +182,7 @@ async def rollback_version(
             version_number=rollback_in.version_number,
             changed_by=rollback_in.changed_by,
         )
+        forget_active_version(workflow_id)
 
         return new_version
 
@@ -129,7 +190,11 @@ async def rollback_version(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{workflow_id}/changelog", response_model=list[ChangeLogRead])
+@router.get(
+    "/{workflow_id}/changelog",
+    response_model=list[ChangeLogRead],
+    dependencies=[Depends(cache_control(CACHE_VERSIONED))],
+)
 async def get_changelog(
     workflow_id: UUID,
     limit: int = Query(default=50, le=100),
@@ -142,7 +207,11 @@ async def get_changelog(
     return changelog
 
 
-@router.get("/{workflow_id}/compare", response_model=VersionCompare)
+@router.get(
+    "/{workflow_id}/compare",
+    response_model=VersionCompare,
+    dependencies=[Depends(cache_control(CACHE_VERSIONED))],
+)
 async def compare_versions(
     workflow_id: UUID,
     version_a: int = Query(..., description="First version to compare"),
@@ -14,11 +14,9 @@ async def websocket_endpoint(websocket: WebSocket):
     await ws_manager.connect(websocket)
     try:
         while True:
-            # Keep connection alive and listen for client messages
+            # Updates only flow server -> client; reading just detects the
+            # disconnect. Liveness is handled by protocol-level ping/pong
+            # frames (uvicorn --ws-ping-interval/--ws-ping-timeout, 20s default).
             await websocket.receive_text()
-            # Echo back for heartbeat
-            await ws_manager.send_personal_message(
-                {"type": "heartbeat", "message": "connected"}, websocket
-            )
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
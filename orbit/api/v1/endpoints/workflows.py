@@ -1,20 +1,38 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 
+from orbit.core.dependencies import get_workflow_control_service, get_workflow_service
 from orbit.core.exceptions import (
     DAGValidationError,
     OrbitException,
     WorkflowNotFoundError,
 )
+from orbit.core.http_cache import (
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
+from orbit.core.idempotency import IdempotentRequest, idempotent
 from orbit.core.logging import get_logger
-from orbit.db.session import get_session
-from orbit.repositories.workflow_repository import TaskRepository, WorkflowRepository
+from orbit.core.pagination import decode_cursor, encode_cursor
+from orbit.models.workflow import Workflow
 from orbit.schemas.workflow import WorkflowCreate, WorkflowRead
+from orbit.services.execution_queue import enqueue_workflow_execution
 from orbit.services.pause_resume import WorkflowControlService
-from orbit.services.task_runner import TaskRunner
 from orbit.services.websocket_manager import ws_manager
+from orbit.services.workflow_service import WorkflowService
 
 logger = get_logger("api.workflows")
 router = APIRouter()
@@ -23,19 +41,23 @@ router = APIRouter()
 @router.post("/", response_model=WorkflowRead, status_code=201)
 async def create_workflow(
     workflow_in: WorkflowCreate,
-    session: AsyncSession = Depends(get_session),
+    service: WorkflowService = Depends(get_workflow_service),
+    idempotency: IdempotentRequest = Depends(idempotent),
 ):
     """
     Create a new workflow with tasks.
-    Validates DAG structure before creation.
+    Validates DAG structure before creation. Retries carrying the same
+    Idempotency-Key get the original response instead of a duplicate.
     """
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
     try:
-        workflow_repo = WorkflowRepository(session)
-        task_repo = TaskRepository(session)
-        from orbit.services.workflow_service import WorkflowService
-        service = WorkflowService(workflow_repo, task_repo)
         workflow = await service.create_workflow(workflow_in)
-        return workflow
+        workflow_read = WorkflowRead.model_validate(workflow)
+        await idempotency.store(workflow_read, status_code=201)
+        return workflow_read
     except DAGValidationError as e:
         logger.warning(f"DAG validation failed: {e.message}")
         raise HTTPException(status_code=400, detail=e.message)
@@ -46,35 +68,97 @@ async def create_workflow(
 
 @router.get("/", response_model=list[WorkflowRead])
 async def read_workflows(
-    skip: int = 0,
-    limit: int = 100,
-    session: AsyncSession = Depends(get_session),
+    response: Response,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=200),
+    cursor: str | None = Query(default=None),
+    service: WorkflowService = Depends(get_workflow_service),
 ):
-    """List all workflows with pagination."""
+    """
+    List workflows, newest first.
+
+    Pass the X-Next-Cursor header of a full page back as cursor to fetch the
+    next one; skip is ignored when a cursor is given.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     try:
-        workflow_repo = WorkflowRepository(session)
-        task_repo = TaskRepository(session)
-        from orbit.services.workflow_service import WorkflowService
-        service = WorkflowService(workflow_repo, task_repo)
-        workflows = await service.list_workflows(skip=skip, limit=limit)
+        workflows = await service.list_workflows(skip=skip, limit=limit, after=after)
+        if len(workflows) == limit:
+            last = workflows[-1]
+            response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
         return workflows
     except OrbitException as e:
         logger.error(f"Failed to list workflows: {e.message}")
         raise HTTPException(status_code=500, detail=e.message)
 
 
+@router.get("/export.ndjson")
+async def export_workflows(
+    service: WorkflowService = Depends(get_workflow_service),
+):
+    """
+    Stream every workflow with its tasks as newline-delimited JSON.
+    Rows are serialized as they are fetched, so memory stays flat regardless
+    of how many workflows exist.
+    """
+
+    # Runs after the handler returns; the request's session is only closed
+    # once the response has been sent (FastAPI >= 0.118)
+    async def stream():
+        async for workflow in service.stream_workflows():
+            line = WorkflowRead.model_validate(workflow).model_dump_json()
+            yield line.encode() + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _workflow_validators(workflow: Workflow) -> tuple[str, datetime]:
+    """ETag and Last-Modified for a workflow and its tasks."""
+    task_state = tuple(
+        (task.id, task.updated_at, task.status, task.retry_count)
+        for task in workflow.tasks
+    )
+    etag = weak_etag(
+        workflow.id,
+        workflow.updated_at,
+        workflow.status,
+        workflow.name,
+        workflow.description,
+        task_state,
+    )
+    last_modified = max(
+        [workflow.updated_at, *(task.updated_at for task in workflow.tasks)]
+    )
+    return etag, last_modified
+
+
+@router.head("/{workflow_id}", include_in_schema=False)
 @router.get("/{workflow_id}", response_model=WorkflowRead)
 async def get_workflow(
     workflow_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    response: Response,
+    service: WorkflowService = Depends(get_workflow_service),
 ):
-    """Get a specific workflow by ID."""
+    """
+    Get a specific workflow by ID.
+    Answers 304 when the client's ETag is still current.
+    """
     try:
-        workflow_repo = WorkflowRepository(session)
-        task_repo = TaskRepository(session)
-        from orbit.services.workflow_service import WorkflowService
-        service = WorkflowService(workflow_repo, task_repo)
         workflow = await service.get_workflow(workflow_id)
+        etag, last_modified = _workflow_validators(workflow)
+        set_validators(response, etag, last_modified)
+        # Only the ETag is honoured: runs change status several times a second,
+        # below If-Modified-Since's one-second resolution
+        if is_not_modified(request, etag):
+            return not_modified(response)
+
         return workflow
     except WorkflowNotFoundError as e:
         logger.warning(f"Workflow not found: {workflow_id}")
@@ -88,21 +172,16 @@ async def get_workflow(
 async def execute_workflow(
     workflow_id: UUID,
     background_tasks: BackgroundTasks,
-    session: AsyncSession = Depends(get_session),
+    service: WorkflowService = Depends(get_workflow_service),
 ):
-    """Execute a workflow in the background."""
+    """Queue a workflow for execution."""
     try:
-        workflow_repo = WorkflowRepository(session)
-        task_repo = TaskRepository(session)
-        from orbit.services.workflow_service import WorkflowService
-        service = WorkflowService(workflow_repo, task_repo)
-        workflow = await service.get_workflow(workflow_id)
+        workflow_status = await service.get_workflow_status(workflow_id)
 
-        if workflow.status == "running":
+        if workflow_status == "running":
             raise HTTPException(status_code=400, detail="Workflow is already running")
 
-        # Execute workflow in background
-        background_tasks.add_task(execute_workflow_task, workflow_id)
+        await enqueue_workflow_execution(workflow_id, background_tasks)
 
         logger.info(f"Queued workflow {workflow_id} for execution")
 
@@ -118,42 +197,25 @@ async def execute_workflow(
         raise HTTPException(status_code=500, detail=e.message)
 
 
-async def execute_workflow_task(workflow_id: UUID):
-    """Background task to execute workflow."""
-    from sqlalchemy.orm import sessionmaker
-    from sqlmodel.ext.asyncio.session import AsyncSession
-
-    from orbit.db.session import engine
-
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        runner = TaskRunner(session, ws_manager)
-        try:
-            await runner.execute_workflow(workflow_id)
-        except Exception as e:
-            logger.error(f"Workflow execution failed: {e}")
-
-
 @router.post("/{workflow_id}/pause")
 async def pause_workflow(
     workflow_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    control_service: WorkflowControlService = Depends(get_workflow_control_service),
 ):
     """
     Pause a running or pending workflow.
     Paused workflows can be resumed later.
     """
     try:
-        control_service = WorkflowControlService(session)
         workflow = await control_service.pause_workflow(workflow_id)
+        paused_at = workflow.paused_at.isoformat() if workflow.paused_at else None
 
         # Broadcast pause event
-        await ws_manager.broadcast(
+        ws_manager.broadcast_nowait(
             {
                 "workflow_id": str(workflow_id),
                 "status": "paused",
-                "paused_at": workflow.paused_at.isoformat() if workflow.paused_at else None,
+                "paused_at": paused_at,
             }
         )
 
@@ -175,23 +237,22 @@ async def pause_workflow(
 async def resume_workflow(
     workflow_id: UUID,
     background_tasks: BackgroundTasks,
-    session: AsyncSession = Depends(get_session),
+    control_service: WorkflowControlService = Depends(get_workflow_control_service),
 ):
     """
     Resume a paused workflow.
     The workflow will continue execution from where it was paused.
     """
     try:
-        control_service = WorkflowControlService(session)
         await control_service.resume_workflow(workflow_id)
 
         # Broadcast resume event
-        await ws_manager.broadcast(
+        ws_manager.broadcast_nowait(
             {"workflow_id": str(workflow_id), "status": "resumed"}
         )
 
         # Re-queue workflow for execution
-        background_tasks.add_task(execute_workflow_task, workflow_id)
+        await enqueue_workflow_execution(workflow_id, background_tasks)
 
         return {
             "workflow_id": str(workflow_id),
@@ -210,18 +271,17 @@ async def resume_workflow(
 @router.post("/{workflow_id}/cancel")
 async def cancel_workflow(
     workflow_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    control_service: WorkflowControlService = Depends(get_workflow_control_service),
 ):
     """
     Cancel a workflow permanently.
     Cancelled workflows cannot be resumed.
     """
     try:
-        control_service = WorkflowControlService(session)
         await control_service.cancel_workflow(workflow_id)
 
         # Broadcast cancel event
-        await ws_manager.broadcast(
+        ws_manager.broadcast_nowait(
             {"workflow_id": str(workflow_id), "status": "cancelled"}
         )
 
@@ -242,13 +302,12 @@ async def cancel_workflow(
 @router.get("/{workflow_id}/status")
 async def get_workflow_status(
     workflow_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    control_service: WorkflowControlService = Depends(get_workflow_control_service),
 ):
     """
     Get detailed status of a workflow including pause/resume capabilities.
     """
     try:
-        control_service = WorkflowControlService(session)
         status = await control_service.get_workflow_status(workflow_id)
         return status
     except WorkflowNotFoundError as e:
@@ -2,24 +2,64 @@
 JWT authentication and authorization utilities.
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from datetime import timedelta
 
-from jose import JWTError, jwt
+import jwt
+import orjson
 from passlib.context import CryptContext
+from passlib.hash import argon2 as argon2_hash
 
+from orbit.core.cache import TTLCache
 from orbit.core.config import settings
 from orbit.core.logging import get_logger
+from orbit.schemas.auth import CurrentUser
 
 logger = get_logger("core.auth")
 
-# Password hashing - using argon2 (modern, secure, no length limits)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Password hashing - using argon2 (modern, secure, no length limits).
+# Parameters follow the OWASP baseline for argon2id (19 MiB, t=2, p=1), which
+# is several times cheaper per login than passlib's defaults (64 MiB, p=4).
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19 * 1024  # KiB
+ARGON2_PARALLELISM = 1
+
+# Require the C argon2-cffi backend; never fall back to pure Python
+argon2_hash.set_backend("argon2_cffi")
+
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=ARGON2_PARALLELISM,
+)
 
 # JWT settings
 ALGORITHM = "HS256"
+# HMAC key, encoded once rather than on every sign/verify
+_SIGNING_KEY = settings.SECRET_KEY.encode()
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+ACCESS_TOKEN_TTL_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_TTL_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# Executor for CPU-bound password hashing; None uses the loop's default executor
+_crypto_executor: Executor | None = None
+
+# Authenticated user snapshots keyed by sha256(token); hits skip JWT decode and
+# the user lookup. Entries are bounded by this TTL, so a deactivated user keeps
+# access for at most USER_CACHE_TTL seconds.
+USER_CACHE_TTL = 30
+_user_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -32,6 +72,50 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def set_crypto_executor(executor: Executor | None) -> None:
+    """Set the executor used by the async password hashing helpers."""
+    global _crypto_executor
+    _crypto_executor = executor
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _crypto_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_crypto_executor, get_password_hash, password)
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding used by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Every token shares the same header, so its encoded form is built once
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+
+def _sign_token(claims: dict) -> str:
+    """
+    Encode and sign claims as a compact HS256 JWT.
+
+    Args:
+        claims: JSON-serializable claims (exp/iat as integer timestamps)
+
+    Returns:
+        Encoded JWT token
+    """
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(claims))
+    signature = hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
+
 def create_access_token(
     data: dict,
     expires_delta: timedelta | None = None,
@@ -46,24 +130,12 @@ def create_access_token(
     Returns:
         Encoded JWT token
     """
-    from datetime import timezone
-
-    to_encode = data.copy()
-
+    now = int(time.time())
+    ttl = ACCESS_TOKEN_TTL_SECONDS
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({"exp": expire, "type": "access"})
+        ttl = int(expires_delta.total_seconds())
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=ALGORITHM,
-    )
-
-    return encoded_jwt
+    return _sign_token({**data, "exp": now + ttl, "iat": now, "type": "access"})
 
 
 def create_refresh_token(
@@ -80,24 +152,36 @@ def create_refresh_token(
     Returns:
         Encoded JWT token
     """
-    from datetime import timezone
+    now = int(time.time())
+    ttl = REFRESH_TOKEN_TTL_SECONDS
+    if expires_delta:
+        ttl = int(expires_delta.total_seconds())
 
-    to_encode = data.copy()
+    return _sign_token({**data, "exp": now + ttl, "iat": now, "type": "refresh"})
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
 
-    to_encode.update({"exp": expire, "type": "refresh"})
+def _token_digest(token: str) -> bytes:
+    """Cache key for a token."""
+    return hashlib.sha256(token.encode()).digest()
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=ALGORITHM,
-    )
 
-    return encoded_jwt
+def get_cached_user(token: str) -> CurrentUser | None:
+    """Return the cached user snapshot for a token, if any."""
+    return _user_cache.get(_token_digest(token))
+
+
+def cache_user(token: str, user: CurrentUser, expires_at: float) -> None:
+    """
+    Cache an authenticated user snapshot for a token.
+
+    Args:
+        token: JWT access token the user authenticated with
+        user: Immutable user snapshot
+        expires_at: Token exp claim; entries never outlive it
+    """
+    ttl = min(expires_at - time.time(), USER_CACHE_TTL)
+    if ttl > 0:
+        _user_cache.set(_token_digest(token), user, ttl=ttl)
 
 
 def decode_token(token: str) -> dict | None:
@@ -113,11 +197,11 @@ def decode_token(token: str) -> dict | None:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _SIGNING_KEY,
             algorithms=[ALGORITHM],
         )
         return payload
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         logger.warning(f"JWT decode error: {e}")
         return None
 
@@ -129,8 +213,6 @@ def generate_api_key() -> tuple[str, str]:
     Returns:
         Tuple of (full_key, key_hash)
     """
-    import hashlib
-
     # Generate random key (32 bytes = 64 hex chars)
     key = secrets.token_urlsafe(32)
 
@@ -140,18 +222,31 @@ def generate_api_key() -> tuple[str, str]:
     return key, key_hash
 
 
-def verify_api_key(plain_key: str, key_hash: str) -> bool:
-    """Verify an API key against its hash."""
-    import hashlib
+def verify_api_key(plain_key: str, key_hash: str | bytes) -> bool:
+    """
+    Verify an API key against its hash.
+
+    Args:
+        plain_key: API key presented by the client
+        key_hash: Stored SHA256 hash, hex-encoded or as the raw 32-byte digest
 
-    # Use SHA256 for API keys
-    computed_hash = hashlib.sha256(plain_key.encode()).hexdigest()
+    Returns:
+        True if the key matches
+    """
+    if isinstance(key_hash, str):
+        try:
+            key_hash = bytes.fromhex(key_hash)
+        except ValueError:
+            return False
+
+    # Compare raw digests rather than their hex encodings
+    computed_hash = hashlib.sha256(plain_key.encode()).digest()
     return secrets.compare_digest(computed_hash, key_hash)
 
 
 def check_permissions(
-    user_roles: list[str],
-    required_roles: list[str],
+    user_roles: Iterable[str],
+    required_roles: Iterable[str],
 ) -> bool:
     """
     Check if user has required roles.
@@ -163,15 +258,16 @@ def check_permissions(
     Returns:
         True if user has at least one required role
     """
-    if "admin" in user_roles:
+    roles = user_roles if isinstance(user_roles, frozenset) else frozenset(user_roles)
+    if "admin" in roles:
         return True
 
-    return any(role in user_roles for role in required_roles)
+    return not roles.isdisjoint(required_roles)
 
 
 def check_scopes(
-    user_scopes: list[str],
-    required_scopes: list[str],
+    user_scopes: Iterable[str],
+    required_scopes: Iterable[str],
 ) -> bool:
     """
     Check if user has required scopes.
@@ -183,7 +279,10 @@ def check_scopes(
     Returns:
         True if user has all required scopes
     """
-    if "*" in user_scopes:
+    scopes = (
+        user_scopes if isinstance(user_scopes, frozenset) else frozenset(user_scopes)
+    )
+    if "*" in scopes:
         return True
 
-    return all(scope in user_scopes for scope in required_scopes)
+    return scopes.issuperset(required_scopes)
@@ -0,0 +1,47 @@
+"""
+Clock helpers.
+Timestamps are stored as naive UTC datetimes throughout the schema.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+_frozen_now: ContextVar[datetime | None] = ContextVar("frozen_now", default=None)
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+
+    Replaces the deprecated ``datetime.utcnow``. Inside ``frozen_utcnow()``
+    the time captured on entry is returned instead of reading the clock.
+
+    Returns:
+        Naive UTC datetime
+    """
+    now = _frozen_now.get()
+    if now is not None:
+        return now
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@contextmanager
+def frozen_utcnow() -> Iterator[datetime]:
+    """
+    Share one timestamp across everything created in the block.
+
+    Meant for building a batch of rows, so they get identical created_at /
+    updated_at values from a single clock read. Do not wrap code whose
+    durations are measured with utcnow().
+
+    Yields:
+        The frozen timestamp
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    token = _frozen_now.set(now)
+    try:
+        yield now
+    finally:
+        _frozen_now.reset(token)
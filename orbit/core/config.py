@@ -8,6 +8,23 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./orbit.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # Prepared statements asyncpg keeps per pooled connection
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    # Set when running behind PgBouncer (transaction mode) so it owns pooling
+    DB_USE_NULL_POOL: bool = False
+    # Log every SQL statement; for local debugging only
+    DB_ECHO: bool = False
+    # Create missing tables at startup; disable when schema is managed by migrations
+    AUTO_CREATE_TABLES: bool = True
+
+    # Task queue: when set, workflow runs go to the arq worker via Redis
+    REDIS_URL: str | None = None
+    # Port for the arq worker's Prometheus endpoint; None disables it
+    WORKER_METRICS_PORT: int | None = None
 
     # Security
     SECRET_KEY: str = "CHANGE_THIS_TO_A_SECURE_SECRET_KEY"
@@ -1,38 +1,75 @@
 """
 Dependency injection container.
 Provides centralized dependency management.
+
+Providers are FastAPI dependencies: they share the request's session via
+``Depends(get_session)``, which FastAPI resolves once per request.
 """
 
+from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.db.session import get_readonly_session, get_session
 from orbit.repositories.user_repository import UserRepository
 from orbit.repositories.workflow_repository import TaskRepository, WorkflowRepository
 from orbit.services.auth_service import AuthService
+from orbit.services.pause_resume import WorkflowControlService
+from orbit.services.template_service import TemplateService
 from orbit.services.workflow_service import WorkflowService
 
 
-def get_workflow_repository(session: AsyncSession) -> WorkflowRepository:
+async def get_workflow_repository(
+    session: AsyncSession = Depends(get_session),
+) -> WorkflowRepository:
     """Get workflow repository instance."""
     return WorkflowRepository(session)
 
 
-def get_task_repository(session: AsyncSession) -> TaskRepository:
+async def get_task_repository(
+    session: AsyncSession = Depends(get_session),
+) -> TaskRepository:
     """Get task repository instance."""
     return TaskRepository(session)
 
 
-def get_workflow_service(
-    workflow_repo: WorkflowRepository, task_repo: TaskRepository
+async def get_workflow_service(
+    workflow_repo: WorkflowRepository = Depends(get_workflow_repository),
+    task_repo: TaskRepository = Depends(get_task_repository),
 ) -> WorkflowService:
     """Get workflow service instance."""
     return WorkflowService(workflow_repo, task_repo)
 
 
-def get_user_repository(session: AsyncSession) -> UserRepository:
+async def get_workflow_control_service(
+    session: AsyncSession = Depends(get_session),
+) -> WorkflowControlService:
+    """Get workflow control (pause/resume/cancel) service instance."""
+    return WorkflowControlService(session)
+
+
+async def get_user_repository(
+    session: AsyncSession = Depends(get_session),
+) -> UserRepository:
     """Get user repository instance."""
     return UserRepository(session)
 
 
-def get_auth_service(user_repo: UserRepository) -> AuthService:
+async def get_auth_service(
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> AuthService:
     """Get auth service instance."""
     return AuthService(user_repo)
+
+
+async def get_template_service(
+    session: AsyncSession = Depends(get_session),
+) -> TemplateService:
+    """Get template service instance."""
+    return TemplateService(session)
+
+
+async def get_readonly_template_service(
+    session: AsyncSession = Depends(get_readonly_session),
+) -> TemplateService:
+    """Get template service instance for read-only endpoints."""
+    return TemplateService(session)
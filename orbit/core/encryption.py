@@ -3,6 +3,7 @@ Encryption utilities for secrets management.
 Uses Fernet symmetric encryption for secure secret storage.
 """
 
+import asyncio
 import os
 
 from cryptography.fernet import Fernet
@@ -11,6 +12,10 @@ from orbit.core.logging import get_logger
 
 logger = get_logger("core.encryption")
 
+# Values at least this long (in characters) are encrypted/decrypted on a worker
+# thread; shorter ones take microseconds, less than the thread hand-off
+OFFLOAD_THRESHOLD = 4096
+
 
 class EncryptionService:
     """
@@ -52,12 +57,7 @@ class EncryptionService:
         Returns:
             Encrypted string (base64-encoded)
         """
-        try:
-            encrypted = self.fernet.encrypt(plaintext.encode())
-            return encrypted.decode()
-        except Exception as e:
-            logger.error(f"Encryption failed: {e}")
-            raise
+        return self.encrypt_bytes(plaintext.encode()).decode()
 
     def decrypt(self, ciphertext: str) -> str:
         """
@@ -69,13 +69,52 @@ class EncryptionService:
         Returns:
             Decrypted plaintext string
         """
+        return self.decrypt_bytes(ciphertext.encode()).decode()
+
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """
+        Encrypt raw bytes.
+
+        Args:
+            plaintext: Bytes to encrypt
+
+        Returns:
+            Fernet token (base64-encoded bytes)
+        """
         try:
-            decrypted = self.fernet.decrypt(ciphertext.encode())
-            return decrypted.decode()
+            return self.fernet.encrypt(plaintext)
+        except Exception as e:
+            logger.error(f"Encryption failed: {e}")
+            raise
+
+    def decrypt_bytes(self, ciphertext: bytes) -> bytes:
+        """
+        Decrypt a Fernet token to raw bytes.
+
+        Args:
+            ciphertext: Fernet token (base64-encoded bytes)
+
+        Returns:
+            Decrypted bytes
+        """
+        try:
+            return self.fernet.decrypt(ciphertext)
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             raise
 
+    async def encrypt_async(self, plaintext: str) -> str:
+        """Encrypt without blocking the event loop on large values."""
+        if len(plaintext) < OFFLOAD_THRESHOLD:
+            return self.encrypt(plaintext)
+        return await asyncio.to_thread(self.encrypt, plaintext)
+
+    async def decrypt_async(self, ciphertext: str) -> str:
+        """Decrypt without blocking the event loop on large values."""
+        if len(ciphertext) < OFFLOAD_THRESHOLD:
+            return self.decrypt(ciphertext)
+        return await asyncio.to_thread(self.decrypt, ciphertext)
+
     @staticmethod
     def generate_key() -> str:
         """
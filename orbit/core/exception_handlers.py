@@ -5,25 +5,25 @@ Provides consistent error responses across the API.
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from orbit.core.exceptions import OrbitException
 from orbit.core.logging import get_logger
+from orbit.core.responses import ORJSONResponse
 
 logger = get_logger("exception_handler")
 
 
 async def orbit_exception_handler(
     request: Request, exc: OrbitException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle custom Orbit exceptions."""
     logger.error(
         f"Orbit exception: {exc.message}",
         extra={"details": exc.details, "path": request.url.path},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": exc.__class__.__name__,
@@ -35,13 +35,13 @@ async def orbit_exception_handler(
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle request validation errors."""
     logger.warning(
         f"Validation error: {exc.errors()}", extra={"path": request.url.path}
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
@@ -53,9 +53,9 @@ async def validation_exception_handler(
 
 async def http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": "HTTPException", "message": exc.detail},
     )
@@ -0,0 +1,53 @@
+"""
+Liveness probe middleware.
+Answers health checks before they reach routing or other middleware.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HEALTH_PATH = "/health"
+
+HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_BODY)).encode()),
+)
+
+
+class HealthCheckMiddleware:
+    """
+    Serve GET /health with a fixed response.
+
+    Registered as the outermost middleware so load balancer and orchestrator
+    probes skip rate limiting, CORS and route matching entirely. Everything
+    else is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = HEALTH_PATH):
+        """
+        Initialize health check middleware.
+
+        Args:
+            app: ASGI application to wrap
+            path: Path answered by the probe
+        """
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == self.path
+            and scope["method"] == "GET"
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": list(_HEALTH_HEADERS),
+                }
+            )
+            await send({"type": "http.response.body", "body": HEALTH_BODY})
+            return
+
+        await self.app(scope, receive, send)
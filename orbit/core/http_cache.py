@@ -0,0 +1,132 @@
+"""
+HTTP caching utilities.
+Route dependencies that set Cache-Control on successful read responses, and
+helpers for ETag/Last-Modified conditional requests.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+# Read views that change only when a new version or change log entry is written
+CACHE_VERSIONED = "private, max-age=30, stale-while-revalidate=300"
+
+# Views users expect to see their own edits in almost immediately
+CACHE_SHORT = "private, max-age=5"
+
+# Headers a 304 repeats from the full response it stands in for
+_NOT_MODIFIED_HEADERS = ("cache-control", "etag", "last-modified", "vary")
+
+
+def cache_control(directives: str) -> Callable[[Response], Awaitable[None]]:
+    """
+    Build a dependency that sets caching headers on the response.
+
+    Headers are only applied to responses the handler returns normally;
+    errors raised as HTTPException are not cached.
+
+    Args:
+        directives: Cache-Control header value
+
+    Returns:
+        Dependency for use in a route's ``dependencies`` list
+    """
+
+    async def set_cache_headers(response: Response) -> None:
+        response.headers["Cache-Control"] = directives
+        response.headers["Vary"] = "Origin, Authorization"
+
+    return set_cache_headers
+
+
+def weak_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from the values that identify a representation.
+
+    Args:
+        parts: Values that change whenever the response body would
+
+    Returns:
+        Quoted weak ETag
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and drop sub-second precision."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Check a request's validators against the current representation.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when the client sent no ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+        last_modified: Current modification time (naive values are UTC)
+
+    Returns:
+        True if the client's copy is current and a 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in (tag.strip() for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return _as_utc(last_modified) <= since
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: datetime | None = None
+) -> None:
+    """
+    Set ETag and, when known, Last-Modified on a response.
+
+    Args:
+        response: Response to update
+        etag: Current ETag
+        last_modified: Current modification time (naive values are UTC)
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+
+
+def not_modified(response: Response) -> Response:
+    """
+    Build a 304 response.
+
+    Args:
+        response: Response whose validator and caching headers are repeated
+
+    Returns:
+        Empty 304 response
+    """
+    headers = {
+        name: response.headers[name]
+        for name in _NOT_MODIFIED_HEADERS
+        if name in response.headers
+    }
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,281 @@
+"""
+Idempotency-Key support for create endpoints.
+Replays the original response when a client retries a request with the same key.
+"""
+
+import hashlib
+import secrets
+from collections.abc import AsyncIterator
+from typing import Any, NamedTuple
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+
+from orbit.core.auth import decode_token
+from orbit.core.cache import TTLCache
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# How long a completed request can be replayed, in seconds
+IDEMPOTENCY_TTL = 24 * 60 * 60
+
+# How long a key stays reserved while its first request runs, in seconds.
+# Bounds how long a worker that died mid-request can block retries.
+IDEMPOTENCY_IN_FLIGHT_TTL = 5 * 60
+
+
+class StoredResponse(NamedTuple):
+    """Completed response kept for replay."""
+
+    fingerprint: bytes
+    status_code: int
+    body: bytes
+
+
+class InFlight(NamedTuple):
+    """Reservation held while the first request with a key is running."""
+
+    token: str
+
+
+class LocalIdempotencyStore:
+    """
+    Per-process idempotency store.
+
+    Only deduplicates retries that reach the same worker; used when no
+    Redis is configured.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self._entries = TTLCache(maxsize=maxsize, ttl=IDEMPOTENCY_TTL)
+
+    async def reserve(self, key: str, token: str) -> StoredResponse | InFlight | None:
+        """Reserve a key, or return the entry already holding it."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        self._entries.set(key, InFlight(token), ttl=IDEMPOTENCY_IN_FLIGHT_TTL)
+        return None
+
+    async def save(self, key: str, response: StoredResponse) -> None:
+        """Replace a reservation with the completed response."""
+        self._entries.set(key, response)
+
+    async def release(self, key: str, token: str) -> None:
+        """Drop a reservation, unless another request has taken the key since."""
+        if self._entries.get(key) == InFlight(token):
+            self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Drop all reservations and stored responses."""
+        self._entries.clear()
+
+
+# Deletes a reservation only if it is still the caller's
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_IN_FLIGHT_PREFIX = b"in-flight:"
+
+
+class RedisIdempotencyStore:
+    """
+    Idempotency store shared by every worker through Redis.
+
+    Keys are reserved with SET NX EX, so a retry is deduplicated whichever
+    worker it lands on.
+    """
+
+    def __init__(self, redis: Any, prefix: str = "orbit:idempotency:"):
+        """
+        Initialize the store.
+
+        Args:
+            redis: redis.asyncio client (e.g. the arq pool)
+            prefix: Namespace for the Redis keys
+        """
+        self.redis = redis
+        self.prefix = prefix
+
+    async def reserve(self, key: str, token: str) -> StoredResponse | InFlight | None:
+        """Reserve a key, or return the entry already holding it."""
+        name = self.prefix + key
+        marker = _IN_FLIGHT_PREFIX + token.encode()
+        while True:
+            if await self.redis.set(
+                name, marker, nx=True, ex=IDEMPOTENCY_IN_FLIGHT_TTL
+            ):
+                return None
+            value = await self.redis.get(name)
+            if value is not None:
+                return self._decode(value)
+            # The holder expired between SET and GET; try to reserve again
+
+    async def save(self, key: str, response: StoredResponse) -> None:
+        """Replace a reservation with the completed response."""
+        value = orjson.dumps(
+            {
+                "fingerprint": response.fingerprint.hex(),
+                "status_code": response.status_code,
+                "body": response.body.decode(),
+            }
+        )
+        await self.redis.set(self.prefix + key, value, ex=IDEMPOTENCY_TTL)
+
+    async def release(self, key: str, token: str) -> None:
+        """Drop a reservation, unless another request has taken the key since."""
+        marker = _IN_FLIGHT_PREFIX + token.encode()
+        await self.redis.eval(_RELEASE_SCRIPT, 1, self.prefix + key, marker)
+
+    @staticmethod
+    def _decode(value: bytes | str) -> StoredResponse | InFlight:
+        if isinstance(value, str):
+            value = value.encode()
+        if value.startswith(_IN_FLIGHT_PREFIX):
+            return InFlight(value[len(_IN_FLIGHT_PREFIX) :].decode())
+        data = orjson.loads(value)
+        return StoredResponse(
+            bytes.fromhex(data["fingerprint"]),
+            data["status_code"],
+            data["body"].encode(),
+        )
+
+
+_local_store = LocalIdempotencyStore()
+_store: LocalIdempotencyStore | RedisIdempotencyStore = _local_store
+
+
+def set_idempotency_store(store: RedisIdempotencyStore | None) -> None:
+    """Set the shared store; None falls back to the per-process one."""
+    global _store
+    _store = store if store is not None else _local_store
+
+
+def clear_idempotency_cache() -> None:
+    """Drop all reservations and stored responses held in this process."""
+    _local_store.clear()
+
+
+class IdempotentRequest:
+    """
+    Idempotency state for one request.
+
+    Handlers call replay() before doing any work and store() with the
+    response they are about to return. replay() reserves the key, so a
+    duplicate arriving while the first request is still running gets a 409
+    rather than running the handler again. The reservation is released if
+    the request ends without storing a response (e.g. the handler failed).
+    Without an Idempotency-Key header all of these are no-ops.
+    """
+
+    def __init__(self, cache_key: str | None, fingerprint: bytes):
+        self.cache_key = cache_key
+        self.fingerprint = fingerprint
+        self._token: str | None = None
+
+    async def replay(self) -> Response | None:
+        """
+        Return the stored response for this key, or reserve the key.
+
+        Raises:
+            HTTPException: If the key is still in use by a running request,
+                or was used with a different request body
+        """
+        if self.cache_key is None:
+            return None
+
+        token = secrets.token_hex(16)
+        entry = await _store.reserve(self.cache_key, token)
+        if entry is None:
+            self._token = token
+            return None
+
+        if isinstance(entry, InFlight):
+            raise HTTPException(
+                status_code=409,
+                detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress",
+            )
+
+        if entry.fingerprint != self.fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+            )
+
+        return Response(
+            content=entry.body,
+            status_code=entry.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    async def store(self, result: BaseModel, status_code: int) -> None:
+        """
+        Remember the response for later retries.
+
+        Args:
+            result: Response model the handler returns
+            status_code: Status code the handler responds with
+        """
+        if self._token is None:
+            return
+
+        body = result.model_dump_json().encode()
+        await _store.save(
+            self.cache_key, StoredResponse(self.fingerprint, status_code, body)
+        )
+        self._token = None
+
+    async def release(self) -> None:
+        """Give up the reservation if no response was stored."""
+        if self._token is None:
+            return
+
+        await _store.release(self.cache_key, self._token)
+        self._token = None
+
+
+def _caller(request: Request) -> str:
+    """
+    Identify who an Idempotency-Key belongs to.
+
+    Requests with a valid bearer token are scoped to its user; anything else
+    to the client address.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if token and scheme.lower() == "bearer":
+        payload = decode_token(token)
+        if payload is not None and payload.get("user_id"):
+            return f"user:{payload['user_id']}"
+
+    client = request.client
+    return f"client:{client.host if client else 'unknown'}"
+
+
+async def idempotent(request: Request) -> AsyncIterator[IdempotentRequest]:
+    """
+    Dependency exposing the request's Idempotency-Key state.
+
+    Keys are scoped to the caller, method and path, so one client can never
+    replay another's response and the same key can be reused against
+    different resources.
+    """
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key:
+        yield IdempotentRequest(None, b"")
+        return
+
+    fingerprint = hashlib.sha256(await request.body()).digest()
+    scope = "\0".join((_caller(request), request.method, request.url.path, key))
+    idempotency = IdempotentRequest(
+        hashlib.sha256(scope.encode()).hexdigest(), fingerprint
+    )
+    try:
+        yield idempotency
+    finally:
+        await idempotency.release()
@@ -0,0 +1,29 @@
+"""
+Identifier helpers.
+Generates time-ordered UUIDs for high-insert tables.
+"""
+
+import os
+import time
+from uuid import UUID
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> UUID:
+    """
+    Generate a UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds and the rest is
+    random, so new keys sort after existing ones and land on the rightmost
+    pages of a B-tree index instead of a random page.
+
+    Returns:
+        Time-ordered UUID
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~_VERSION_MASK | 0x7 << 76
+    value = value & ~_VARIANT_MASK | 0x2 << 62
+    return UUID(int=value)
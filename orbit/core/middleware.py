@@ -2,16 +2,23 @@
 Authentication and authorization middleware.
 """
 
+from uuid import UUID
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from orbit.core.auth import decode_token
+from orbit.core.auth import (
+    cache_user,
+    check_permissions,
+    decode_token,
+    get_cached_user,
+)
 from orbit.core.exceptions import UserNotFoundError
 from orbit.core.logging import get_logger
 from orbit.db.session import get_session
-from orbit.models.auth import User
 from orbit.repositories.user_repository import UserRepository
+from orbit.schemas.auth import CurrentUser
 
 logger = get_logger("core.middleware")
 
@@ -22,20 +29,27 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
-) -> User:
+) -> CurrentUser:
     """
     Get current authenticated user from JWT token.
 
+    Users are cached per token as immutable snapshots (see
+    orbit.core.auth.cache_user), so repeat requests skip the lookup.
+
     Args:
         token: JWT access token
         session: Database session
 
     Returns:
-        User object
+        Snapshot of the authenticated user
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    cached_user = get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -63,7 +77,6 @@ async def get_current_user(
     # Get user from database
     user_repo = UserRepository(session)
     try:
-        from uuid import UUID
         user = await user_repo.get_by_id(UUID(user_id))
     except (UserNotFoundError, ValueError):
         raise credentials_exception
@@ -74,12 +87,15 @@ async def get_current_user(
             detail="Inactive user",
         )
 
-    return user
+    current_user = CurrentUser.model_validate(user)
+    cache_user(token, current_user, payload.get("exp", 0))
+
+    return current_user
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     """
     Get current active user.
 
@@ -87,7 +103,7 @@ async def get_current_active_user(
         current_user: Current user from token
 
     Returns:
-        User object
+        Snapshot of the authenticated user
 
     Raises:
         HTTPException: If user is inactive
@@ -101,8 +117,8 @@ async def get_current_active_user(
 
 
 async def get_current_superuser(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     """
     Get current superuser.
 
@@ -110,7 +126,7 @@ async def get_current_superuser(
         current_user: Current user from token
 
     Returns:
-        User object
+        Snapshot of the authenticated user
 
     Raises:
         HTTPException: If user is not a superuser
@@ -127,20 +143,48 @@ def require_roles(required_roles: list[str]):
     """
     Dependency to check if user has required roles.
 
+    The checker is specialized for the role list once, when the dependency
+    is created: no roles admits any authenticated user, and a single role is
+    a plain membership test.
+
     Args:
         required_roles: List of required roles
 
     Returns:
         Dependency function
     """
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        from orbit.core.auth import check_permissions
-
-        if not check_permissions(current_user.roles, required_roles):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Required roles: {', '.join(required_roles)}",
-            )
-        return current_user
+    detail = f"Required roles: {', '.join(required_roles)}"
+
+    if not required_roles:
+
+        async def role_checker(
+            current_user: CurrentUser = Depends(get_current_user),
+        ) -> CurrentUser:
+            return current_user
+
+    elif len(required_roles) == 1:
+        role = required_roles[0]
+
+        async def role_checker(
+            current_user: CurrentUser = Depends(get_current_user),
+        ) -> CurrentUser:
+            roles = current_user.roles
+            if role not in roles and "admin" not in roles:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN, detail=detail
+                )
+            return current_user
+
+    else:
+        required = frozenset(required_roles)
+
+        async def role_checker(
+            current_user: CurrentUser = Depends(get_current_user),
+        ) -> CurrentUser:
+            if not check_permissions(current_user.roles, required):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN, detail=detail
+                )
+            return current_user
 
     return role_checker
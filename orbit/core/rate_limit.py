@@ -5,20 +5,43 @@ Protects API endpoints from abuse and ensures fair resource usage.
 
 import time
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from orbit.core.cache import TTLCache
 from orbit.core.logging import get_logger
+from orbit.core.responses import ORJSONResponse
 
 logger = get_logger("core.rate_limit")
 
+# Fixed-point scale for token counts: one token is TOKEN_SCALE units
+TOKEN_SCALE = 1_000_000_000
+NS_PER_SECOND = 1_000_000_000
+
+# Seconds an unused client bucket is kept before it is dropped
+BUCKET_IDLE_TTL = 300
+
 
 class TokenBucket:
     """
     Token bucket algorithm for rate limiting.
     Allows bursts while maintaining average rate.
+
+    Tokens are tracked as integers scaled by TOKEN_SCALE against the
+    monotonic clock, so accounting neither drifts from float rounding nor
+    jumps when the wall clock is adjusted. One bucket is kept per client,
+    so instances are slotted to stay small.
     """
 
+    __slots__ = (
+        "capacity",
+        "refill_rate",
+        "_capacity_scaled",
+        "_rate_scaled",
+        "_tokens_scaled",
+        "_last_refill_ns",
+    )
+
     def __init__(self, capacity: int, refill_rate: float):
         """
         Initialize token bucket.
@@ -29,8 +52,15 @@ class TokenBucket:
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
-        self.tokens = capacity
-        self.last_refill = time.time()
+        self._capacity_scaled = capacity * TOKEN_SCALE
+        self._rate_scaled = round(refill_rate * TOKEN_SCALE)
+        self._tokens_scaled = self._capacity_scaled
+        self._last_refill_ns = time.monotonic_ns()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available, as of the last refill."""
+        return self._tokens_scaled / TOKEN_SCALE
 
     def consume(self, tokens: int = 1) -> bool:
         """
@@ -44,20 +74,21 @@ class TokenBucket:
         """
         self._refill()
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
+        needed = tokens * TOKEN_SCALE
+        if self._tokens_scaled >= needed:
+            self._tokens_scaled -= needed
             return True
         return False
 
     def _refill(self):
         """Refill tokens based on time elapsed."""
-        now = time.time()
-        elapsed = now - self.last_refill
+        now = time.monotonic_ns()
+        elapsed = now - self._last_refill_ns
 
         # Add tokens based on elapsed time
-        tokens_to_add = elapsed * self.refill_rate
-        self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-        self.last_refill = now
+        added = elapsed * self._rate_scaled // NS_PER_SECOND
+        self._tokens_scaled = min(self._capacity_scaled, self._tokens_scaled + added)
+        self._last_refill_ns = now
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """
@@ -70,11 +101,11 @@ class TokenBucket:
             Seconds to wait
         """
         self._refill()
-        if self.tokens >= tokens:
+        missing = tokens * TOKEN_SCALE - self._tokens_scaled
+        if missing <= 0:
             return 0
 
-        tokens_needed = tokens - self.tokens
-        return tokens_needed / self.refill_rate
+        return missing / self._rate_scaled
 
 
 class RateLimiter:
@@ -87,6 +118,7 @@ class RateLimiter:
         self,
         requests_per_minute: int = 60,
         burst_size: int | None = None,
+        max_clients: int = 100_000,
     ):
         """
         Initialize rate limiter.
@@ -94,17 +126,18 @@ class RateLimiter:
         Args:
             requests_per_minute: Average requests allowed per minute
             burst_size: Maximum burst size (defaults to requests_per_minute)
+            max_clients: Maximum number of client buckets kept in memory
         """
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size or requests_per_minute
         self.refill_rate = requests_per_minute / 60.0  # Tokens per second
 
-        # Store token buckets per client
-        self.buckets: dict[str, TokenBucket] = {}
-
-        # Cleanup old buckets periodically
-        self.last_cleanup = time.time()
-        self.cleanup_interval = 300  # 5 minutes
+        # Token buckets per client. A bucket idle for longer than it takes to
+        # refill is equivalent to a new one, so it is allowed to expire.
+        refill_seconds = self.burst_size / self.refill_rate
+        self.buckets = TTLCache(
+            maxsize=max_clients, ttl=max(BUCKET_IDLE_TTL, refill_seconds)
+        )
 
     def is_allowed(self, client_id: str) -> bool:
         """
@@ -116,15 +149,12 @@ class RateLimiter:
         Returns:
             True if allowed, False if rate limited
         """
-        self._cleanup_old_buckets()
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
+            bucket = TokenBucket(capacity=self.burst_size, refill_rate=self.refill_rate)
 
-        # Get or create bucket for client
-        if client_id not in self.buckets:
-            self.buckets[client_id] = TokenBucket(
-                capacity=self.burst_size, refill_rate=self.refill_rate
-            )
-
-        bucket = self.buckets[client_id]
+        # Re-inserting restarts the idle timer
+        self.buckets.set(client_id, bucket)
         return bucket.consume(1)
 
     def get_wait_time(self, client_id: str) -> float:
@@ -137,39 +167,25 @@ class RateLimiter:
         Returns:
             Seconds to wait
         """
-        if client_id not in self.buckets:
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
             return 0
 
-        return self.buckets[client_id].get_wait_time(1)
-
-    def _cleanup_old_buckets(self):
-        """Remove old, unused buckets to prevent memory leak."""
-        now = time.time()
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
-
-        # Remove buckets that are full (haven't been used recently)
-        to_remove = []
-        for client_id, bucket in self.buckets.items():
-            if bucket.tokens >= bucket.capacity:
-                to_remove.append(client_id)
-
-        for client_id in to_remove:
-            del self.buckets[client_id]
+        return bucket.get_wait_time(1)
 
-        self.last_cleanup = now
-        if to_remove:
-            logger.debug(f"Cleaned up {len(to_remove)} old rate limit buckets")
 
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Middleware for rate limiting HTTP requests.
+
+    Implemented as a plain ASGI app rather than a BaseHTTPMiddleware, so
+    passing a request through costs one function call instead of a task
+    group and a streamed response wrapper.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         requests_per_minute: int = 60,
         burst_size: int | None = None,
         exclude_paths: list | None = None,
@@ -178,50 +194,72 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Initialize rate limit middleware.
 
         Args:
-            app: FastAPI application
+            app: ASGI application to wrap
             requests_per_minute: Requests allowed per minute
             burst_size: Maximum burst size
-            exclude_paths: Paths to exclude from rate limiting
+            exclude_paths: Paths to exclude from rate limiting. Entries
+                ending in "*" match any path with that prefix; all others
+                must match exactly.
         """
-        super().__init__(app)
+        self.app = app
         self.rate_limiter = RateLimiter(requests_per_minute, burst_size)
+        self._limit_header = str(requests_per_minute)
         self.exclude_paths = exclude_paths or ["/health", "/metrics"]
+        self._exclude_exact = frozenset(
+            path for path in self.exclude_paths if not path.endswith("*")
+        )
+        self._exclude_prefixes = tuple(
+            path.rstrip("*") for path in self.exclude_paths if path.endswith("*")
+        )
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting."""
-        # Skip rate limiting for excluded paths
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            return await call_next(request)
+        # Skip rate limiting for non-HTTP traffic (lifespan scopes carry no
+        # path) and excluded paths
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in self._exclude_exact or path.startswith(self._exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
 
         # Get client identifier (IP address)
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # Check rate limit
         if not self.rate_limiter.is_allowed(client_ip):
             wait_time = self.rate_limiter.get_wait_time(client_ip)
 
-            logger.warning(
-                f"Rate limit exceeded for {client_ip} on {request.url.path}"
-            )
+            logger.warning(f"Rate limit exceeded for {client_ip} on {path}")
 
-            raise HTTPException(
+            response = ORJSONResponse(
                 status_code=429,
-                detail=f"Rate limit exceeded. Try again in {wait_time:.1f} seconds.",
+                content={
+                    "error": "HTTPException",
+                    "message": (
+                        f"Rate limit exceeded. Try again in {wait_time:.1f} seconds."
+                    ),
+                },
                 headers={"Retry-After": str(int(wait_time) + 1)},
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(
-            self.rate_limiter.requests_per_minute
-        )
-        response.headers["X-RateLimit-Remaining"] = str(
-            int(self.rate_limiter.buckets.get(client_ip, TokenBucket(0, 0)).tokens)
-        )
-
-        return response
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                bucket = self.rate_limiter.buckets.get(client_ip)
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = self._limit_header
+                headers["X-RateLimit-Remaining"] = (
+                    str(int(bucket.tokens)) if bucket else "0"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # Global rate limiter instance
@@ -0,0 +1,23 @@
+"""
+Response classes for Orbit.
+Provides fast JSON rendering backed by orjson.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Serializes UUIDs and datetimes natively (naive datetimes are treated as
+    UTC), so handlers can return raw column values without converting them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        )
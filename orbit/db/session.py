@@ -1,13 +1,108 @@
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Any
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from orbit.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True, future=True)
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """
+    Build pooling and driver options for the engine.
+
+    SQLite keeps SQLAlchemy's default pool, which does not take sizing
+    arguments. Behind PgBouncer, pooling is left to the bouncer; in
+    transaction mode a server connection may change between statements,
+    so asyncpg must not keep prepared statements. With a direct pool,
+    asyncpg keeps a larger prepared statement cache for the repeated
+    execution-history inserts, and JIT is disabled for the short OLTP
+    queries it would only slow down.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+
+    if settings.DB_USE_NULL_POOL:
+        options: dict[str, Any] = {"poolclass": NullPool}
+        if "+asyncpg" in database_url:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+
+    options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    if "+asyncpg" in database_url:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"jit": "off", "application_name": "orbit"},
+        }
+    return options
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON column values with orjson (drivers expect text)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    future=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    **_engine_options(settings.DATABASE_URL),
+)
+
+if settings.DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+        """SQLite ignores foreign keys (and ON DELETE CASCADE) unless enabled."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Shares the engine's pool; statements run without an enclosing transaction
+read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+# Session factories are built once and shared by requests and background tasks
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+ReadOnlySessionLocal = async_sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 
 async def get_session() -> AsyncSession:
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_readonly_session() -> AsyncSession:
+    """
+    Session for single-statement read endpoints; skips BEGIN/COMMIT.
+
+    Each statement runs in its own implicit transaction. Handlers that issue
+    more than one statement (including selectinload) or stream from a cursor
+    need get_session instead.
+    """
+    async with ReadOnlySessionLocal() as session:
         yield session
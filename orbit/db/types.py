@@ -0,0 +1,9 @@
+"""
+Shared column types.
+"""
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSON document column: binary JSONB on PostgreSQL, plain JSON elsewhere (SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
@@ -1,26 +1,36 @@
+import asyncio
+import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import sessionmaker
-from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from orbit.api.v1.api import api_router
+from orbit.core.auth import get_password_hash_async, set_crypto_executor
 from orbit.core.config import settings
+from orbit.core.encryption import encryption_service
 from orbit.core.exception_handlers import (
     http_exception_handler,
     orbit_exception_handler,
     validation_exception_handler,
 )
 from orbit.core.exceptions import OrbitException
+from orbit.core.health import HEALTH_BODY, HealthCheckMiddleware
+from orbit.core.idempotency import RedisIdempotencyStore, set_idempotency_store
 from orbit.core.logging import get_logger, setup_logging
 from orbit.core.rate_limit import RateLimitMiddleware
-from orbit.db.session import engine
+from orbit.core.responses import ORJSONResponse
+from orbit.db.session import AsyncSessionLocal, engine
 from orbit.models import auth  # noqa: F401
 from orbit.models.workflow import SQLModel
+from orbit.services.execution_queue import set_queue_pool
 from orbit.services.scheduler import scheduler
+from orbit.services.websocket_manager import relay_redis_events, ws_manager
 
 # Initialize logging
 setup_logging()
@@ -32,13 +42,41 @@ async def lifespan(app: FastAPI):
     # Startup: Connect to DB, etc.
     logger.info("Orbit System Initializing...")
     # Create tables for SQLite (for dev convenience)
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-    logger.info("Database tables created")
-
-    # Start scheduler
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    await scheduler.start(async_session)
+    if settings.AUTO_CREATE_TABLES:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        logger.info("Database tables created")
+
+    # Dedicated pool for password hashing so logins don't block the event loop
+    app.state.crypto_pool = ThreadPoolExecutor(
+        max_workers=os.cpu_count(), thread_name_prefix="crypto"
+    )
+    set_crypto_executor(app.state.crypto_pool)
+
+    # Exercise the argon2 and Fernet backends once so the first login or
+    # secret read in this worker doesn't pay for loading them
+    await get_password_hash_async("warm-up")
+    encryption_service.decrypt_bytes(encryption_service.encrypt_bytes(b"warm-up"))
+
+    # Hand workflow runs to the arq worker when Redis is configured
+    app.state.arq = None
+    app.state.event_relay = None
+    if settings.REDIS_URL:
+        from arq import create_pool
+        from arq.connections import RedisSettings
+
+        app.state.arq = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+        set_queue_pool(app.state.arq)
+        # Share Idempotency-Key reservations across every API worker
+        set_idempotency_store(RedisIdempotencyStore(app.state.arq))
+        # Runs happen in the worker; relay their progress to our WebSocket clients
+        app.state.event_relay = asyncio.create_task(
+            relay_redis_events(app.state.arq, ws_manager)
+        )
+        logger.info("Workflow execution queue connected")
+
+    # Start scheduler on the shared session factory
+    await scheduler.start(AsyncSessionLocal)
     logger.info("Workflow scheduler started")
 
     yield
@@ -46,6 +84,17 @@ async def lifespan(app: FastAPI):
     # Shutdown: Close connections
     await scheduler.stop()
     logger.info("Workflow scheduler stopped")
+    if app.state.event_relay is not None:
+        app.state.event_relay.cancel()
+        # A failed relay must not keep the pools below from being closed
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await app.state.event_relay
+    if app.state.arq is not None:
+        set_queue_pool(None)
+        set_idempotency_store(None)
+        await app.state.arq.close()
+    set_crypto_executor(None)
+    app.state.crypto_pool.shutdown(wait=False)
     logger.info("Orbit System Shutting Down...")
 
 
@@ -53,6 +102,9 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     lifespan=lifespan,
+    # Routes with a response_model serialize through Pydantic directly;
+    # plain dict/list returns are rendered with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # Register exception handlers
@@ -71,6 +123,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 # Add rate limiting middleware
@@ -81,17 +134,27 @@ app.add_middleware(
     exclude_paths=["/health", "/api/v1/metrics", "/api/v1/ws"],
 )
 
+# Added last so it is the outermost layer: probes never reach the middleware above
+app.add_middleware(HealthCheckMiddleware)
 
-@app.get("/")
-async def root():
-    return {
+
+# Constant bodies are serialized once at import
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "Welcome to Orbit",
         "status": "operational",
         "version": "0.1.0",
         "docs": "/docs",
     }
+)
+
+
+@app.get("/")
+async def root():
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    # Normally answered by HealthCheckMiddleware; kept for the OpenAPI schema
+    return Response(HEALTH_BODY, media_type="application/json")
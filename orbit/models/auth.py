@@ -5,17 +5,25 @@ Authentication and authorization models.
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.core.ids import uuid7
+from orbit.db.types import JSONType
+
 
 class User(SQLModel, table=True):
     """User model for authentication."""
 
     __tablename__ = "user"
+    __table_args__ = (
+        # Emails are unique and looked up case-insensitively
+        Index("ix_user_email_lower", text("lower(email)"), unique=True),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    email: str = Field(unique=True, index=True)
+    email: str
     username: str = Field(unique=True, index=True)
     hashed_password: str
     full_name: str | None = None
@@ -25,11 +33,11 @@ class User(SQLModel, table=True):
     is_superuser: bool = Field(default=False)
 
     # Roles and permissions
-    roles: list[str] = Field(default=[], sa_column=Column(JSON))
+    roles: list[str] = Field(default_factory=list, sa_column=Column(JSONType))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     last_login: datetime | None = None
 
 
@@ -47,13 +55,13 @@ class APIKey(SQLModel, table=True):
     key_prefix: str = Field(description="First 8 chars for identification")
 
     # Permissions
-    scopes: list[str] = Field(default=[], sa_column=Column(JSON))
+    scopes: list[str] = Field(default_factory=list, sa_column=Column(JSONType))
 
     # Status
     is_active: bool = Field(default=True)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     expires_at: datetime | None = None
     last_used_at: datetime | None = None
 
@@ -63,7 +71,7 @@ class AuditLog(SQLModel, table=True):
 
     __tablename__ = "auditlog"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID | None = Field(default=None, foreign_key="user.id", index=True)
 
     # Event details
@@ -76,11 +84,11 @@ class AuditLog(SQLModel, table=True):
     user_agent: str | None = None
 
     # Event data
-    details: dict | None = Field(default=None, sa_column=Column(JSON))
+    details: dict | None = Field(default=None, sa_column=Column(JSONType))
 
     # Status
     success: bool = Field(default=True)
     error_message: str | None = None
 
     # Timestamp
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
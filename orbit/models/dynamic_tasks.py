@@ -7,9 +7,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Computed, Float
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.db.types import JSONType
+
 
 class DynamicTaskGroup(SQLModel, table=True):
     """
@@ -17,14 +20,21 @@ class DynamicTaskGroup(SQLModel, table=True):
     Used for map-reduce patterns.
     """
 
+    # Fetch the generated progress column with RETURNING on INSERT and UPDATE,
+    # so it is never left expired (an async session cannot lazy-load it)
+    __mapper_args__ = {"eager_defaults": True}
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     parent_task_name: str = Field(index=True, description="Name of the map/reduce task")
 
     # Task generation
     task_type: str = Field(description="Type: map or reduce")
-    items: list[Any] = Field(sa_column=Column(JSON), description="Items to process")
-    task_template: dict[str, Any] = Field(sa_column=Column(JSON), description="Template for generated tasks")
+    # Reduce inputs; map items are stored one row each in DynamicTaskItem
+    items: list[Any] | None = Field(
+        default=None, sa_column=Column(JSONType), description="Items to process"
+    )
+    task_template: dict[str, Any] = Field(sa_column=Column(JSONType), description="Template for generated tasks")
 
     # Status
     total_tasks: int = Field(default=0)
@@ -32,15 +42,46 @@ class DynamicTaskGroup(SQLModel, table=True):
     failed_tasks: int = Field(default=0)
     status: str = Field(default="pending", index=True)  # pending, running, completed, failed
 
+    # Completion percentage, computed by the database whenever the counters change
+    progress: float | None = Field(
+        default=None,
+        sa_column=Column(
+            Float,
+            Computed(
+                "CASE WHEN total_tasks = 0 THEN 0.0 "
+                "ELSE CAST(completed_tasks AS FLOAT) * 100 / total_tasks END",
+                persisted=True,
+            ),
+        ),
+    )
+
     # Results
-    results: list[Any] | None = Field(default=None, sa_column=Column(JSON))
+    results: list[Any] | None = Field(default=None, sa_column=Column(JSONType))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     completed_at: datetime | None = Field(default=None)
 
     def progress_percentage(self) -> float:
-        """Calculate completion percentage."""
+        """
+        Calculate completion percentage.
+
+        Used for groups that have not been flushed yet; stored rows carry the
+        same value in the generated ``progress`` column.
+        """
         if self.total_tasks == 0:
             return 0.0
         return (self.completed_tasks / self.total_tasks) * 100
+
+
+class DynamicTaskItem(SQLModel, table=True):
+    """
+    One input item of a map task group.
+    Kept out of the group row so large arrays can be streamed in batches.
+    """
+
+    group_id: UUID = Field(
+        foreign_key="dynamictaskgroup.id", primary_key=True, ondelete="CASCADE"
+    )
+    index: int = Field(primary_key=True)
+    payload: Any = Field(sa_column=Column(JSONType))
@@ -4,10 +4,14 @@ Tracks all workflow and task executions for audit and debugging.
 """
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import JSON, Column, Text
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Column, Index, Text, text
+from sqlmodel import Field, Relationship, SQLModel
+
+from orbit.core.clock import utcnow
+from orbit.core.ids import uuid7
+from orbit.db.types import JSONType
 
 
 class WorkflowExecution(SQLModel, table=True):
@@ -16,15 +20,43 @@ class WorkflowExecution(SQLModel, table=True):
     Provides audit trail and execution history.
     """
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    __table_args__ = (
+        Index(
+            "ix_wfexec_wid_status_started",
+            "workflow_id",
+            "status",
+            text("started_at DESC"),
+        ),
+        # Small, always-hot index for the statuses history views filter on
+        Index(
+            "ix_wfexec_active",
+            text("started_at DESC"),
+            postgresql_where=text("status IN ('running', 'queued', 'failed')"),
+            sqlite_where=text("status IN ('running', 'queued', 'failed')"),
+        ),
+        # Serves the started_at look-back windows; on PostgreSQL the included
+        # columns let the per-status stats aggregate run as an index-only scan
+        Index(
+            "ix_wfexec_started_at",
+            "started_at",
+            postgresql_include=["status", "duration_seconds"],
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     workflow_name: str = Field(index=True)
     status: str = Field(index=True)  # queued, running, completed, failed, cancelled
-    started_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: datetime = Field(default_factory=utcnow)
     completed_at: datetime | None = Field(default=None)
     duration_seconds: float | None = Field(default=None)
     error_message: str | None = Field(default=None, sa_column=Column(Text))
-    extra_data: dict | None = Field(default=None, sa_column=Column(JSON))
+    extra_data: dict | None = Field(default=None, sa_column=Column(JSONType))
+
+    tasks: list["TaskExecution"] = Relationship(
+        back_populates="workflow_execution",
+        sa_relationship_kwargs={"order_by": "TaskExecution.started_at"},
+    )
 
 
 class TaskExecution(SQLModel, table=True):
@@ -33,16 +65,25 @@ class TaskExecution(SQLModel, table=True):
     Tracks retries and execution details.
     """
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    __table_args__ = (
+        # Loading an execution's tasks filters on the parent and orders by start
+        Index("ix_taskexec_wfexec_started", "workflow_execution_id", "started_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     workflow_execution_id: UUID = Field(
-        foreign_key="workflowexecution.id", index=True
+        foreign_key="workflowexecution.id", ondelete="CASCADE"
     )
-    task_id: UUID = Field(foreign_key="task.id", index=True)
+    task_id: UUID = Field(foreign_key="task.id", index=True, ondelete="CASCADE")
     task_name: str = Field(index=True)
     attempt_number: int = Field(default=0)  # Retry attempt
     status: str = Field(index=True)  # pending, running, completed, failed
-    started_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: datetime = Field(default_factory=utcnow, index=True)
     completed_at: datetime | None = Field(default=None)
     duration_seconds: float | None = Field(default=None)
     error_message: str | None = Field(default=None, sa_column=Column(Text))
-    result: dict | None = Field(default=None, sa_column=Column(JSON))
+    result: dict | None = Field(default=None, sa_column=Column(JSONType))
+
+    workflow_execution: WorkflowExecution | None = Relationship(
+        back_populates="tasks"
+    )
@@ -5,11 +5,15 @@ Prevents duplicate task executions and enables result caching.
 
 from datetime import datetime, timedelta
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import JSON, Column, Index, Text
+from sqlalchemy import Column, Index, Text
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.core.ids import uuid7
+from orbit.db.types import JSONType
+
 
 class IdempotencyKey(SQLModel, table=True):
     """
@@ -22,18 +26,18 @@ class IdempotencyKey(SQLModel, table=True):
         Index("ix_idempotency_key_workflow_task", "workflow_id", "task_name", "key"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     task_name: str = Field(index=True)
     key: str = Field(index=True, description="Idempotency key")
 
     # Execution details
     status: str = Field(default="processing", index=True)  # processing, completed, failed
-    result: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    result: dict[str, Any] | None = Field(default=None, sa_column=Column(JSONType))
     error_message: str | None = Field(default=None, sa_column=Column(Text))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
     completed_at: datetime | None = Field(default=None)
     expires_at: datetime | None = Field(default=None, index=True)
 
@@ -45,8 +49,8 @@ class IdempotencyKey(SQLModel, table=True):
         """Check if idempotency key has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        return utcnow() > self.expires_at
 
     def set_ttl(self, hours: int = 24):
         """Set time-to-live for idempotency key."""
-        self.expires_at = datetime.utcnow() + timedelta(hours=hours)
+        self.expires_at = utcnow() + timedelta(hours=hours)
@@ -4,8 +4,10 @@ Implements exponential backoff with jitter for task retries.
 """
 
 import random
+from functools import lru_cache
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class RetryPolicy(BaseModel):
@@ -14,14 +16,34 @@ class RetryPolicy(BaseModel):
 
     Implements exponential backoff with optional jitter to prevent
     thundering herd problems.
+
+    Policies are immutable and hashable, so identical ones can be shared
+    (see make_retry_policy).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     max_retries: int = Field(default=0, ge=0, description="Maximum number of retry attempts")
     initial_delay: float = Field(default=1.0, gt=0, description="Initial delay in seconds")
     max_delay: float = Field(default=60.0, gt=0, description="Maximum delay in seconds")
     backoff_multiplier: float = Field(default=2.0, gt=1, description="Backoff multiplier")
     jitter: bool = Field(default=True, description="Add random jitter to delays")
 
+    # Capped backoff delay per attempt, up to the first attempt that hits
+    # max_delay; later attempts reuse the last entry
+    _delays: tuple[float, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context) -> None:
+        """Precompute the backoff table."""
+        delays = []
+        for attempt in range(self.max_retries):
+            delay = self.initial_delay * (self.backoff_multiplier**attempt)
+            if delay >= self.max_delay:
+                delays.append(self.max_delay)
+                break
+            delays.append(delay)
+        self._delays = tuple(delays)
+
     def calculate_delay(self, attempt: int) -> float:
         """
         Calculate delay for a given retry attempt using exponential backoff.
@@ -35,16 +57,13 @@ class RetryPolicy(BaseModel):
         if attempt >= self.max_retries:
             return 0
 
-        # Calculate exponential backoff: initial_delay * (multiplier ^ attempt)
-        delay = min(
-            self.initial_delay * (self.backoff_multiplier ** attempt),
-            self.max_delay
-        )
+        # Exponential backoff: initial_delay * (multiplier ^ attempt), capped
+        delays = self._delays
+        delay = delays[attempt] if attempt < len(delays) else delays[-1]
 
         # Add jitter if enabled (±25% random variation)
         if self.jitter:
-            jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
+            delay += delay * (random.random() * 0.5 - 0.25)
 
         return max(0, delay)
 
@@ -61,6 +80,33 @@ class RetryPolicy(BaseModel):
         return attempt < self.max_retries
 
 
+@lru_cache(maxsize=256)
+def _shared_retry_policy(**kwargs: Any) -> RetryPolicy:
+    """Build a RetryPolicy once per distinct set of hashable settings."""
+    return RetryPolicy(**kwargs)
+
+
+def make_retry_policy(**kwargs: Any) -> RetryPolicy:
+    """
+    Get a shared RetryPolicy for the given settings.
+
+    Tasks carry their policy as a dict, and most use the same few settings,
+    so each distinct set is validated once and then reused. Settings that
+    cannot be cache keys (e.g. a list from task JSON) are validated
+    uncached instead.
+
+    Args:
+        **kwargs: RetryPolicy field values
+
+    Returns:
+        RetryPolicy instance
+    """
+    try:
+        return _shared_retry_policy(**kwargs)
+    except TypeError:
+        return RetryPolicy(**kwargs)
+
+
 # Default retry policies for common scenarios
 DEFAULT_RETRY_POLICY = RetryPolicy(
     max_retries=0,
@@ -4,11 +4,26 @@ Supports cron-based scheduling for periodic workflow execution.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from croniter import croniter
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+
+
+@lru_cache(maxsize=1024)
+def _parsed_cron(expression: str) -> croniter:
+    """
+    Parse a cron expression once and reuse the iterator.
+
+    Callers must reset it with set_current() before each use; the reset and
+    the following get_next() run without awaiting, so sharing is safe on the
+    event loop.
+    """
+    return croniter(expression)
+
 
 class WorkflowSchedule(SQLModel, table=True):
     """
@@ -17,7 +32,9 @@ class WorkflowSchedule(SQLModel, table=True):
     """
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", unique=True)
+    workflow_id: UUID = Field(
+        foreign_key="workflow.id", unique=True, ondelete="CASCADE"
+    )
     cron_expression: str = Field(
         index=True, description="Cron expression (e.g., '0 2 * * *')"
     )
@@ -29,8 +46,8 @@ class WorkflowSchedule(SQLModel, table=True):
     last_run: datetime | None = Field(
         default=None, description="Last execution time"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     def calculate_next_run(self, base_time: datetime | None = None) -> datetime:
         """
@@ -39,19 +56,34 @@ class WorkflowSchedule(SQLModel, table=True):
         Args:
             base_time: Base time for calculation (defaults to now)
 
+        Returns:
+            Next scheduled run time
+        """
+        return self.next_run_for(self.cron_expression, base_time)
+
+    @staticmethod
+    def next_run_for(expression: str, base_time: datetime | None = None) -> datetime:
+        """
+        Calculate the next run time for a cron expression.
+
+        Args:
+            expression: Cron expression
+            base_time: Base time for calculation (defaults to now)
+
         Returns:
             Next scheduled run time
         """
         if base_time is None:
-            base_time = datetime.utcnow()
+            base_time = utcnow()
 
-        cron = croniter(self.cron_expression, base_time)
+        cron = _parsed_cron(expression)
+        cron.set_current(base_time, force=True)
         return cron.get_next(datetime)
 
     def update_next_run(self) -> None:
         """Update next_run to the next scheduled time."""
         self.next_run = self.calculate_next_run()
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
     @staticmethod
     def validate_cron_expression(expression: str) -> bool:
@@ -65,7 +97,7 @@ class WorkflowSchedule(SQLModel, table=True):
             True if valid, False otherwise
         """
         try:
-            croniter(expression)
+            _parsed_cron(expression)
             return True
         except (ValueError, KeyError):
             return False
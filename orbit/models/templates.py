@@ -7,9 +7,13 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, Text
+from pydantic import ConfigDict
+from sqlalchemy import Column, Text
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.db.types import JSONType
+
 
 class WorkflowTemplate(SQLModel, table=True):
     """
@@ -23,27 +27,27 @@ class WorkflowTemplate(SQLModel, table=True):
     category: str | None = Field(default=None, index=True)
 
     # Template definition
-    template_data: dict[str, Any] = Field(sa_column=Column(JSON))
+    template_data: dict[str, Any] = Field(sa_column=Column(JSONType))
 
     # Parameters
     parameters: dict[str, Any] = Field(
-        default={},
-        sa_column=Column(JSON),
+        default_factory=dict,
+        sa_column=Column(JSONType),
         description="Parameter definitions with defaults and validation"
     )
 
     # Metadata
     version: str = Field(default="1.0.0")
     author: str | None = Field(default=None)
-    tags: list[str] = Field(default=[], sa_column=Column(JSON))
+    tags: list[str] = Field(default_factory=list, sa_column=Column(JSONType))
 
     # Usage tracking
     usage_count: int = Field(default=0)
     last_used_at: datetime | None = Field(default=None)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # Validation
     is_active: bool = Field(default=True)
@@ -55,6 +59,8 @@ class TemplateParameter(SQLModel):
     Parameter definition for workflow template.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str  # string, integer, float, boolean, array, object
     description: str | None = None
@@ -9,6 +9,8 @@ from uuid import UUID, uuid4
 from sqlalchemy import Column, Text
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+
 
 class WorkflowVariable(SQLModel, table=True):
     """
@@ -17,12 +19,12 @@ class WorkflowVariable(SQLModel, table=True):
     """
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     key: str = Field(index=True)
     value: str = Field(sa_column=Column(Text))
     description: str | None = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class WorkflowSecret(SQLModel, table=True):
@@ -32,12 +34,12 @@ class WorkflowSecret(SQLModel, table=True):
     """
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     key: str = Field(index=True)
     encrypted_value: str = Field(sa_column=Column(Text))
     description: str | None = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class GlobalVariable(SQLModel, table=True):
@@ -50,8 +52,8 @@ class GlobalVariable(SQLModel, table=True):
     key: str = Field(unique=True, index=True)
     value: str = Field(sa_column=Column(Text))
     description: str | None = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class GlobalSecret(SQLModel, table=True):
@@ -64,5 +66,5 @@ class GlobalSecret(SQLModel, table=True):
     key: str = Field(unique=True, index=True)
     encrypted_value: str = Field(sa_column=Column(Text))
     description: str | None = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
@@ -7,9 +7,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, Text
+from sqlalchemy import Column, Index, Text
 from sqlmodel import Field, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.db.types import JSONType
+
 
 class WorkflowVersion(SQLModel, table=True):
     """
@@ -18,9 +21,18 @@ class WorkflowVersion(SQLModel, table=True):
     """
 
     __tablename__ = "workflowversion"
+    __table_args__ = (
+        # Containment (@>) lookups on JSONB; no equivalent on SQLite
+        Index(
+            "idx_workflowversion_data_gin",
+            "workflow_data",
+            postgresql_using="gin",
+            postgresql_ops={"workflow_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
 
     # Version information
     version_number: int = Field(index=True, description="Sequential version number")
@@ -29,7 +41,7 @@ class WorkflowVersion(SQLModel, table=True):
     # Workflow definition snapshot
     name: str
     description: str | None = Field(default=None, sa_column=Column(Text))
-    workflow_data: dict[str, Any] = Field(sa_column=Column(JSON), description="Complete workflow definition")
+    workflow_data: dict[str, Any] = Field(sa_column=Column(JSONType), description="Complete workflow definition")
 
     # Change tracking
     change_summary: str | None = Field(default=None, sa_column=Column(Text))
@@ -40,7 +52,7 @@ class WorkflowVersion(SQLModel, table=True):
     is_draft: bool = Field(default=False, description="Draft version (not deployed)")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
     activated_at: datetime | None = Field(default=None)
 
     # Metadata
@@ -54,17 +66,25 @@ class WorkflowChangeLog(SQLModel, table=True):
     """
 
     __tablename__ = "workflowchangelog"
+    __table_args__ = (
+        Index(
+            "idx_workflowchangelog_changes_gin",
+            "changes",
+            postgresql_using="gin",
+            postgresql_ops={"changes": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id", index=True)
+    workflow_id: UUID = Field(foreign_key="workflow.id", index=True, ondelete="CASCADE")
     from_version: int | None = Field(default=None, description="Previous version number")
     to_version: int = Field(description="New version number")
 
     # Change details
     change_type: str = Field(description="Type: created, updated, rolled_back, deleted")
-    changes: dict[str, Any] = Field(sa_column=Column(JSON), description="Detailed diff of changes")
+    changes: dict[str, Any] = Field(sa_column=Column(JSONType), description="Detailed diff of changes")
 
     # Metadata
     changed_by: str | None = Field(default=None)
     change_reason: str | None = Field(default=None, sa_column=Column(Text))
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
@@ -1,9 +1,12 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
+from orbit.core.clock import utcnow
+from orbit.db.types import JSONType
+
 
 class WorkflowBase(SQLModel):
     name: str = Field(index=True)
@@ -11,26 +14,35 @@ class WorkflowBase(SQLModel):
 
 
 class Workflow(WorkflowBase, table=True):
+    # Matches the keyset order used by the workflow list endpoint
+    __table_args__ = (
+        Index("ix_workflow_created_id", text("created_at DESC"), text("id DESC")),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     status: str = Field(default="pending", index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     paused_at: datetime | None = Field(
         default=None, description="Timestamp when workflow was paused"
     )
 
-    tasks: list["Task"] = Relationship(back_populates="workflow")
+    # Loaded with one batched SELECT ... IN by default, since lazy loads raise
+    # under AsyncSession; queries that don't need tasks opt out with raiseload
+    tasks: list["Task"] = Relationship(
+        back_populates="workflow", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class TaskBase(SQLModel):
     name: str
     action_type: str  # e.g., "http_request", "shell_command"
-    action_payload: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    action_payload: dict = Field(default_factory=dict, sa_column=Column(JSONType))
     dependencies: list[str] = Field(
-        default_factory=list, sa_column=Column(JSON)
+        default_factory=list, sa_column=Column(JSONType)
     )  # List of task names this task depends on
     retry_policy: dict | None = Field(
-        default=None, sa_column=Column(JSON)
+        default=None, sa_column=Column(JSONType)
     )  # Retry configuration
     timeout_seconds: int | None = Field(
         default=None
@@ -38,12 +50,26 @@ class TaskBase(SQLModel):
 
 
 class Task(TaskBase, table=True):
+    __table_args__ = (
+        # Containment (@>) on payloads and membership (?) on dependency names;
+        # JSONB only, so they are skipped on SQLite
+        Index(
+            "idx_task_action_payload_gin",
+            "action_payload",
+            postgresql_using="gin",
+            postgresql_ops={"action_payload": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_task_dependencies_gin", "dependencies", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    workflow_id: UUID = Field(foreign_key="workflow.id")
+    workflow_id: UUID = Field(foreign_key="workflow.id", ondelete="CASCADE")
     status: str = Field(default="pending")
-    result: dict | None = Field(default=None, sa_column=Column(JSON))
+    result: dict | None = Field(default=None, sa_column=Column(JSONType))
     retry_count: int = Field(default=0)  # Current retry attempt
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     workflow: Workflow = Relationship(back_populates="tasks")
@@ -5,7 +5,7 @@ Repository pattern for User and Auth data access.
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from orbit.core.exceptions import DatabaseError, UserNotFoundError
@@ -26,7 +26,6 @@ class UserRepository:
         try:
             self.session.add(user)
             await self.session.commit()
-            await self.session.refresh(user)
             logger.info(f"Created user: {user.username}")
             return user
         except IntegrityError:
@@ -58,9 +57,9 @@ class UserRepository:
             raise DatabaseError(f"Failed to get user: {str(e)}")
 
     async def get_by_email(self, email: str) -> User | None:
-        """Get user by email."""
+        """Get user by email, ignoring case."""
         try:
-            query = select(User).where(User.email == email)
+            query = select(User).where(func.lower(User.email) == email.lower())
             result = await self.session.exec(query)
             return result.first()
         except Exception as e:
@@ -82,7 +81,6 @@ class UserRepository:
         try:
             self.session.add(user)
             await self.session.commit()
-            await self.session.refresh(user)
             logger.info(f"Updated user: {user.id}")
             return user
         except Exception as e:
@@ -95,7 +93,6 @@ class UserRepository:
         try:
             self.session.add(api_key)
             await self.session.commit()
-            await self.session.refresh(api_key)
             logger.info(f"Created API key for user: {api_key.user_id}")
             return api_key
         except Exception as e:
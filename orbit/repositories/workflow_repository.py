@@ -3,9 +3,12 @@ Repository pattern for Workflow data access.
 Abstracts database operations for better testability and maintainability.
 """
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, tuple_
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -15,6 +18,13 @@ from orbit.models.workflow import Task, Workflow
 
 logger = get_logger("repositories.workflow")
 
+# Rows fetched per round trip when listing; tasks are loaded once per batch
+LIST_BATCH_SIZE = 50
+
+# Task results are written by the runner but are not part of the workflow
+# read schemas, so the potentially large JSON blob is left out of task loads
+_TASKS_WITHOUT_RESULT = selectinload(Workflow.tasks).defer(Task.result)
+
 
 class WorkflowRepository:
     """Repository for Workflow entity operations."""
@@ -27,7 +37,6 @@ class WorkflowRepository:
         try:
             self.session.add(workflow)
             await self.session.commit()
-            await self.session.refresh(workflow)
             logger.info(f"Created workflow: {workflow.id}")
             return workflow
         except Exception as e:
@@ -35,14 +44,30 @@ class WorkflowRepository:
             logger.error(f"Failed to create workflow: {e}")
             raise DatabaseError(f"Failed to create workflow: {str(e)}")
 
+    async def create_with_tasks(
+        self, workflow: Workflow, tasks: list[Task]
+    ) -> Workflow:
+        """Create a workflow and its tasks in a single transaction."""
+        try:
+            workflow.tasks = tasks
+            self.session.add(workflow)
+            await self.session.commit()
+            logger.info(f"Created workflow: {workflow.id} with {len(tasks)} tasks")
+            return workflow
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to create workflow: {e}")
+            raise DatabaseError(f"Failed to create workflow: {str(e)}")
+
     async def get_by_id(
         self, workflow_id: UUID, include_tasks: bool = True
     ) -> Workflow:
         """Get workflow by ID."""
         try:
             query = select(Workflow).where(Workflow.id == workflow_id)
-            if include_tasks:
-                query = query.options(selectinload(Workflow.tasks))
+            query = query.options(
+                _TASKS_WITHOUT_RESULT if include_tasks else raiseload("*")
+            )
 
             result = await self.session.exec(query)
             workflow = result.first()
@@ -60,29 +85,88 @@ class WorkflowRepository:
             logger.error(f"Failed to get workflow {workflow_id}: {e}")
             raise DatabaseError(f"Failed to get workflow: {str(e)}")
 
+    async def get_status(self, workflow_id: UUID) -> str:
+        """Get only a workflow's status, without loading the row."""
+        try:
+            query = select(Workflow.status).where(Workflow.id == workflow_id)
+            result = await self.session.exec(query)
+            workflow_status = result.first()
+        except Exception as e:
+            logger.error(f"Failed to get status of workflow {workflow_id}: {e}")
+            raise DatabaseError(f"Failed to get workflow status: {str(e)}")
+
+        if workflow_status is None:
+            raise WorkflowNotFoundError(
+                f"Workflow {workflow_id} not found",
+                details={"workflow_id": str(workflow_id)},
+            )
+        return workflow_status
+
     async def get_all(
-        self, skip: int = 0, limit: int = 100, include_tasks: bool = True
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        include_tasks: bool = True,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[Workflow]:
-        """Get all workflows with pagination."""
+        """
+        Get all workflows, newest first, with pagination.
+
+        Args:
+            skip: Number of rows to skip (ignored when after is given)
+            limit: Maximum number of workflows
+            include_tasks: Eager-load each workflow's tasks
+            after: Keyset position (created_at, id) of the previous page's last row
+
+        Rows are read from a server-side cursor in batches of LIST_BATCH_SIZE
+        rather than buffered as one result set.
+        """
         try:
-            query = select(Workflow).offset(skip).limit(limit)
-            if include_tasks:
-                query = query.options(selectinload(Workflow.tasks))
-
-            result = await self.session.exec(query)
-            workflows = result.all()
+            query = select(Workflow).order_by(
+                Workflow.created_at.desc(), Workflow.id.desc()
+            )
+            if after is not None:
+                query = query.where(tuple_(Workflow.created_at, Workflow.id) < after)
+            else:
+                query = query.offset(skip)
+            query = query.limit(limit).execution_options(yield_per=LIST_BATCH_SIZE)
+            query = query.options(
+                _TASKS_WITHOUT_RESULT if include_tasks else raiseload("*")
+            )
+
+            result = await self.session.stream(query)
+            workflows = [workflow async for workflow in result.scalars()]
             logger.debug(f"Retrieved {len(workflows)} workflows")
             return list(workflows)
         except Exception as e:
             logger.error(f"Failed to get workflows: {e}")
             raise DatabaseError(f"Failed to get workflows: {str(e)}")
 
+    async def stream_all(self, batch_size: int = 100) -> AsyncIterator[Workflow]:
+        """
+        Stream every workflow with its tasks, newest first.
+
+        Rows are fetched from a server-side cursor in batches of batch_size,
+        and tasks are loaded once per batch.
+
+        Args:
+            batch_size: Number of workflows fetched per round trip
+        """
+        query = (
+            select(Workflow)
+            .options(_TASKS_WITHOUT_RESULT)
+            .order_by(Workflow.created_at.desc(), Workflow.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for workflow in result.scalars():
+            yield workflow
+
     async def update(self, workflow: Workflow) -> Workflow:
         """Update an existing workflow."""
         try:
             self.session.add(workflow)
             await self.session.commit()
-            await self.session.refresh(workflow)
             logger.info(f"Updated workflow: {workflow.id}")
             return workflow
         except Exception as e:
@@ -91,17 +175,30 @@ class WorkflowRepository:
             raise DatabaseError(f"Failed to update workflow: {str(e)}")
 
     async def delete(self, workflow_id: UUID) -> None:
-        """Delete a workflow."""
+        """
+        Delete a workflow.
+
+        Issues a single DELETE; the database removes the workflow's tasks,
+        variables, versions, schedule and history through ON DELETE CASCADE
+        foreign keys.
+        """
         try:
-            workflow = await self.get_by_id(workflow_id, include_tasks=False)
-            await self.session.delete(workflow)
+            result = await self.session.exec(
+                delete(Workflow).where(Workflow.id == workflow_id)
+            )
             await self.session.commit()
-            logger.info(f"Deleted workflow: {workflow_id}")
         except Exception as e:
             await self.session.rollback()
             logger.error(f"Failed to delete workflow {workflow_id}: {e}")
             raise DatabaseError(f"Failed to delete workflow: {str(e)}")
 
+        if result.rowcount == 0:
+            raise WorkflowNotFoundError(
+                f"Workflow {workflow_id} not found",
+                details={"workflow_id": str(workflow_id)},
+            )
+        logger.info(f"Deleted workflow: {workflow_id}")
+
 
 class TaskRepository:
     """Repository for Task entity operations."""
@@ -114,7 +211,6 @@ class TaskRepository:
         try:
             self.session.add(task)
             await self.session.commit()
-            await self.session.refresh(task)
             logger.info(f"Created task: {task.id}")
             return task
         except Exception as e:
@@ -123,15 +219,17 @@ class TaskRepository:
             raise DatabaseError(f"Failed to create task: {str(e)}")
 
     async def create_many(self, tasks: list[Task]) -> list[Task]:
-        """Create multiple tasks."""
+        """
+        Create multiple tasks.
+
+        The rows are sent as one batched INSERT. Every column has a
+        client-side default and sessions keep attributes after commit, so
+        the tasks are returned as built, without reloading them.
+        """
         try:
-            for task in tasks:
-                self.session.add(task)
+            self.session.add_all(tasks)
             await self.session.commit()
 
-            for task in tasks:
-                await self.session.refresh(task)
-
             logger.info(f"Created {len(tasks)} tasks")
             return tasks
         except Exception as e:
@@ -144,7 +242,6 @@ class TaskRepository:
         try:
             self.session.add(task)
             await self.session.commit()
-            await self.session.refresh(task)
             logger.debug(f"Updated task: {task.id}")
             return task
         except Exception as e:
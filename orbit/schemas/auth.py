@@ -61,6 +61,23 @@ class UserRead(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CurrentUser(BaseModel):
+    """Immutable snapshot of the authenticated user, shared between requests."""
+
+    id: UUID
+    email: str
+    username: str
+    full_name: str | None = None
+    is_active: bool
+    is_superuser: bool
+    roles: tuple[str, ...] = ()
+    created_at: datetime
+    updated_at: datetime
+    last_login: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class UserLogin(BaseModel):
     """User login schema."""
 
@@ -2,11 +2,13 @@
 Pydantic schemas for workflow schedules.
 """
 
+from datetime import datetime
 from uuid import UUID
 
-from croniter import croniter
 from pydantic import BaseModel, Field, field_validator
 
+from orbit.models.schedule import WorkflowSchedule
+
 
 class ScheduleCreate(BaseModel):
     """Schema for creating a workflow schedule."""
@@ -21,11 +23,9 @@ class ScheduleCreate(BaseModel):
     @classmethod
     def validate_cron(cls, v: str) -> str:
         """Validate cron expression."""
-        try:
-            croniter(v)
-            return v
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Invalid cron expression: {v}") from e
+        if not WorkflowSchedule.validate_cron_expression(v):
+            raise ValueError(f"Invalid cron expression: {v}")
+        return v
 
 
 class ScheduleUpdate(BaseModel):
@@ -41,12 +41,8 @@ class ScheduleUpdate(BaseModel):
     @classmethod
     def validate_cron(cls, v: str | None) -> str | None:
         """Validate cron expression if provided."""
-        if v is not None:
-            try:
-                croniter(v)
-                return v
-            except (ValueError, KeyError) as e:
-                raise ValueError(f"Invalid cron expression: {v}") from e
+        if v is not None and not WorkflowSchedule.validate_cron_expression(v):
+            raise ValueError(f"Invalid cron expression: {v}")
         return v
 
 
@@ -58,8 +54,8 @@ class ScheduleRead(BaseModel):
     cron_expression: str
     timezone: str
     enabled: bool
-    next_run: str | None = None
-    last_run: str | None = None
+    next_run: datetime | None = None
+    last_run: datetime | None = None
 
     class Config:
         from_attributes = True
@@ -26,9 +26,9 @@ class TemplateCreate(BaseModel):
     name: str = Field(..., description="Template name")
     description: str = Field(..., description="Template description")
     template_data: dict[str, Any] = Field(..., description="Workflow definition with placeholders")
-    parameters: dict[str, Any] | None = Field(default={}, description="Parameter definitions")
+    parameters: dict[str, Any] | None = Field(default_factory=dict, description="Parameter definitions")
     category: str | None = None
-    tags: list[str] | None = Field(default=[])
+    tags: list[str] | None = Field(default_factory=list)
 
 
 class TemplateUpdate(BaseModel):
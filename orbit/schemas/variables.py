@@ -6,6 +6,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+# Placeholder returned in place of secret values
+MASKED = "***ENCRYPTED***"
+
 
 class VariableCreate(BaseModel):
     """Schema for creating a variable."""
@@ -54,7 +57,7 @@ class SecretRead(BaseModel):
 
     id: UUID
     key: str
-    value_masked: str = Field(default="***ENCRYPTED***", description="Masked value")
+    value_masked: str = Field(default=MASKED, description="Masked value")
     description: str | None = None
 
     class Config:
@@ -9,8 +9,8 @@ from orbit.core.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
 )
 from orbit.core.exceptions import AuthenticationError
 from orbit.core.logging import get_logger
@@ -41,7 +41,7 @@ class AuthService:
         user = User(
             email=user_data.email,
             username=user_data.username,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await get_password_hash_async(user_data.password),
             full_name=user_data.full_name,
             is_active=user_data.is_active,
             is_superuser=user_data.is_superuser,
@@ -57,7 +57,7 @@ class AuthService:
         if not user:
             raise AuthenticationError("Incorrect username or password")
 
-        if not verify_password(login_data.password, user.hashed_password):
+        if not await verify_password_async(login_data.password, user.hashed_password):
             raise AuthenticationError("Incorrect username or password")
 
         if not user.is_active:
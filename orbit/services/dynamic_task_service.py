@@ -4,18 +4,22 @@ Implements map-reduce patterns for parallel processing.
 """
 
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
 
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
-from orbit.models.dynamic_tasks import DynamicTaskGroup
+from orbit.models.dynamic_tasks import DynamicTaskGroup, DynamicTaskItem
 
 logger = get_logger("services.dynamic_tasks")
 
+# Map items fetched per round trip while dispatching a group
+ITEM_BATCH_SIZE = 500
+
 
 class DynamicTaskService:
     """
@@ -49,14 +53,16 @@ class DynamicTaskService:
             workflow_id=workflow_id,
             parent_task_name=parent_task_name,
             task_type="map",
-            items=items,
             task_template=task_template,
             total_tasks=len(items),
         )
 
         self.session.add(task_group)
+        self.session.add_all(
+            DynamicTaskItem(group_id=task_group.id, index=idx, payload=item)
+            for idx, item in enumerate(items)
+        )
         await self.session.commit()
-        await self.session.refresh(task_group)
 
         logger.info(
             f"Created map task group: {parent_task_name} with {len(items)} items"
@@ -92,14 +98,21 @@ class DynamicTaskService:
         self.session.add(task_group)
         await self.session.commit()
 
-        # Execute all items in parallel
+        # Execute all items in parallel, starting each one as its batch arrives
         tasks = []
-        for idx, item in enumerate(task_group.items):
-            # Interpolate template with item
-            task_config = self._interpolate_template(
-                task_group.task_template, {"item": item, "index": idx}
-            )
-            tasks.append(executor_func(task_config))
+        try:
+            async for idx, item in self._iter_map_items(task_group):
+                # Interpolate template with item
+                task_config = self._interpolate_template(
+                    task_group.task_template, {"item": item, "index": idx}
+                )
+                tasks.append(asyncio.ensure_future(executor_func(task_config)))
+        except BaseException:
+            # Don't leave already-started items running if the item stream fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         # Wait for all tasks to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -111,7 +124,7 @@ class DynamicTaskService:
             str(r) if isinstance(r, Exception) else r for r in results
         ]
         task_group.status = "completed" if task_group.failed_tasks == 0 else "failed"
-        task_group.completed_at = datetime.utcnow()
+        task_group.completed_at = utcnow()
 
         self.session.add(task_group)
         await self.session.commit()
@@ -122,6 +135,36 @@ class DynamicTaskService:
 
         return task_group.results
 
+    async def _iter_map_items(
+        self, task_group: DynamicTaskGroup
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """
+        Yield a map group's items in order, ITEM_BATCH_SIZE rows at a time.
+
+        Groups created before items moved to DynamicTaskItem still carry
+        them inline and are read from the group row.
+
+        Args:
+            task_group: Map task group
+
+        Yields:
+            (index, item) pairs
+        """
+        if task_group.items is not None:
+            for idx, item in enumerate(task_group.items):
+                yield idx, item
+            return
+
+        statement = (
+            select(DynamicTaskItem.index, DynamicTaskItem.payload)
+            .where(DynamicTaskItem.group_id == task_group.id)
+            .order_by(DynamicTaskItem.index)
+            .execution_options(yield_per=ITEM_BATCH_SIZE)
+        )
+        result = await self.session.stream(statement)
+        async for idx, payload in result:
+            yield idx, payload
+
     async def create_reduce_task(
         self,
         workflow_id: UUID,
@@ -152,7 +195,6 @@ class DynamicTaskService:
 
         self.session.add(task_group)
         await self.session.commit()
-        await self.session.refresh(task_group)
 
         logger.info(f"Created reduce task: {parent_task_name}")
 
@@ -200,7 +242,7 @@ class DynamicTaskService:
             task_group.status = "failed"
             task_group.results = [str(e)]
 
-        task_group.completed_at = datetime.utcnow()
+        task_group.completed_at = utcnow()
         self.session.add(task_group)
         await self.session.commit()
 
@@ -273,7 +315,11 @@ class DynamicTaskService:
             "total_tasks": task_group.total_tasks,
             "completed_tasks": task_group.completed_tasks,
             "failed_tasks": task_group.failed_tasks,
-            "progress_percentage": task_group.progress_percentage(),
+            "progress_percentage": (
+                task_group.progress
+                if task_group.progress is not None
+                else task_group.progress_percentage()
+            ),
             "created_at": task_group.created_at.isoformat(),
             "completed_at": (
                 task_group.completed_at.isoformat() if task_group.completed_at else None
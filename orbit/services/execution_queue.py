@@ -0,0 +1,70 @@
+"""
+Workflow execution queue.
+Hands workflow runs to the arq worker when Redis is configured, otherwise
+runs them in-process after the response is sent.
+"""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from fastapi import BackgroundTasks
+
+from orbit.core.logging import get_logger
+from orbit.db.session import AsyncSessionLocal
+from orbit.services.task_runner import TaskRunner
+from orbit.services.websocket_manager import ConnectionManager, ws_manager
+
+logger = get_logger("services.execution_queue")
+
+# arq Redis pool; set during application startup when REDIS_URL is configured
+_queue_pool: Any | None = None
+
+# Strong references to in-process runs started without BackgroundTasks
+_local_runs: set[asyncio.Task] = set()
+
+
+def set_queue_pool(pool: Any | None) -> None:
+    """Set the arq pool used to enqueue workflow executions."""
+    global _queue_pool
+    _queue_pool = pool
+
+
+async def execute_workflow_task(
+    workflow_id: UUID, manager: ConnectionManager = ws_manager
+):
+    """
+    Execute a workflow with its own database session.
+
+    Args:
+        workflow_id: Workflow UUID
+        manager: Receives the run's progress broadcasts; workers pass a
+            RedisEventPublisher so API processes can relay them
+    """
+    async with AsyncSessionLocal() as session:
+        runner = TaskRunner(session, manager)
+        try:
+            await runner.execute_workflow(workflow_id)
+        except Exception as e:
+            logger.error(f"Workflow execution failed: {e}")
+
+
+async def enqueue_workflow_execution(
+    workflow_id: UUID, background_tasks: BackgroundTasks | None = None
+) -> None:
+    """
+    Queue a workflow for execution.
+
+    Args:
+        workflow_id: Workflow UUID
+        background_tasks: Request background tasks used when no worker
+            queue is configured; without them the run is started as a task
+    """
+    if _queue_pool is not None:
+        await _queue_pool.enqueue_job("execute_workflow_job", str(workflow_id))
+    elif background_tasks is not None:
+        background_tasks.add_task(execute_workflow_task, workflow_id)
+    else:
+        task = asyncio.create_task(execute_workflow_task(workflow_id))
+        _local_runs.add(task)
+        task.add_done_callback(_local_runs.discard)
@@ -5,13 +5,14 @@ Prevents duplicate executions and caches results.
 
 import hashlib
 import json
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import or_
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
 from orbit.models.idempotency import IdempotencyKey
 
@@ -72,10 +73,16 @@ class IdempotencyService:
         Returns:
             Tuple of (is_duplicate, existing_record)
         """
+        # Expired keys are filtered out in the query rather than loaded and
+        # checked here; cleanup_expired() removes them
         statement = select(IdempotencyKey).where(
             IdempotencyKey.workflow_id == workflow_id,
             IdempotencyKey.task_name == task_name,
             IdempotencyKey.key == idempotency_key,
+            or_(
+                IdempotencyKey.expires_at.is_(None),
+                IdempotencyKey.expires_at > utcnow(),
+            ),
         )
 
         result = await self.session.exec(statement)
@@ -84,13 +91,6 @@ class IdempotencyService:
         if not existing:
             return False, None
 
-        # Check if expired
-        if existing.is_expired():
-            logger.info(f"Idempotency key expired: {idempotency_key}")
-            await self.session.delete(existing)
-            await self.session.commit()
-            return False, None
-
         # Check status
         if existing.status == "processing":
             logger.info(f"Task already processing: {idempotency_key}")
@@ -146,7 +146,6 @@ class IdempotencyService:
 
         self.session.add(record)
         await self.session.commit()
-        await self.session.refresh(record)
 
         logger.info(f"Created idempotency record: {idempotency_key}")
         return record
@@ -170,7 +169,7 @@ class IdempotencyService:
         if record:
             record.status = "completed"
             record.result = result
-            record.completed_at = datetime.utcnow()
+            record.completed_at = utcnow()
 
             self.session.add(record)
             await self.session.commit()
@@ -196,7 +195,7 @@ class IdempotencyService:
         if record:
             record.status = "failed"
             record.error_message = error_message
-            record.completed_at = datetime.utcnow()
+            record.completed_at = utcnow()
 
             self.session.add(record)
             await self.session.commit()
@@ -212,7 +211,7 @@ class IdempotencyService:
         """
         statement = select(IdempotencyKey).where(
             IdempotencyKey.expires_at.isnot(None),
-            IdempotencyKey.expires_at < datetime.utcnow(),
+            IdempotencyKey.expires_at < utcnow(),
         )
 
         result = await self.session.exec(statement)
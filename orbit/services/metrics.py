@@ -12,6 +12,8 @@ from prometheus_client import (
     generate_latest,
 )
 
+from orbit.core.cache import TTLCache
+
 # Workflow metrics
 workflow_executions_total = Counter(
     "orbit_workflow_executions_total",
@@ -66,11 +68,25 @@ database_queries_total = Counter(
 )
 
 
+# Rendered exposition text is shared by scrapes within this window
+METRICS_CACHE_TTL = 1.0
+
+_metrics_cache = TTLCache(maxsize=1, ttl=METRICS_CACHE_TTL)
+
+
 def get_metrics() -> Response:
     """
     Get Prometheus metrics in text format.
 
+    The encoded output is cached briefly so concurrent scrapers share
+    the formatting cost.
+
     Returns:
         Response with Prometheus metrics
     """
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    content = _metrics_cache.get("latest")
+    if content is None:
+        content = generate_latest()
+        _metrics_cache.set("latest", content)
+
+    return Response(content=content, media_type=CONTENT_TYPE_LATEST)
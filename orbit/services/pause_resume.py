@@ -3,12 +3,13 @@ Workflow pause/resume service.
 Provides manual control over workflow execution.
 """
 
-from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.exceptions import WorkflowNotFoundError
 from orbit.core.logging import get_logger
 from orbit.models.workflow import Workflow
@@ -20,6 +21,9 @@ class WorkflowControlService:
     """
     Service for pausing and resuming workflows.
     Provides manual control over workflow execution.
+
+    Sessions are created with expire_on_commit=False, so the workflows
+    returned after a commit already hold the values just written.
     """
 
     def __init__(self, session: AsyncSession):
@@ -40,7 +44,9 @@ class WorkflowControlService:
             ValueError: If workflow is not in a pausable state
         """
         # Get workflow
-        statement = select(Workflow).where(Workflow.id == workflow_id)
+        statement = (
+            select(Workflow).options(raiseload("*")).where(Workflow.id == workflow_id)
+        )
         result = await self.session.exec(statement)
         workflow = result.first()
 
@@ -63,12 +69,11 @@ class WorkflowControlService:
 
         # Pause workflow
         workflow.status = "paused"
-        workflow.paused_at = datetime.utcnow()
-        workflow.updated_at = datetime.utcnow()
+        workflow.paused_at = utcnow()
+        workflow.updated_at = utcnow()
 
         self.session.add(workflow)
         await self.session.commit()
-        await self.session.refresh(workflow)
 
         logger.info(f"Paused workflow {workflow_id}")
 
@@ -89,7 +94,9 @@ class WorkflowControlService:
             ValueError: If workflow is not paused
         """
         # Get workflow
-        statement = select(Workflow).where(Workflow.id == workflow_id)
+        statement = (
+            select(Workflow).options(raiseload("*")).where(Workflow.id == workflow_id)
+        )
         result = await self.session.exec(statement)
         workflow = result.first()
 
@@ -115,11 +122,10 @@ class WorkflowControlService:
         else:
             workflow.status = "pending"
 
-        workflow.updated_at = datetime.utcnow()
+        workflow.updated_at = utcnow()
 
         self.session.add(workflow)
         await self.session.commit()
-        await self.session.refresh(workflow)
 
         logger.info(f"Resumed workflow {workflow_id}")
 
@@ -140,7 +146,9 @@ class WorkflowControlService:
             ValueError: If workflow is already completed or failed
         """
         # Get workflow
-        statement = select(Workflow).where(Workflow.id == workflow_id)
+        statement = (
+            select(Workflow).options(raiseload("*")).where(Workflow.id == workflow_id)
+        )
         result = await self.session.exec(statement)
         workflow = result.first()
 
@@ -159,11 +167,10 @@ class WorkflowControlService:
 
         # Cancel workflow
         workflow.status = "cancelled"
-        workflow.updated_at = datetime.utcnow()
+        workflow.updated_at = utcnow()
 
         self.session.add(workflow)
         await self.session.commit()
-        await self.session.refresh(workflow)
 
         logger.info(f"Cancelled workflow {workflow_id}")
 
@@ -182,7 +189,9 @@ class WorkflowControlService:
         Raises:
             WorkflowNotFoundError: If workflow doesn't exist
         """
-        statement = select(Workflow).where(Workflow.id == workflow_id)
+        statement = (
+            select(Workflow).options(raiseload("*")).where(Workflow.id == workflow_id)
+        )
         result = await self.session.exec(statement)
         workflow = result.first()
 
@@ -4,11 +4,12 @@ Manages periodic workflow execution based on cron schedules.
 """
 
 import asyncio
-from datetime import datetime
 
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
 from orbit.models.schedule import WorkflowSchedule
 from orbit.models.workflow import Workflow
@@ -89,7 +90,7 @@ class WorkflowScheduler:
         Args:
             session: Database session
         """
-        now = datetime.utcnow()
+        now = utcnow()
 
         # Find all enabled schedules that are due
         statement = (
@@ -125,8 +126,10 @@ class WorkflowScheduler:
             schedule: Workflow schedule
         """
         # Verify workflow exists
-        workflow_statement = select(Workflow).where(
-            Workflow.id == schedule.workflow_id
+        workflow_statement = (
+            select(Workflow)
+            .options(raiseload("*"))
+            .where(Workflow.id == schedule.workflow_id)
         )
         workflow_result = await session.exec(workflow_statement)
         workflow = workflow_result.first()
@@ -144,7 +147,7 @@ class WorkflowScheduler:
                 f"Workflow {workflow.id} is already running, skipping scheduled execution"
             )
             # Still update next_run to prevent repeated attempts
-            schedule.last_run = datetime.utcnow()
+            schedule.last_run = utcnow()
             schedule.update_next_run()
             session.add(schedule)
             await session.commit()
@@ -153,16 +156,16 @@ class WorkflowScheduler:
         logger.info(f"Executing scheduled workflow: {workflow.name} ({workflow.id})")
 
         # Trigger workflow execution (this will be handled by existing execution logic)
-        from orbit.api.v1.endpoints.workflows import execute_workflow_task
+        from orbit.services.execution_queue import enqueue_workflow_execution
 
         # Update schedule
-        schedule.last_run = datetime.utcnow()
+        schedule.last_run = utcnow()
         schedule.update_next_run()
         session.add(schedule)
         await session.commit()
 
         # Execute workflow in background
-        asyncio.create_task(execute_workflow_task(workflow.id))
+        await enqueue_workflow_execution(workflow.id)
 
         logger.info(
             f"Scheduled workflow {workflow.name} triggered. Next run: {schedule.next_run}"
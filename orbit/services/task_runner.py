@@ -1,5 +1,4 @@
 import asyncio
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -7,8 +6,9 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
-from orbit.models.retry_policy import RetryPolicy
+from orbit.models.retry_policy import make_retry_policy
 from orbit.models.workflow import Task, Workflow
 from orbit.services import metrics
 from orbit.services.dag_executor import DAGExecutor
@@ -35,7 +35,7 @@ class TaskRunner:
         Args:
             workflow_id: UUID of the workflow to execute
         """
-        start_time = datetime.utcnow()
+        start_time = utcnow()
 
         # Load workflow with tasks
         statement = (
@@ -51,7 +51,7 @@ class TaskRunner:
 
         # Update workflow status
         workflow.status = "running"
-        workflow.updated_at = datetime.utcnow()
+        workflow.updated_at = utcnow()
         self.session.add(workflow)
         await self.session.commit()
         await self.ws_manager.broadcast(
@@ -87,7 +87,7 @@ class TaskRunner:
 
             # Mark workflow as completed
             workflow.status = "completed"
-            workflow.updated_at = datetime.utcnow()
+            workflow.updated_at = utcnow()
             self.session.add(workflow)
             await self.session.commit()
             await self.ws_manager.broadcast(
@@ -95,7 +95,7 @@ class TaskRunner:
             )
 
             # Track metrics
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = (utcnow() - start_time).total_seconds()
             metrics.workflow_executions_total.labels(
                 workflow_name=workflow.name, status="completed"
             ).inc()
@@ -107,7 +107,7 @@ class TaskRunner:
         except Exception as e:
             # Mark workflow as failed
             workflow.status = "failed"
-            workflow.updated_at = datetime.utcnow()
+            workflow.updated_at = utcnow()
             self.session.add(workflow)
             await self.session.commit()
             await self.ws_manager.broadcast(
@@ -115,7 +115,7 @@ class TaskRunner:
             )
 
             # Track metrics
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = (utcnow() - start_time).total_seconds()
             metrics.workflow_executions_total.labels(
                 workflow_name=workflow.name, status="failed"
             ).inc()
@@ -133,7 +133,7 @@ class TaskRunner:
             task: Task object to execute
         """
         # Parse retry policy
-        retry_policy = RetryPolicy(**task.retry_policy) if task.retry_policy else RetryPolicy()
+        retry_policy = make_retry_policy(**(task.retry_policy or {}))
 
         last_error = None
 
@@ -158,7 +158,7 @@ class TaskRunner:
                     # No more retries
                     task.status = "failed"
                     task.result = {"error": "Task timed out", "attempts": attempt + 1}
-                    task.updated_at = datetime.utcnow()
+                    task.updated_at = utcnow()
                     self.session.add(task)
                     await self.session.commit()
                     await self.ws_manager.broadcast(
@@ -189,7 +189,7 @@ class TaskRunner:
                     # No more retries
                     task.status = "failed"
                     task.result = {"error": str(e), "attempts": attempt + 1}
-                    task.updated_at = datetime.utcnow()
+                    task.updated_at = utcnow()
                     self.session.add(task)
                     await self.session.commit()
                     await self.ws_manager.broadcast(
@@ -218,10 +218,10 @@ class TaskRunner:
         Args:
             task: Task object to execute
         """
-        task_start_time = datetime.utcnow()
+        task_start_time = utcnow()
         # Update task status to running
         task.status = "running"
-        task.updated_at = datetime.utcnow()
+        task.updated_at = utcnow()
         self.session.add(task)
         await self.session.commit()
         await self.ws_manager.broadcast(
@@ -243,7 +243,7 @@ class TaskRunner:
             # Update task with result
             task.status = "completed"
             task.result = result
-            task.updated_at = datetime.utcnow()
+            task.updated_at = utcnow()
             self.session.add(task)
             await self.session.commit()
             await self.ws_manager.broadcast(
@@ -256,7 +256,7 @@ class TaskRunner:
             )
 
             # Track metrics
-            task_duration = (datetime.utcnow() - task_start_time).total_seconds()
+            task_duration = (utcnow() - task_start_time).total_seconds()
             metrics.task_executions_total.labels(
                 task_name=task.name, status="completed"
             ).inc()
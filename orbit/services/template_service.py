@@ -3,13 +3,13 @@ Workflow template service.
 Manages reusable workflow templates with parameterization.
 """
 
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
 from orbit.models.templates import WorkflowTemplate
 from orbit.schemas.workflow import WorkflowCreate
@@ -60,7 +60,6 @@ class TemplateService:
 
         self.session.add(template)
         await self.session.commit()
-        await self.session.refresh(template)
 
         logger.info(f"Created template: {name}")
         return template
@@ -145,11 +144,11 @@ class TemplateService:
         if workflow_name:
             workflow_data["name"] = workflow_name
         else:
-            workflow_data["name"] = f"{template.name}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+            workflow_data["name"] = f"{template.name}-{utcnow().strftime('%Y%m%d-%H%M%S')}"
 
         # Update usage tracking
         template.usage_count += 1
-        template.last_used_at = datetime.utcnow()
+        template.last_used_at = utcnow()
         self.session.add(template)
         await self.session.commit()
 
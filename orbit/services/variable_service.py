@@ -41,7 +41,6 @@ class VariableService:
         )
         self.session.add(variable)
         await self.session.commit()
-        await self.session.refresh(variable)
         logger.info(f"Created workflow variable: {key} for workflow {workflow_id}")
         return variable
 
@@ -81,7 +80,7 @@ class VariableService:
         self, workflow_id: UUID, key: str, value: str, description: str | None = None
     ) -> WorkflowSecret:
         """Create an encrypted workflow secret."""
-        encrypted_value = encryption_service.encrypt(value)
+        encrypted_value = await encryption_service.encrypt_async(value)
         secret = WorkflowSecret(
             workflow_id=workflow_id,
             key=key,
@@ -90,7 +89,6 @@ class VariableService:
         )
         self.session.add(secret)
         await self.session.commit()
-        await self.session.refresh(secret)
         logger.info(f"Created workflow secret: {key} for workflow {workflow_id}")
         return secret
 
@@ -114,7 +112,7 @@ class VariableService:
 
         if secret:
             try:
-                return encryption_service.decrypt(secret.encrypted_value)
+                return await encryption_service.decrypt_async(secret.encrypted_value)
             except Exception as e:
                 logger.error(f"Failed to decrypt secret {key}: {e}")
                 return None
@@ -143,7 +141,6 @@ class VariableService:
         variable = GlobalVariable(key=key, value=value, description=description)
         self.session.add(variable)
         await self.session.commit()
-        await self.session.refresh(variable)
         logger.info(f"Created global variable: {key}")
         return variable
 
@@ -198,7 +195,9 @@ class VariableService:
                 secret = result_obj.first()
                 if secret:
                     try:
-                        value = encryption_service.decrypt(secret.encrypted_value)
+                        value = await encryption_service.decrypt_async(
+                            secret.encrypted_value
+                        )
                     except Exception as e:
                         logger.error(f"Failed to decrypt global secret {var_key}: {e}")
 
@@ -5,19 +5,49 @@ Manages version control for workflows with rollback capability.
 
 import hashlib
 import json
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy.orm import load_only
 from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from orbit.core.cache import TTLCache
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
 from orbit.models.versioning import WorkflowChangeLog, WorkflowVersion
 from orbit.models.workflow import Workflow
+from orbit.schemas.versioning import VersionRead
 
 logger = get_logger("services.versioning")
 
+# Active version per workflow, read on every execution start. Version writes
+# and workflow deletes in this process evict immediately; other workers keep
+# serving their entry until ACTIVE_VERSION_CACHE_TTL expires.
+ACTIVE_VERSION_CACHE_TTL = 30
+
+_active_version_cache = TTLCache(maxsize=1024, ttl=ACTIVE_VERSION_CACHE_TTL)
+
+
+def get_cached_active_version(workflow_id: UUID) -> VersionRead | None:
+    """Return the cached active version of a workflow, if any."""
+    return _active_version_cache.get(workflow_id)
+
+
+def cache_active_version(workflow_id: UUID, version: VersionRead) -> None:
+    """Cache the active version of a workflow."""
+    _active_version_cache.set(workflow_id, version)
+
+
+def forget_active_version(workflow_id: UUID) -> None:
+    """Evict a workflow's cached active version after it changes or is deleted."""
+    _active_version_cache.pop(workflow_id)
+
+
+def clear_active_version_cache() -> None:
+    """Drop all cached active versions."""
+    _active_version_cache.clear()
+
 
 class VersioningService:
     """
@@ -143,7 +173,7 @@ class VersioningService:
             is_active=not is_draft,
             is_draft=is_draft,
             checksum=checksum,
-            activated_at=datetime.utcnow() if not is_draft else None,
+            activated_at=utcnow() if not is_draft else None,
         )
 
         self.session.add(new_version)
@@ -164,7 +194,6 @@ class VersioningService:
 
         self.session.add(change_log)
         await self.session.commit()
-        await self.session.refresh(new_version)
 
         logger.info(
             f"Created version {version_number} for workflow {workflow.id} "
@@ -208,10 +237,24 @@ class VersioningService:
             limit: Maximum number of versions to return
 
         Returns:
-            List of WorkflowVersion ordered by version number (descending)
+            List of WorkflowVersion ordered by version number (descending),
+            loaded with summary columns only (workflow_data is not fetched)
         """
         statement = (
             select(WorkflowVersion)
+            .options(
+                load_only(
+                    WorkflowVersion.id,
+                    WorkflowVersion.version_number,
+                    WorkflowVersion.version_tag,
+                    WorkflowVersion.name,
+                    WorkflowVersion.change_summary,
+                    WorkflowVersion.changed_by,
+                    WorkflowVersion.is_active,
+                    WorkflowVersion.is_draft,
+                    WorkflowVersion.created_at,
+                )
+            )
             .where(WorkflowVersion.workflow_id == workflow_id)
             .order_by(desc(WorkflowVersion.version_number))
             .limit(limit)
@@ -256,6 +299,8 @@ class VersioningService:
         # Update workflow with target version data
         workflow.name = target_version.name
         workflow.description = target_version.description
+        # Conditional GETs compare against updated_at
+        workflow.updated_at = utcnow()
 
         # Note: Task restoration would require more complex logic
         # For now, we create a new version pointing to the old data
@@ -312,10 +357,19 @@ class VersioningService:
         Returns:
             Dictionary with differences between versions
         """
-        ver_a = await self.get_version(workflow_id, version_a)
-        ver_b = await self.get_version(workflow_id, version_b)
+        # Fetch both sides in one query
+        statement = select(
+            WorkflowVersion.version_number, WorkflowVersion.workflow_data
+        ).where(
+            WorkflowVersion.workflow_id == workflow_id,
+            WorkflowVersion.version_number.in_((version_a, version_b)),
+        )
+        result = await self.session.exec(statement)
+        data_by_version = dict(result.all())
 
-        if not ver_a or not ver_b:
+        if version_a not in data_by_version or version_b not in data_by_version:
             raise ValueError("One or both versions not found")
 
-        return self._calculate_diff(ver_a.workflow_data, ver_b.workflow_data)
+        return self._calculate_diff(
+            data_by_version[version_a], data_by_version[version_b]
+        )
@@ -4,14 +4,14 @@ Sends HTTP webhooks on workflow events.
 """
 
 import asyncio
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 import httpx
 
+from orbit.core.clock import utcnow
 from orbit.core.logging import get_logger
-from orbit.models.retry_policy import RetryPolicy
+from orbit.models.retry_policy import RetryPolicy, make_retry_policy
 
 logger = get_logger("services.webhooks")
 
@@ -45,11 +45,11 @@ class WebhookService:
             True if successful, False otherwise
         """
         if retry_policy is None:
-            retry_policy = RetryPolicy(max_retries=3, initial_delay=1.0)
+            retry_policy = make_retry_policy(max_retries=3, initial_delay=1.0)
 
         webhook_payload = {
             "event_type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utcnow().isoformat(),
             "data": payload,
         }
 
@@ -1,8 +1,21 @@
+import asyncio
+import contextlib
 import json
 from typing import Any
 
 from fastapi import WebSocket
 
+from orbit.core.logging import get_logger
+
+logger = get_logger("services.websocket_manager")
+
+# Redis pub/sub channel carrying broadcasts from arq workers to API processes
+WORKFLOW_EVENTS_CHANNEL = "orbit:workflow-events"
+
+# Backoff between relay reconnect attempts, in seconds
+RELAY_RETRY_INITIAL_DELAY = 1.0
+RELAY_RETRY_MAX_DELAY = 30.0
+
 
 class ConnectionManager:
     """
@@ -11,6 +24,8 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: list[WebSocket] = []
+        # Strong references to fire-and-forget broadcasts until they finish
+        self._pending_broadcasts: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept and store a new WebSocket connection."""
@@ -28,17 +43,103 @@ class ConnectionManager:
         await websocket.send_text(json.dumps(message))
 
     async def broadcast(self, message: dict[str, Any]):
-        """Broadcast a message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception:
-                disconnected.append(connection)
+        """
+        Broadcast a message to all connected clients.
+
+        Sends run concurrently, so one slow client does not delay the
+        others; clients whose send fails are dropped.
+        """
+        if not self.active_connections:
+            return
+
+        await self.broadcast_text(json.dumps(message))
+
+    async def broadcast_text(self, payload: str):
+        """Broadcast an already serialized message to all connected clients."""
+        if not self.active_connections:
+            return
+
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for connection in disconnected:
-            self.active_connections.remove(connection)
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception) and connection in self.active_connections:
+                self.active_connections.remove(connection)
+
+    def broadcast_nowait(self, message: dict[str, Any]) -> None:
+        """Schedule a broadcast without waiting for delivery."""
+        task = asyncio.create_task(self.broadcast(message))
+        self._pending_broadcasts.add(task)
+        task.add_done_callback(self._pending_broadcasts.discard)
+
+
+class RedisEventPublisher(ConnectionManager):
+    """
+    Publishes broadcasts to Redis instead of local WebSocket clients.
+
+    Used by arq workers, which have no WebSocket clients of their own; API
+    processes relay the channel to their clients with relay_redis_events.
+    """
+
+    def __init__(self, redis: Any, channel: str = WORKFLOW_EVENTS_CHANNEL):
+        super().__init__()
+        self.redis = redis
+        self.channel = channel
+
+    async def broadcast(self, message: dict[str, Any]):
+        """Publish a message for the API processes to deliver."""
+        try:
+            await self.redis.publish(self.channel, json.dumps(message))
+        except Exception as e:
+            logger.warning(f"Failed to publish workflow event: {e}")
+
+
+async def relay_redis_events(
+    redis: Any,
+    manager: ConnectionManager,
+    channel: str = WORKFLOW_EVENTS_CHANNEL,
+) -> None:
+    """
+    Deliver messages published by workers to this process's WebSocket clients.
+
+    Runs until cancelled. A lost Redis connection is logged and the channel
+    is resubscribed with exponential backoff, so one disconnect does not end
+    the relay for the life of the process.
+
+    Args:
+        redis: redis.asyncio client (e.g. the arq pool)
+        manager: Manager whose clients receive the messages
+        channel: Pub/sub channel to subscribe to
+    """
+    delay = RELAY_RETRY_INITIAL_DELAY
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            delay = RELAY_RETRY_INITIAL_DELAY
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                await manager.broadcast_text(data)
+            logger.warning("Workflow event subscription ended; resubscribing")
+        except Exception as e:
+            logger.warning(
+                f"Workflow event relay failed: {e}; retrying in {delay:.1f}s"
+            )
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.unsubscribe(channel)
+                await pubsub.close()
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RELAY_RETRY_MAX_DELAY)
 
 
 # Global WebSocket manager instance
@@ -3,15 +3,18 @@ Workflow service layer.
 Handles business logic for workflow operations.
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
+from orbit.core.clock import frozen_utcnow, utcnow
 from orbit.core.exceptions import DAGValidationError
 from orbit.core.logging import get_logger
 from orbit.models.workflow import Task, Workflow
 from orbit.repositories.workflow_repository import TaskRepository, WorkflowRepository
 from orbit.schemas.workflow import WorkflowCreate
 from orbit.services.dag_executor import DAGExecutor
+from orbit.services.versioning_service import forget_active_version
 
 logger = get_logger("services.workflow")
 
@@ -30,38 +33,33 @@ class WorkflowService:
         """
         logger.info(f"Creating workflow: {workflow_data.name}")
 
-        # Create workflow entity
-        workflow = Workflow(
-            name=workflow_data.name, description=workflow_data.description
-        )
-        workflow = await self.workflow_repo.create(workflow)
-
-        # Create task entities
-        tasks = []
-        for task_data in workflow_data.tasks:
-            task = Task(
-                workflow_id=workflow.id,
-                name=task_data.name,
-                action_type=task_data.action_type,
-                action_payload=task_data.action_payload,
-                dependencies=task_data.dependencies,
+        # Build the workflow and its tasks with one shared creation timestamp
+        with frozen_utcnow():
+            workflow = Workflow(
+                name=workflow_data.name, description=workflow_data.description
             )
-            tasks.append(task)
 
-        # Validate DAG structure
+            tasks = []
+            for task_data in workflow_data.tasks:
+                task = Task(
+                    workflow_id=workflow.id,
+                    name=task_data.name,
+                    action_type=task_data.action_type,
+                    action_payload=task_data.action_payload,
+                    dependencies=task_data.dependencies,
+                )
+                tasks.append(task)
+
+        # Validate DAG structure before anything is written
         try:
             DAGExecutor.validate_dag(tasks)
         except ValueError as e:
             logger.error(f"DAG validation failed: {e}")
-            # Rollback workflow creation
-            await self.workflow_repo.delete(workflow.id)
             raise DAGValidationError(str(e), details={"workflow_id": str(workflow.id)})
 
-        # Create tasks
-        tasks = await self.task_repo.create_many(tasks)
-
-        # Reload workflow with tasks
-        workflow = await self.workflow_repo.get_by_id(workflow.id)
+        # Persist workflow and tasks in one transaction; tasks stay attached
+        # in memory, so no reload is needed for the response
+        workflow = await self.workflow_repo.create_with_tasks(workflow, tasks)
 
         logger.info(
             f"Successfully created workflow {workflow.id} with {len(tasks)} tasks"
@@ -73,10 +71,23 @@ class WorkflowService:
         logger.debug(f"Retrieving workflow: {workflow_id}")
         return await self.workflow_repo.get_by_id(workflow_id)
 
-    async def list_workflows(self, skip: int = 0, limit: int = 100) -> list[Workflow]:
-        """List all workflows with pagination."""
-        logger.debug(f"Listing workflows (skip={skip}, limit={limit})")
-        return await self.workflow_repo.get_all(skip=skip, limit=limit)
+    async def get_workflow_status(self, workflow_id: UUID) -> str:
+        """Get a workflow's status."""
+        return await self.workflow_repo.get_status(workflow_id)
+
+    async def list_workflows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Workflow]:
+        """List workflows, newest first, by offset or keyset position."""
+        logger.debug(f"Listing workflows (skip={skip}, limit={limit}, after={after})")
+        return await self.workflow_repo.get_all(skip=skip, limit=limit, after=after)
+
+    def stream_workflows(self) -> AsyncIterator[Workflow]:
+        """Stream all workflows with their tasks, newest first."""
+        return self.workflow_repo.stream_all()
 
     async def update_workflow_status(self, workflow_id: UUID, status: str) -> Workflow:
         """Update workflow status."""
@@ -84,7 +95,7 @@ class WorkflowService:
 
         workflow = await self.workflow_repo.get_by_id(workflow_id, include_tasks=False)
         workflow.status = status
-        workflow.updated_at = datetime.utcnow()
+        workflow.updated_at = utcnow()
 
         return await self.workflow_repo.update(workflow)
 
@@ -92,3 +103,4 @@ class WorkflowService:
         """Delete a workflow."""
         logger.info(f"Deleting workflow: {workflow_id}")
         await self.workflow_repo.delete(workflow_id)
+        forget_active_version(workflow_id)
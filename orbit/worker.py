@@ -0,0 +1,41 @@
+"""
+arq worker for workflow execution.
+
+Run with: arq orbit.worker.WorkerSettings
+"""
+
+from uuid import UUID
+
+from arq.connections import RedisSettings
+from prometheus_client import start_http_server
+
+from orbit.core.config import settings
+from orbit.core.logging import get_logger, setup_logging
+from orbit.services.execution_queue import execute_workflow_task
+from orbit.services.websocket_manager import RedisEventPublisher
+
+setup_logging()
+logger = get_logger("worker")
+
+
+async def startup(ctx: dict):
+    """Publish run progress to the API processes and expose worker metrics."""
+    ctx["events"] = RedisEventPublisher(ctx["redis"])
+    if settings.WORKER_METRICS_PORT:
+        start_http_server(settings.WORKER_METRICS_PORT)
+        logger.info(f"Worker metrics served on port {settings.WORKER_METRICS_PORT}")
+
+
+async def execute_workflow_job(ctx: dict, workflow_id: str):
+    """Execute a workflow enqueued by the API."""
+    await execute_workflow_task(UUID(workflow_id), ctx["events"])
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [execute_workflow_job]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL or "redis://localhost")
+    # Workflow runs are long-lived; let the DAG's own timeouts bound them
+    job_timeout = 3600
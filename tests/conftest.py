@@ -3,13 +3,17 @@ from typing import AsyncGenerator
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from orbit.db.session import get_session
+from orbit.api.v1.endpoints.templates import clear_template_cache
+from orbit.core.idempotency import clear_idempotency_cache
+from orbit.db.session import get_readonly_session, get_session
 from orbit.main import app
+from orbit.services.versioning_service import clear_active_version_cache
 
 # Use in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -50,9 +54,36 @@ async def client_fixture(session: AsyncSession) -> AsyncGenerator[AsyncClient, N
     def get_session_override():
         return session
 
+    # get_readonly_session runs in autocommit, so endpoints using it must issue
+    # a single statement; count each request's statements rather than letting
+    # the shared test session hide a multi-statement read
+    readonly_statement_counts: list[int] = []
+
+    async def get_readonly_session_override():
+        statements = 0
+
+        def count_statement(*args):
+            nonlocal statements
+            statements += 1
+
+        sync_engine = session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            yield session
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+            readonly_statement_counts.append(statements)
+
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_readonly_session] = get_readonly_session_override
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
+    assert all(count <= 1 for count in readonly_statement_counts), (
+        f"read-only session issued {readonly_statement_counts} statements"
+    )
+    clear_template_cache()
+    clear_active_version_cache()
+    clear_idempotency_cache()
@@ -0,0 +1,57 @@
+"""
+Tests for API router composition.
+"""
+
+import warnings
+
+import pytest
+from fastapi.openapi.utils import get_openapi
+from httpx import AsyncClient
+
+from orbit.core.responses import ORJSONResponse
+from orbit.main import app
+
+
+def test_routes_registered_once():
+    """Test no route is registered twice (FastAPI warns on duplicate operations)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+
+    assert "/api/v1/workflows/{workflow_id}/schedule" in schema["paths"]
+
+
+def test_default_response_class_is_orjson():
+    """Test routes without a response_model default to the orjson renderer."""
+    assert app.router.default_response_class is ORJSONResponse
+
+
+@pytest.mark.asyncio
+async def test_health_is_answered_before_routing(client: AsyncClient):
+    """Test /health is served by the outermost middleware, not the route."""
+    from orbit.core.health import HealthCheckMiddleware
+
+    assert app.user_middleware[0].cls is HealthCheckMiddleware
+
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert "X-RateLimit-Limit" not in response.headers
+
+    # Other paths still go through the full stack
+    response = await client.get("/")
+    assert response.headers["X-RateLimit-Limit"] == "100"
+
+
+@pytest.mark.asyncio
+async def test_constant_endpoints_return_precomputed_bodies(client: AsyncClient):
+    """Test / and the /health route return their fixed JSON documents."""
+    from orbit.main import health_check
+
+    response = await client.get("/")
+    assert response.status_code == 200
+    assert response.json()["status"] == "operational"
+    assert response.headers["content-type"] == "application/json"
+
+    route_response = await health_check()
+    assert route_response.body == b'{"status":"ok"}'
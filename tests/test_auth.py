@@ -29,6 +29,14 @@ def test_password_hashing():
     assert verify_password("wrongpassword", hashed) is False
 
 
+def test_password_hash_uses_tuned_argon2id():
+    """Test new hashes use argon2id with the configured cost parameters."""
+    hashed = get_password_hash("tuned-password")
+
+    assert hashed.startswith("$argon2id$")
+    assert "m=19456,t=2,p=1" in hashed
+
+
 def test_password_hash_uniqueness():
     """Test that same password produces different hashes."""
     password = "samepassword"
@@ -87,6 +95,24 @@ def test_decode_invalid_token():
     assert decoded is None
 
 
+def test_signed_token_is_standard_hs256():
+    """Test minted tokens carry a standard header and verify with PyJWT."""
+    import jwt
+
+    from orbit.core.config import settings
+
+    token = create_access_token({"sub": "std@example.com"})
+
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    assert payload["sub"] == "std@example.com"
+    assert isinstance(payload["exp"], int)
+
+    header, _, signature = token.split(".")
+    other = create_access_token({"sub": "other@example.com"}).split(".")[1]
+    assert decode_token(f"{header}.{other}.{signature}") is None
+
+
 def test_token_types():
     """Test access and refresh token types."""
     data = {"sub": "user@example.com"}
@@ -123,6 +149,14 @@ def test_verify_api_key():
     assert verify_api_key("wrongkey", key_hash) is False
 
 
+def test_verify_api_key_raw_digest_and_malformed_hash():
+    """Test raw digests verify and malformed stored hashes are rejected."""
+    key, key_hash = generate_api_key()
+
+    assert verify_api_key(key, bytes.fromhex(key_hash)) is True
+    assert verify_api_key(key, "not-hex") is False
+
+
 def test_check_permissions_admin():
     """Test admin has all permissions."""
     user_roles = ["admin"]
@@ -170,3 +204,32 @@ def test_check_scopes_partial_match():
 
     # User needs ALL required scopes
     assert check_scopes(user_scopes, required_scopes) is False
+
+
+def test_user_cache_is_bounded_by_token_exp():
+    """Test user snapshots are cached per token, never past the token's exp."""
+    import time
+    from datetime import datetime
+    from uuid import uuid4
+
+    from orbit.core.auth import cache_user, get_cached_user
+    from orbit.schemas.auth import CurrentUser
+
+    now = datetime(2024, 1, 1)
+    user = CurrentUser(
+        id=uuid4(),
+        email="snap@example.com",
+        username="snap",
+        is_active=True,
+        is_superuser=False,
+        created_at=now,
+        updated_at=now,
+    )
+    token = create_access_token({"sub": "snap"})
+    expired = create_access_token({"sub": "snap-expired"})
+
+    cache_user(token, user, time.time() + 60)
+    cache_user(expired, user, time.time() - 1)
+
+    assert get_cached_user(token) is user
+    assert get_cached_user(expired) is None
@@ -24,6 +24,23 @@ async def test_register_user(client: AsyncClient):
     assert "password" not in data
 
 
+@pytest.mark.asyncio
+async def test_register_rejects_email_differing_only_in_case(client: AsyncClient):
+    """Test email uniqueness ignores case."""
+    url = f"{settings.API_V1_STR}/auth/register"
+    first = await client.post(
+        url,
+        json={"email": "Case@Example.com", "username": "case1", "password": "pw123456"},
+    )
+    assert first.status_code == 201
+
+    second = await client.post(
+        url,
+        json={"email": "case@example.com", "username": "case2", "password": "pw123456"},
+    )
+    assert second.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_login_user(client: AsyncClient):
     """Test user login."""
@@ -2,10 +2,71 @@
 Tests for authentication middleware.
 """
 
+import inspect
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
 
 from orbit.core.config import settings
+from orbit.core.middleware import (
+    get_current_active_user,
+    get_current_superuser,
+    get_current_user,
+    require_roles,
+)
+from orbit.db.session import get_session
+from orbit.models.auth import User
+
+
+def test_auth_dependencies_are_async():
+    """Auth dependencies must be async so FastAPI doesn't run them in a threadpool."""
+    assert inspect.iscoroutinefunction(get_current_user)
+    assert inspect.iscoroutinefunction(get_current_active_user)
+    assert inspect.iscoroutinefunction(get_current_superuser)
+    assert inspect.iscoroutinefunction(require_roles(["admin"]))
+    assert inspect.isasyncgenfunction(get_session)
+
+
+@pytest.mark.asyncio
+async def test_require_roles():
+    """Test role checks accept any required role and always admit admins."""
+    checker = require_roles(["editor", "publisher"])
+
+    def make_user(roles: list[str]) -> User:
+        return User(
+            email="r@example.com", username="r", hashed_password="x", roles=roles
+        )
+
+    editor = make_user(["viewer", "editor"])
+    assert await checker(current_user=editor) is editor
+    admin = make_user(["admin"])
+    assert await checker(current_user=admin) is admin
+
+    with pytest.raises(HTTPException) as exc_info:
+        await checker(current_user=make_user(["viewer"]))
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Required roles: editor, publisher"
+
+
+@pytest.mark.asyncio
+async def test_require_roles_specialized_shapes():
+    """Test the single-role and no-role checkers."""
+
+    def make_user(roles: list[str]) -> User:
+        return User(
+            email="r@example.com", username="r", hashed_password="x", roles=roles
+        )
+
+    single = require_roles(["editor"])
+    assert await single(current_user=make_user(["admin"])) is not None
+    assert await single(current_user=make_user(["editor"])) is not None
+    with pytest.raises(HTTPException) as exc_info:
+        await single(current_user=make_user(["viewer"]))
+    assert exc_info.value.detail == "Required roles: editor"
+
+    anyone = make_user([])
+    assert await require_roles([])(current_user=anyone) is anyone
 
 
 @pytest.mark.asyncio
@@ -89,3 +150,40 @@ async def test_oauth2_token_endpoint(client: AsyncClient):
     assert "access_token" in data
     assert "refresh_token" in data
     assert data["token_type"] == "bearer"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_caches_frozen_snapshot(client: AsyncClient):
+    """Test the per-token cache holds an immutable snapshot, not the ORM row."""
+    from pydantic import ValidationError
+
+    from orbit.core.auth import get_cached_user
+    from orbit.schemas.auth import CurrentUser
+
+    await client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={
+            "email": "snapshot@example.com",
+            "username": "snapshotuser",
+            "password": "password123",
+            "roles": ["editor"],
+        },
+    )
+    login_response = await client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        json={"username": "snapshotuser", "password": "password123"},
+    )
+    access_token = login_response.json()["access_token"]
+
+    me_response = await client.get(
+        f"{settings.API_V1_STR}/auth/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert me_response.json()["roles"] == ["editor"]
+
+    cached = get_cached_user(access_token)
+    assert isinstance(cached, CurrentUser)
+    assert not isinstance(cached, User)
+    assert cached.roles == ("editor",)
+    with pytest.raises(ValidationError):
+        cached.is_active = False
@@ -0,0 +1,68 @@
+"""
+Tests for in-process caching utilities.
+"""
+
+import time
+
+from orbit.core.cache import TTLCache
+
+
+def test_ttl_cache_get_set():
+    """Test basic get/set behavior."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+
+
+def test_ttl_cache_expiry():
+    """Test entries expire after their TTL."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_maxsize():
+    """Test oldest entries are evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_pop_and_clear():
+    """Test explicit removal."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert "a" not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_metrics_output_is_cached():
+    """Test metrics text is reused within the cache window."""
+    from orbit.services import metrics
+
+    metrics._metrics_cache.clear()
+    first = metrics.get_metrics().body
+
+    metrics.task_retries_total.labels(task_name="cache-test").inc()
+    assert metrics.get_metrics().body == first
+
+    metrics._metrics_cache.clear()
+    assert b"cache-test" in metrics.get_metrics().body
@@ -0,0 +1,45 @@
+"""
+Tests for clock helpers.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from orbit.core.clock import frozen_utcnow, utcnow
+from orbit.models.workflow import Task, Workflow
+
+
+def test_utcnow_is_naive_utc():
+    """Test timestamps match the schema's naive-UTC convention."""
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = utcnow()
+    assert now.tzinfo is None
+    assert before <= now <= datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def test_frozen_utcnow_shares_one_timestamp():
+    """Test rows built in a frozen block get identical timestamps."""
+    with frozen_utcnow() as frozen:
+        workflow = Workflow(name="Frozen")
+        task = Task(name="t", action_type="http", workflow_id=workflow.id)
+        assert utcnow() is frozen
+
+    assert workflow.created_at == workflow.updated_at == task.created_at == frozen
+    assert utcnow() is not frozen
+
+
+@pytest.mark.asyncio
+async def test_service_timestamps_use_shared_clock(session: AsyncSession):
+    """Test service writes read time through orbit.core.clock."""
+    from orbit.services.pause_resume import WorkflowControlService
+
+    workflow = Workflow(name="Clocked", status="running")
+    session.add(workflow)
+    await session.commit()
+
+    with frozen_utcnow() as frozen:
+        paused = await WorkflowControlService(session).pause_workflow(workflow.id)
+
+    assert paused.paused_at == paused.updated_at == frozen
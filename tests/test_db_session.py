@@ -0,0 +1,67 @@
+"""
+Tests for database engine configuration.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from orbit.core.config import settings
+from orbit.db.session import _engine_options, _json_dumps
+from orbit.db.types import JSONType
+
+
+def test_engine_options_sqlite_uses_defaults():
+    """Test SQLite keeps SQLAlchemy's default pool."""
+    assert _engine_options("sqlite+aiosqlite:///:memory:") == {}
+
+
+def test_engine_options_postgres(monkeypatch):
+    """Test Postgres gets a sized queue pool, or NullPool behind PgBouncer."""
+    url = "postgresql+asyncpg://orbit@localhost/orbit"
+
+    options = _engine_options(url)
+    assert options["poolclass"] is AsyncAdaptedQueuePool
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"]["prepared_statement_cache_size"] == 512
+    assert options["connect_args"]["server_settings"]["jit"] == "off"
+
+    monkeypatch.setattr(settings, "DB_USE_NULL_POOL", True)
+    options = _engine_options(url)
+    assert options["poolclass"] is NullPool
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert "server_settings" not in options["connect_args"]
+
+
+def test_json_columns_use_jsonb_on_postgres():
+    """Test JSON columns compile to JSONB on Postgres and JSON on SQLite."""
+    assert JSONType.compile(dialect=postgresql.dialect()) == "JSONB"
+    assert JSONType.compile(dialect=sqlite.dialect()) == "JSON"
+
+
+def test_json_serializer_returns_text():
+    """Test the engine's JSON serializer yields str and accepts int keys."""
+    assert _json_dumps({"a": [1, 2], 3: None}) == '{"a":[1,2],"3":null}'
+
+
+def test_jsonb_gin_indexes_are_postgres_only():
+    """Test GIN indexes compile for Postgres and are skipped on SQLite."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.schema import CreateIndex
+    from sqlmodel import SQLModel
+
+    from orbit.models.versioning import WorkflowVersion
+
+    (index,) = (
+        ix for ix in WorkflowVersion.__table__.indexes if ix.name.endswith("_gin")
+    )
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING gin (workflow_data jsonb_path_ops)" in ddl
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.connect() as conn:
+        names = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE name LIKE '%\\_gin' ESCAPE '\\'"
+        ).all()
+    assert names == []
@@ -4,6 +4,9 @@ Tests for dynamic task generation (map-reduce).
 
 from uuid import uuid4
 
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from orbit.services.dynamic_task_service import DynamicTaskService
 
 
@@ -163,3 +166,100 @@ def test_array_processing_simulation():
     # Reduce: aggregate
     total_size = sum(p["processed_size"] for p in processed)
     assert total_size == 900
+
+
+@pytest.mark.asyncio
+async def test_progress_column_is_generated(session: AsyncSession):
+    """Test the stored progress column follows the task counters."""
+    from orbit.models.dynamic_tasks import DynamicTaskGroup
+    from orbit.models.workflow import Workflow
+
+    workflow = Workflow(name="Progress Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    task_group = DynamicTaskGroup(
+        workflow_id=workflow.id,
+        parent_task_name="map_numbers",
+        task_type="map",
+        items=[1, 2, 3, 4, 5],
+        task_template={},
+        total_tasks=5,
+    )
+    session.add(task_group)
+    await session.commit()
+    assert task_group.progress == 0.0
+
+    task_group.completed_tasks = 2
+    await session.commit()
+    assert task_group.progress == 40.0
+
+    status = await DynamicTaskService(session).get_task_group_status(task_group.id)
+    assert status["progress_percentage"] == 40.0
+
+
+@pytest.mark.asyncio
+async def test_map_items_are_streamed_from_item_rows(
+    session: AsyncSession, monkeypatch
+):
+    """Test map items are stored as rows and dispatched in index order."""
+    from orbit.models.workflow import Workflow
+    from orbit.services import dynamic_task_service
+
+    monkeypatch.setattr(dynamic_task_service, "ITEM_BATCH_SIZE", 2)
+
+    workflow = Workflow(name="Map Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    service = DynamicTaskService(session)
+    task_group = await service.create_map_tasks(
+        workflow.id, "double", [1, 2, 3, 4, 5], {"value": "{{item}}"}
+    )
+    assert task_group.items is None
+    assert task_group.total_tasks == 5
+
+    async def double(config):
+        return config["value"] * 2
+
+    results = await service.execute_map_tasks(task_group.id, double)
+    assert results == [2, 4, 6, 8, 10]
+    assert task_group.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_map_tasks_cancelled_when_item_stream_fails(
+    session: AsyncSession, monkeypatch
+):
+    """Test items already started are cancelled if reading the rest fails."""
+    import asyncio
+
+    from orbit.models.workflow import Workflow
+
+    workflow = Workflow(name="Failing Map Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    service = DynamicTaskService(session)
+    task_group = await service.create_map_tasks(
+        workflow.id, "hang", [1, 2], {"value": "{{item}}"}
+    )
+
+    async def failing_items(group):
+        yield 0, 1
+        await asyncio.sleep(0)
+        raise RuntimeError("item stream lost")
+
+    monkeypatch.setattr(service, "_iter_map_items", failing_items)
+
+    started: list[asyncio.Task] = []
+
+    async def hang(config):
+        started.append(asyncio.current_task())
+        await asyncio.Event().wait()
+
+    with pytest.raises(RuntimeError, match="item stream lost"):
+        await service.execute_map_tasks(task_group.id, hang)
+
+    assert len(started) == 1
+    assert started[0].cancelled()
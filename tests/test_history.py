@@ -0,0 +1,191 @@
+"""
+Tests for execution history endpoints.
+"""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from orbit.core.config import settings
+from orbit.models.execution_history import TaskExecution, WorkflowExecution
+from orbit.models.workflow import Task, Workflow
+
+
+async def _create_executions(session: AsyncSession, statuses: list[str]) -> Workflow:
+    """Create a workflow with one execution per given status."""
+    workflow = Workflow(name="History Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    for status in statuses:
+        session.add(
+            WorkflowExecution(
+                workflow_id=workflow.id,
+                workflow_name=workflow.name,
+                status=status,
+                duration_seconds=10.0 if status == "completed" else None,
+            )
+        )
+    await session.commit()
+    return workflow
+
+
+@pytest.mark.asyncio
+async def test_execution_stats(client: AsyncClient, session: AsyncSession):
+    """Test stats are aggregated per status."""
+    await _create_executions(
+        session, ["completed", "completed", "failed", "running", "cancelled"]
+    )
+
+    response = await client.get(f"{settings.API_V1_STR}/history/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_executions"] == 5
+    assert data["completed"] == 2
+    assert data["failed"] == 1
+    assert data["running"] == 1
+    assert data["cancelled"] == 1
+    assert data["success_rate"] == 40.0
+    assert data["average_duration_seconds"] == 10.0
+
+
+@pytest.mark.asyncio
+async def test_execution_stats_empty(client: AsyncClient):
+    """Test stats with no executions in the window."""
+    response = await client.get(f"{settings.API_V1_STR}/history/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_executions"] == 0
+    assert data["success_rate"] == 0
+    assert data["average_duration_seconds"] == 0
+
+
+@pytest.mark.asyncio
+async def test_workflow_history_cursor_pagination(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test keyset pagination walks every execution exactly once."""
+    workflow = await _create_executions(session, ["completed"] * 5)
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/history"
+
+    first = await client.get(url, params={"limit": 3})
+    assert first.status_code == 200
+    first_data = first.json()
+    assert len(first_data["executions"]) == 3
+    assert first_data["next_cursor"] is not None
+
+    second = await client.get(
+        url, params={"limit": 3, "cursor": first_data["next_cursor"]}
+    )
+    assert second.status_code == 200
+    second_data = second.json()
+    assert len(second_data["executions"]) == 2
+    assert second_data["next_cursor"] is None
+
+    seen = {e["id"] for e in first_data["executions"] + second_data["executions"]}
+    assert len(seen) == 5
+
+
+@pytest.mark.asyncio
+async def test_workflow_history_invalid_cursor(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test a malformed cursor is rejected."""
+    workflow = await _create_executions(session, ["completed"])
+    response = await client.get(
+        f"{settings.API_V1_STR}/workflows/{workflow.id}/history",
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_workflow_execution_details(client: AsyncClient, session: AsyncSession):
+    """Test execution details include metadata and task attempts."""
+    workflow = Workflow(name="Detailed Workflow")
+    task = Task(name="extract", action_type="http", workflow_id=workflow.id)
+    execution = WorkflowExecution(
+        workflow_id=workflow.id,
+        workflow_name=workflow.name,
+        status="completed",
+        extra_data={"trigger": "manual"},
+    )
+    session.add_all([workflow, task, execution])
+    await session.commit()
+    session.add(
+        TaskExecution(
+            workflow_execution_id=execution.id,
+            task_id=task.id,
+            task_name=task.name,
+            status="completed",
+            result={"rows": 3},
+        )
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/workflows/{workflow.id}/executions/{execution.id}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == str(execution.id)
+    assert data["metadata"] == {"trigger": "manual"}
+    assert data["completed_at"] is None
+    assert data["started_at"].endswith("+00:00")
+    assert len(data["tasks"]) == 1
+    assert data["tasks"][0]["task_name"] == "extract"
+    assert data["tasks"][0]["result"] == {"rows": 3}
+
+
+def test_cutoff_uses_shared_clock():
+    """Test look-back windows follow orbit.core.clock, including frozen time."""
+    from datetime import timedelta
+
+    from orbit.api.v1.endpoints.history import _cutoff
+    from orbit.core.clock import frozen_utcnow
+
+    with frozen_utcnow() as now:
+        assert _cutoff(1) == now - timedelta(hours=1)
+    assert _cutoff(1).tzinfo is None
+
+
+@pytest.mark.asyncio
+async def test_recent_executions_ndjson(client: AsyncClient, session: AsyncSession):
+    """Test recent executions stream one JSON document per line."""
+    await _create_executions(session, ["completed", "failed", "running"])
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/history/recent.ndjson", params={"status": "failed"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["status"] == "failed"
+
+
+def _dependency_calls(dependant) -> set:
+    """Every dependency callable a route resolves, including nested ones."""
+    calls = set()
+    for dependency in dependant.dependencies:
+        calls.add(dependency.call)
+        calls |= _dependency_calls(dependency)
+    return calls
+
+
+def test_streaming_and_multi_statement_reads_avoid_readonly_session():
+    """Test cursor-streaming and multi-statement handlers use a transactional session."""
+    from orbit.api.v1.endpoints.history import router
+    from orbit.db.session import get_readonly_session, get_session
+
+    routes = {route.path: route for route in router.routes}
+    for path in (
+        "/history/recent.ndjson",
+        "/workflows/{workflow_id}/executions/{execution_id}",
+    ):
+        calls = _dependency_calls(routes[path].dependant)
+        assert get_session in calls
+        assert get_readonly_session not in calls
@@ -5,7 +5,15 @@ Tests for idempotency and templates.
 from uuid import uuid4
 
 import pytest
-
+from httpx import AsyncClient
+
+from orbit.core.config import settings
+from orbit.core.idempotency import (
+    IDEMPOTENCY_IN_FLIGHT_TTL,
+    InFlight,
+    RedisIdempotencyStore,
+    StoredResponse,
+)
 from orbit.services.idempotency_service import IdempotencyService
 from orbit.services.template_service import TemplateService
 
@@ -50,6 +58,78 @@ def test_idempotency_key_with_payload():
     assert key1 != key3
 
 
+@pytest.mark.asyncio
+async def test_check_idempotency_ignores_expired_keys(session):
+    """Test expired keys are filtered out by the query."""
+    from orbit.models.workflow import Workflow
+
+    workflow = Workflow(name="Idempotent Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    service = IdempotencyService(session)
+    record = await service.create_idempotency_record(workflow.id, "extract", "k1")
+
+    is_duplicate, existing = await service.check_idempotency(
+        workflow.id, "extract", "k1"
+    )
+    assert is_duplicate is True
+    assert existing.id == record.id
+
+    record.set_ttl(hours=-1)
+    await session.commit()
+
+    result = await service.check_idempotency(workflow.id, "extract", "k1")
+    assert result == (False, None)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for RedisIdempotencyStore."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        self.expiry[name] = ex
+        return True
+
+    async def get(self, name):
+        return self.data.get(name)
+
+    async def eval(self, script, numkeys, name, marker):
+        if self.data.get(name) == marker:
+            del self.data[name]
+            return 1
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_redis_idempotency_store_reserves_with_set_nx():
+    """Test the Redis store reserves keys once and replays stored responses."""
+    redis = FakeRedis()
+    store = RedisIdempotencyStore(redis)
+
+    assert await store.reserve("key", "first") is None
+    assert redis.expiry["orbit:idempotency:key"] == IDEMPOTENCY_IN_FLIGHT_TTL
+    assert await store.reserve("key", "second") == InFlight("first")
+
+    # Only the holder can release its reservation
+    await store.release("key", "second")
+    assert await store.reserve("key", "third") == InFlight("first")
+    await store.release("key", "first")
+    assert await store.reserve("key", "third") is None
+
+    stored = StoredResponse(b"\x01\x02", 201, b'{"id": 1}')
+    await store.save("key", stored)
+    assert await store.reserve("key", "fourth") == stored
+    await store.release("key", "third")
+    assert await store.reserve("key", "fifth") == stored
+
+
 def test_template_parameter_validation():
     """Test template parameter validation."""
 
@@ -180,3 +260,42 @@ def test_template_interpolation():
     assert result["config"]["url"] == "https://api.example.com"
     # Numeric values are converted to strings during interpolation
     assert result["config"]["timeout"] == "30"
+
+
+@pytest.mark.asyncio
+async def test_template_etag_revalidation(client: AsyncClient):
+    """Test template reads return ETags and honor If-None-Match."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/templates/",
+        json={
+            "name": "etag-template",
+            "description": "Cached template",
+            "template_data": {"name": "{{name}}", "tasks": []},
+        },
+    )
+    assert created.status_code == 201
+    url = f"{settings.API_V1_STR}/templates/{created.json()['id']}"
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.json()["name"] == "etag-template"
+    etag = response.headers["etag"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    listed = await client.get(url, headers={"If-None-Match": f'W/"stale", {etag}'})
+    assert listed.status_code == 304
+
+    listing = await client.get(f"{settings.API_V1_STR}/templates/")
+    assert [t["name"] for t in listing.json()] == ["etag-template"]
+    list_etag = listing.headers["etag"]
+
+    assert (await client.delete(url)).status_code == 204
+    assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 404
+
+    listing = await client.get(
+        f"{settings.API_V1_STR}/templates/", headers={"If-None-Match": list_etag}
+    )
+    assert listing.status_code == 200
+    assert listing.json() == []
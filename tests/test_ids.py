@@ -0,0 +1,28 @@
+"""
+Tests for identifier helpers.
+"""
+
+import time
+
+from orbit.core.ids import uuid7
+
+
+def test_uuid7_layout():
+    """Test version, variant and embedded timestamp."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_is_time_ordered():
+    """Test keys generated in later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first < second
+    assert len({uuid7() for _ in range(1000)}) == 1000
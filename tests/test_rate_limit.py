@@ -4,6 +4,9 @@ Tests for rate limiting functionality.
 
 import time
 
+import pytest
+
+from orbit.core import rate_limit
 from orbit.core.rate_limit import RateLimiter, TokenBucket
 
 
@@ -13,6 +16,7 @@ def test_token_bucket_initialization():
     assert bucket.capacity == 10
     assert bucket.tokens == 10
     assert bucket.refill_rate == 1.0
+    assert not hasattr(bucket, "__dict__")
 
 
 def test_token_bucket_consume():
@@ -56,6 +60,23 @@ def test_token_bucket_max_capacity():
     assert bucket.tokens <= bucket.capacity
 
 
+def test_token_bucket_uses_monotonic_clock(monkeypatch):
+    """Test refill follows the monotonic clock exactly and ignores wall time."""
+    now = [0]
+    monkeypatch.setattr(rate_limit.time, "monotonic_ns", lambda: now[0])
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 0.0)
+
+    bucket = TokenBucket(capacity=10, refill_rate=10.0)
+    bucket.consume(10)
+
+    for _ in range(10):
+        now[0] += 100_000_000  # 100ms adds exactly one token
+        assert bucket.consume(1) is True
+        assert bucket.consume(1) is False
+
+    assert bucket.tokens == 0
+
+
 def test_rate_limiter_basic():
     """Test basic rate limiter functionality."""
     limiter = RateLimiter(requests_per_minute=60, burst_size=10)
@@ -106,6 +127,22 @@ def test_rate_limiter_refill():
     assert limiter.is_allowed("client1") is True
 
 
+def test_rate_limiter_drops_idle_and_excess_buckets():
+    """Test client buckets are bounded and expire once idle."""
+    limiter = RateLimiter(requests_per_minute=60, burst_size=2, max_clients=2)
+    limiter.buckets.ttl = 0.05
+
+    limiter.is_allowed("client1")
+    limiter.is_allowed("client2")
+    limiter.is_allowed("client3")
+    assert "client1" not in limiter.buckets
+    assert len(limiter.buckets) == 2
+
+    time.sleep(0.06)
+    assert "client2" not in limiter.buckets
+    assert limiter.get_wait_time("client3") == 0
+
+
 def test_rate_limiter_wait_time():
     """Test wait time calculation."""
     limiter = RateLimiter(requests_per_minute=60, burst_size=2)
@@ -134,3 +171,68 @@ def test_token_bucket_get_wait_time():
     # Wait time for 4 tokens should be ~2 seconds
     wait_time = bucket.get_wait_time(4)
     assert 1.8 <= wait_time <= 2.2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers(client):
+    """Test responses carry the limit and the client's remaining tokens."""
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Limit"] == "100"
+    assert int(response.headers["X-RateLimit-Remaining"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_middleware_rejects_and_skips_excluded():
+    """Test over-limit requests get a 429 and excluded paths pass through."""
+    from httpx import ASGITransport, AsyncClient
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(
+        routes=[Route("/work", ok), Route("/health", ok), Route("/static/app.js", ok)]
+    )
+    app.add_middleware(
+        rate_limit.RateLimitMiddleware,
+        requests_per_minute=60,
+        burst_size=1,
+        exclude_paths=["/health", "/static/*"],
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.get("/work")
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Remaining"] == "0"
+
+        limited = await client.get("/work")
+        assert limited.status_code == 429
+        assert limited.headers["Retry-After"] == "1"
+        assert limited.json()["error"] == "HTTPException"
+
+        for path in ("/health", "/static/app.js"):
+            excluded = await client.get(path)
+            assert excluded.status_code == 200
+            assert "X-RateLimit-Limit" not in excluded.headers
+
+        # Exact entries do not match longer paths
+        assert (await client.get("/health/db")).status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_middleware_passes_lifespan_through():
+    """Test lifespan scopes, which have no path, reach the wrapped app."""
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = rate_limit.RateLimitMiddleware(inner)
+    await middleware({"type": "lifespan"}, None, None)
+    assert seen == ["lifespan"]
@@ -2,7 +2,10 @@
 Tests for retry policy functionality.
 """
 
-from orbit.models.retry_policy import RetryPolicy
+import pytest
+from pydantic import ValidationError
+
+from orbit.models.retry_policy import RetryPolicy, make_retry_policy
 
 
 def test_retry_policy_defaults():
@@ -92,3 +95,37 @@ def test_retry_policy_no_retries():
 
     assert policy.should_retry(0) is False
     assert policy.calculate_delay(0) == 0
+
+
+def test_retry_policy_delay_table_is_bounded():
+    """Test huge retry counts reuse the capped delay instead of growing."""
+    policy = RetryPolicy(
+        max_retries=100_000,
+        initial_delay=1.0,
+        max_delay=10.0,
+        backoff_multiplier=2.0,
+        jitter=False,
+    )
+
+    assert len(policy._delays) == 5
+    assert policy.calculate_delay(3) == 8.0
+    assert policy.calculate_delay(99_999) == 10.0
+
+
+def test_retry_policies_are_frozen_and_shared():
+    """Test policies are immutable and identical settings reuse one instance."""
+    policy = make_retry_policy(max_retries=3, initial_delay=1.0)
+    assert make_retry_policy(max_retries=3, initial_delay=1.0) is policy
+    assert make_retry_policy() == RetryPolicy()
+
+    with pytest.raises(ValidationError):
+        policy.max_retries = 5
+
+
+def test_make_retry_policy_accepts_unhashable_settings():
+    """Test unhashable settings are validated normally instead of breaking the cache."""
+    policy = make_retry_policy(max_retries=2, retry_on=["timeout"])
+    assert policy.max_retries == 2
+
+    with pytest.raises(ValidationError):
+        make_retry_policy(max_retries=[3])
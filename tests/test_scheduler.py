@@ -5,7 +5,13 @@ Tests for workflow scheduling functionality.
 from datetime import datetime
 from uuid import uuid4
 
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from orbit.core.config import settings
 from orbit.models.schedule import WorkflowSchedule
+from orbit.models.workflow import Workflow
 
 
 def test_validate_cron_expression_valid():
@@ -41,6 +47,25 @@ def test_calculate_next_run():
     assert next_run.day == 1
 
 
+def test_next_run_reuses_parsed_expression():
+    """Test a cached cron parse gives independent results per base time."""
+    from datetime import timezone
+
+    from orbit.models.schedule import _parsed_cron
+
+    _parsed_cron.cache_clear()
+    later = WorkflowSchedule.next_run_for("30 4 * * *", datetime(2024, 1, 1, 5, 0))
+    earlier = WorkflowSchedule.next_run_for("30 4 * * *", datetime(2024, 1, 1, 3, 0))
+    aware = WorkflowSchedule.next_run_for(
+        "30 4 * * *", datetime(2024, 1, 1, 3, 0, tzinfo=timezone.utc)
+    )
+
+    assert later == datetime(2024, 1, 2, 4, 30)
+    assert earlier == datetime(2024, 1, 1, 4, 30)
+    assert aware == datetime(2024, 1, 1, 4, 30, tzinfo=timezone.utc)
+    assert _parsed_cron.cache_info().misses == 1
+
+
 def test_calculate_next_run_after_time():
     """Test next run calculation when current time is after scheduled time."""
     schedule = WorkflowSchedule(
@@ -104,3 +129,72 @@ def test_every_5_minutes_schedule():
     # Next run should be at 10:05
     assert next_run.hour == 10
     assert next_run.minute == 5
+
+
+@pytest.mark.asyncio
+async def test_create_schedule_api(client: AsyncClient, session: AsyncSession):
+    """Test creating a schedule, rejecting duplicates and unknown workflows."""
+    workflow = Workflow(name="Scheduled Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/schedule"
+    response = await client.post(url, json={"cron_expression": "0 2 * * *"})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["workflow_id"] == str(workflow.id)
+    assert data["next_run"] is not None
+
+    duplicate = await client.post(url, json={"cron_expression": "0 3 * * *"})
+    assert duplicate.status_code == 400
+
+    missing = await client.post(
+        f"{settings.API_V1_STR}/workflows/{uuid4()}/schedule",
+        json={"cron_expression": "0 2 * * *"},
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_schedule_api(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test updating and deleting a schedule through the API."""
+    workflow = Workflow(name="Updated Schedule Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/schedule"
+    created = await client.post(url, json={"cron_expression": "0 2 * * *"})
+    assert created.status_code == 201
+
+    response = await client.put(
+        url, json={"cron_expression": "*/5 * * * *", "enabled": False}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["cron_expression"] == "*/5 * * * *"
+    assert data["enabled"] is False
+    assert data["timezone"] == "UTC"
+    assert data["next_run"] != created.json()["next_run"]
+
+    assert (await client.delete(url)).status_code == 204
+    assert (await client.delete(url)).status_code == 404
+    assert (await client.put(url, json={"enabled": True})).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_api(client: AsyncClient, session: AsyncSession):
+    """Test fetching a schedule and the missing-schedule case."""
+    workflow = Workflow(name="Fetched Schedule Workflow")
+    session.add(workflow)
+    await session.commit()
+
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/schedule"
+    assert (await client.get(url)).status_code == 404
+
+    await client.post(url, json={"cron_expression": "0 2 * * *"})
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.json()["cron_expression"] == "0 2 * * *"
@@ -94,6 +94,17 @@ def test_wrong_key_fails_decryption():
         service2.decrypt(encrypted)
 
 
+def test_bytes_round_trip_matches_str_api():
+    """Test bytes helpers interoperate with the str API."""
+    service = EncryptionService(EncryptionService.generate_key())
+
+    token = service.encrypt_bytes(b"secret")
+    assert isinstance(token, bytes)
+    assert service.decrypt_bytes(token) == b"secret"
+    assert service.decrypt(token.decode()) == "secret"
+    assert service.decrypt_bytes(service.encrypt("secret").encode()) == b"secret"
+
+
 def test_global_encryption_service():
     """Test global encryption service instance."""
     plaintext = "test_secret"
@@ -104,6 +115,17 @@ def test_global_encryption_service():
     assert decrypted == plaintext
 
 
+@pytest.mark.asyncio
+async def test_async_encrypt_decrypt_round_trip():
+    """Test async helpers round-trip both inline and offloaded values."""
+    from orbit.core.encryption import OFFLOAD_THRESHOLD
+
+    service = EncryptionService()
+    for plaintext in ("short", "x" * OFFLOAD_THRESHOLD):
+        encrypted = await service.encrypt_async(plaintext)
+        assert await service.decrypt_async(encrypted) == plaintext
+
+
 def test_variable_interpolation_pattern():
     """Test variable interpolation pattern matching."""
     import re
@@ -126,3 +148,27 @@ def test_variable_interpolation_pattern():
     text4 = "${global:timeout}"
     matches4 = re.findall(pattern, text4)
     assert matches4 == [("global", "timeout")]
+
+
+@pytest.mark.asyncio
+async def test_secrets_api_masks_values(client, session):
+    """Test created and listed secrets never expose their values."""
+    from orbit.core.config import settings
+    from orbit.models.workflow import Workflow
+    from orbit.schemas.variables import MASKED
+
+    workflow = Workflow(name="Secret Workflow")
+    session.add(workflow)
+    await session.commit()
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/secrets"
+
+    created = await client.post(url, json={"key": "api_key", "value": "hunter2"})
+    assert created.status_code == 201
+    assert created.json()["value_masked"] == MASKED
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["key"] for s in data] == ["api_key"]
+    assert data[0]["value_masked"] == MASKED
+    assert "hunter2" not in response.text
@@ -2,9 +2,16 @@
 Tests for workflow versioning.
 """
 
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from orbit.core.config import settings
+from orbit.core.http_cache import CACHE_SHORT, CACHE_VERSIONED
 from orbit.models.versioning import WorkflowVersion
+from orbit.models.workflow import Workflow
 from orbit.services.versioning_service import VersioningService
 
 
@@ -150,3 +157,210 @@ def test_draft_version():
     assert draft.is_draft is True
     assert draft.is_active is False
     assert draft.activated_at is None
+
+
+@pytest.mark.asyncio
+async def test_version_reads_set_cache_headers(client: AsyncClient):
+    """Test version read endpoints send Cache-Control; errors do not."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/",
+        json={
+            "name": "Cached Versions",
+            "tasks": [{"name": "only", "action_type": "http_request"}],
+        },
+    )
+    base = f"{settings.API_V1_STR}/workflows/{created.json()['id']}"
+    assert (await client.post(f"{base}/versions", json={})).status_code == 201
+
+    listing = await client.get(f"{base}/versions")
+    assert listing.status_code == 200
+    assert listing.headers["cache-control"] == CACHE_VERSIONED
+    assert "Authorization" in listing.headers["vary"]
+
+    active = await client.get(f"{base}/versions/active")
+    assert active.headers["cache-control"] == CACHE_SHORT
+
+    missing = await client.get(f"{base}/versions/99")
+    assert missing.status_code == 404
+    assert "cache-control" not in missing.headers
+
+
+@pytest.mark.asyncio
+async def test_compare_versions_api(client: AsyncClient, session: AsyncSession):
+    """Test comparing two stored versions and a missing one."""
+    workflow = Workflow(name="Compared")
+    session.add(workflow)
+    for number, name in ((1, "Compared"), (2, "Compared v2")):
+        session.add(
+            WorkflowVersion(
+                workflow_id=workflow.id,
+                version_number=number,
+                name=name,
+                workflow_data={"name": name, "tasks": []},
+                checksum=str(number),
+            )
+        )
+    await session.commit()
+
+    url = f"{settings.API_V1_STR}/workflows/{workflow.id}/compare"
+    response = await client.get(url, params={"version_a": 1, "version_b": 2})
+    assert response.status_code == 200
+    assert response.json()["differences"]["modified"] == {
+        "name": {"old": "Compared", "new": "Compared v2"}
+    }
+
+    same = await client.get(url, params={"version_a": 2, "version_b": 2})
+    assert same.json()["differences"]["modified"] == {}
+
+    missing = await client.get(url, params={"version_a": 1, "version_b": 3})
+    assert missing.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_versions_skips_workflow_data(session: AsyncSession):
+    """Test version listings do not load the full workflow definition."""
+    from sqlalchemy import inspect
+
+    workflow = Workflow(name="Listed")
+    session.add(workflow)
+    session.add(
+        WorkflowVersion(
+            workflow_id=workflow.id,
+            version_number=1,
+            name="Listed",
+            workflow_data={"name": "Listed", "tasks": []},
+        )
+    )
+    await session.commit()
+    session.expunge_all()
+
+    versions = await VersioningService(session).list_versions(workflow.id)
+
+    assert [v.version_number for v in versions] == [1]
+    assert "workflow_data" in inspect(versions[0]).unloaded
+
+
+@pytest.mark.asyncio
+async def test_active_version_cache_invalidated_on_write(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test the cached active version is replaced when a version is created."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/",
+        json={
+            "name": "Active Cache",
+            "tasks": [{"name": "only", "action_type": "http_request"}],
+        },
+    )
+    workflow_id = created.json()["id"]
+    base = f"{settings.API_V1_STR}/workflows/{workflow_id}"
+    assert (await client.post(f"{base}/versions", json={})).status_code == 201
+
+    first = await client.get(f"{base}/versions/active")
+    assert first.json()["version_number"] == 1
+
+    workflow = await session.get(Workflow, UUID(workflow_id))
+    workflow.name = "Active Cache v2"
+    session.add(workflow)
+    await session.commit()
+    assert (await client.post(f"{base}/versions", json={})).status_code == 201
+
+    second = await client.get(f"{base}/versions/active")
+    assert second.json()["version_number"] == 2
+    assert second.json()["name"] == "Active Cache v2"
+
+
+@pytest.mark.asyncio
+async def test_get_version_conditional_request(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test a version read revalidates until the version is superseded."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/",
+        json={
+            "name": "Conditional Version",
+            "tasks": [{"name": "only", "action_type": "http_request"}],
+        },
+    )
+    workflow_id = created.json()["id"]
+    base = f"{settings.API_V1_STR}/workflows/{workflow_id}"
+    await client.post(f"{base}/versions", json={})
+
+    first = await client.get(f"{base}/versions/1")
+    etag = first.headers["etag"]
+
+    cached = await client.get(f"{base}/versions/1", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["cache-control"] == CACHE_VERSIONED
+
+    workflow = await session.get(Workflow, UUID(workflow_id))
+    workflow.name = "Conditional Version v2"
+    session.add(workflow)
+    await session.commit()
+    await client.post(f"{base}/versions", json={})
+
+    superseded = await client.get(f"{base}/versions/1", headers={"If-None-Match": etag})
+    assert superseded.status_code == 200
+    assert superseded.json()["is_active"] is False
+
+
+@pytest.mark.asyncio
+async def test_rollback_invalidates_if_modified_since(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test a rolled-back workflow is never served as a stale 304."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/",
+        json={
+            "name": "Rollback Original",
+            "tasks": [{"name": "only", "action_type": "http_request"}],
+        },
+    )
+    workflow_id = created.json()["id"]
+    url = f"{settings.API_V1_STR}/workflows/{workflow_id}"
+    await client.post(f"{url}/versions", json={})
+
+    workflow = await session.get(Workflow, UUID(workflow_id))
+    workflow.name = "Rollback Renamed"
+    session.add(workflow)
+    await session.commit()
+    await client.post(f"{url}/versions", json={})
+
+    last_modified = (await client.get(url)).headers["last-modified"]
+    rollback = await client.post(f"{url}/rollback", json={"version_number": 1})
+    assert rollback.status_code == 200
+
+    response = await client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Rollback Original"
+
+
+@pytest.mark.asyncio
+async def test_active_version_cache_evicted_on_workflow_delete(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test a deleted workflow's active version is not served from the cache."""
+    from orbit.repositories.workflow_repository import (
+        TaskRepository,
+        WorkflowRepository,
+    )
+    from orbit.services.workflow_service import WorkflowService
+
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/",
+        json={
+            "name": "Deleted Active",
+            "tasks": [{"name": "only", "action_type": "http_request"}],
+        },
+    )
+    workflow_id = created.json()["id"]
+    base = f"{settings.API_V1_STR}/workflows/{workflow_id}"
+    await client.post(f"{base}/versions", json={})
+    assert (await client.get(f"{base}/versions/active")).status_code == 200
+
+    connection = await session.connection()
+    await connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+    service = WorkflowService(WorkflowRepository(session), TaskRepository(session))
+    await service.delete_workflow(UUID(workflow_id))
+
+    assert (await client.get(f"{base}/versions/active")).status_code == 404
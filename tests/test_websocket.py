@@ -0,0 +1,152 @@
+"""
+Tests for the WebSocket updates endpoint.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orbit.core.config import settings
+from orbit.main import app
+from orbit.services.websocket_manager import (
+    WORKFLOW_EVENTS_CHANNEL,
+    ConnectionManager,
+    RedisEventPublisher,
+    relay_redis_events,
+    ws_manager,
+)
+
+
+def test_websocket_receives_broadcasts_without_echo():
+    """Test client messages are not echoed and broadcasts are delivered."""
+    client = TestClient(app)
+
+    with client.websocket_connect(f"{settings.API_V1_STR}/ws") as websocket:
+        websocket.send_text("ping")
+        websocket.portal.call(ws_manager.broadcast, {"status": "paused"})
+
+        # The first frame received is the broadcast, not a heartbeat echo
+        assert websocket.receive_json() == {"status": "paused"}
+
+    assert ws_manager.active_connections == []
+
+
+class _FakeConnection:
+    """Minimal WebSocket stand-in that records sent frames."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent: list[str] = []
+
+    async def send_text(self, data: str):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_connections():
+    """Test a failing client is removed while the others still receive."""
+    manager = ConnectionManager()
+    healthy, broken = _FakeConnection(), _FakeConnection(fail=True)
+    manager.active_connections.extend([healthy, broken])
+
+    await manager.broadcast({"status": "resumed"})
+
+    assert healthy.sent == ['{"status": "resumed"}']
+    assert manager.active_connections == [healthy]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_nowait_delivers_in_background():
+    """Test scheduled broadcasts complete without being awaited directly."""
+    manager = ConnectionManager()
+    connection = _FakeConnection()
+    manager.active_connections.append(connection)
+
+    manager.broadcast_nowait({"status": "cancelled"})
+    await asyncio.gather(*manager._pending_broadcasts)
+
+    assert connection.sent == ['{"status": "cancelled"}']
+    assert not manager._pending_broadcasts
+
+
+class _FakeRedis:
+    """In-memory stand-in for the pub/sub calls made on the arq pool."""
+
+    def __init__(self):
+        self.published: list[tuple[str, str]] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+        self.failures = 0
+
+    async def publish(self, channel: str, data: str):
+        self.published.append((channel, data))
+        await self.messages.put(
+            {"type": "message", "channel": channel, "data": data.encode()}
+        )
+
+    def pubsub(self):
+        return self
+
+    async def subscribe(self, channel: str):
+        await self.messages.put({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def unsubscribe(self, channel: str):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def listen(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Connection closed by server.")
+        while True:
+            yield await self.messages.get()
+
+
+@pytest.mark.asyncio
+async def test_worker_events_are_relayed_to_api_clients():
+    """Test worker broadcasts reach WebSocket clients through Redis."""
+    redis = _FakeRedis()
+    manager = ConnectionManager()
+    connection = _FakeConnection()
+    manager.active_connections.append(connection)
+
+    relay = asyncio.create_task(relay_redis_events(redis, manager))
+    await RedisEventPublisher(redis).broadcast({"status": "running"})
+    while not connection.sent:
+        await asyncio.sleep(0)
+    relay.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await relay
+
+    assert redis.published == [(WORKFLOW_EVENTS_CHANNEL, '{"status": "running"}')]
+    assert connection.sent == ['{"status": "running"}']
+    assert redis.closed
+
+
+@pytest.mark.asyncio
+async def test_relay_resubscribes_after_connection_loss(monkeypatch):
+    """Test a dropped Redis connection does not end the relay."""
+    from orbit.services import websocket_manager
+
+    monkeypatch.setattr(websocket_manager, "RELAY_RETRY_INITIAL_DELAY", 0)
+    redis = _FakeRedis()
+    redis.failures = 1
+    manager = ConnectionManager()
+    connection = _FakeConnection()
+    manager.active_connections.append(connection)
+
+    relay = asyncio.create_task(relay_redis_events(redis, manager))
+    await RedisEventPublisher(redis).broadcast({"status": "completed"})
+    while not connection.sent:
+        await asyncio.sleep(0)
+    relay.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await relay
+
+    assert redis.failures == 0
+    assert connection.sent == ['{"status": "completed"}']
@@ -0,0 +1,608 @@
+"""
+Tests for workflow endpoints.
+"""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from orbit.core.config import settings
+
+
+def _workflow_payload(name: str) -> dict:
+    """Build a two-task workflow payload."""
+    return {
+        "name": name,
+        "tasks": [
+            {"name": "extract", "action_type": "http_request"},
+            {
+                "name": "load",
+                "action_type": "http_request",
+                "dependencies": ["extract"],
+            },
+        ],
+    }
+
+
+class QueryCounter:
+    """Count SQL statements executed on a session's engine."""
+
+    def __init__(self, session: AsyncSession):
+        self.engine = session.bind.sync_engine
+        self.count = 0
+        self.statements: list[str] = []
+
+    def _on_execute(self, conn, cursor, statement, *args) -> None:
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.mark.asyncio
+async def test_read_workflows_batches_task_loading(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test listing workflows loads tasks in one batched query, not one per workflow."""
+    for i in range(5):
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/", json=_workflow_payload(f"wf-{i}")
+        )
+        assert response.status_code == 201
+    session.expunge_all()
+
+    with QueryCounter(session) as counter:
+        response = await client.get(f"{settings.API_V1_STR}/workflows/")
+
+    assert response.status_code == 200
+    workflows = response.json()
+    assert len(workflows) == 5
+    assert all(len(w["tasks"]) == 2 for w in workflows)
+    assert counter.count == 2
+    # Task results are not part of the response and are not fetched
+    assert "task.result" not in counter.statements[1]
+
+
+@pytest.mark.asyncio
+async def test_read_workflows_fetches_in_batches(
+    client: AsyncClient, session: AsyncSession, monkeypatch
+):
+    """Test listing reads rows in batches and loads tasks once per batch."""
+    from orbit.repositories import workflow_repository
+
+    monkeypatch.setattr(workflow_repository, "LIST_BATCH_SIZE", 2)
+    for i in range(5):
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/", json=_workflow_payload(f"wf-{i}")
+        )
+        assert response.status_code == 201
+    session.expunge_all()
+
+    with QueryCounter(session) as counter:
+        response = await client.get(f"{settings.API_V1_STR}/workflows/")
+
+    assert response.status_code == 200
+    workflows = response.json()
+    assert [w["name"] for w in workflows] == [f"wf-{i}" for i in reversed(range(5))]
+    assert all(len(w["tasks"]) == 2 for w in workflows)
+    # One workflow query plus one task query per batch of two
+    assert counter.count == 4
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_single_transaction(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test creating a workflow commits once and does not reload it."""
+    with QueryCounter(session) as counter:
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/", json=_workflow_payload("atomic")
+        )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [t["name"] for t in data["tasks"]] == ["extract", "load"]
+    assert all(t["workflow_id"] == data["id"] for t in data["tasks"])
+    # One workflow INSERT and one batched task INSERT; no reload SELECTs
+    assert counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_invalid_dag_writes_nothing(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test a cyclic DAG is rejected before any SQL is issued."""
+    payload = {
+        "name": "cyclic",
+        "tasks": [
+            {"name": "a", "action_type": "http_request", "dependencies": ["b"]},
+            {"name": "b", "action_type": "http_request", "dependencies": ["a"]},
+        ],
+    }
+
+    with QueryCounter(session) as counter:
+        response = await client.post(f"{settings.API_V1_STR}/workflows/", json=payload)
+
+    assert response.status_code == 400
+    assert counter.count == 0
+    assert (await client.get(f"{settings.API_V1_STR}/workflows/")).json() == []
+
+
+class _RecordingPool:
+    """Stand-in for an arq pool that records enqueued jobs."""
+
+    def __init__(self):
+        self.jobs: list[tuple] = []
+
+    async def enqueue_job(self, function: str, *args):
+        self.jobs.append((function, *args))
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow_enqueues_to_worker(client: AsyncClient):
+    """Test executions go to the worker queue when one is configured."""
+    from orbit.services import execution_queue
+
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/", json=_workflow_payload("Queued")
+    )
+    workflow_id = created.json()["id"]
+
+    pool = _RecordingPool()
+    execution_queue.set_queue_pool(pool)
+    try:
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/{workflow_id}/execute"
+        )
+    finally:
+        execution_queue.set_queue_pool(None)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+    assert pool.jobs == [("execute_workflow_job", workflow_id)]
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow_checks_status_only(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test execute rejects running and unknown workflows from the status alone."""
+    from uuid import uuid4
+
+    from orbit.models.workflow import Workflow
+
+    workflow = Workflow(name="Running", status="running")
+    session.add(workflow)
+    await session.commit()
+
+    with QueryCounter(session) as counter:
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/{workflow.id}/execute"
+        )
+    assert response.status_code == 400
+    assert counter.count == 1
+
+    response = await client.post(f"{settings.API_V1_STR}/workflows/{uuid4()}/execute")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_enqueue_falls_back_to_background_tasks():
+    """Test executions run in-process when no worker queue is configured."""
+    from uuid import uuid4
+
+    from fastapi import BackgroundTasks
+
+    from orbit.services.execution_queue import (
+        enqueue_workflow_execution,
+        execute_workflow_task,
+    )
+
+    background_tasks = BackgroundTasks()
+    workflow_id = uuid4()
+    await enqueue_workflow_execution(workflow_id, background_tasks)
+
+    [task] = background_tasks.tasks
+    assert task.func is execute_workflow_task
+    assert task.args == (workflow_id,)
+
+
+@pytest.mark.asyncio
+async def test_read_workflows_cursor_pagination(client: AsyncClient):
+    """Test keyset pagination walks every workflow exactly once, newest first."""
+    url = f"{settings.API_V1_STR}/workflows/"
+    for i in range(5):
+        await client.post(url, json=_workflow_payload(f"page-{i}"))
+
+    first = await client.get(url, params={"limit": 3})
+    assert first.status_code == 200
+    assert [w["name"] for w in first.json()] == ["page-4", "page-3", "page-2"]
+    cursor = first.headers["x-next-cursor"]
+
+    second = await client.get(url, params={"limit": 3, "cursor": cursor})
+    assert [w["name"] for w in second.json()] == ["page-1", "page-0"]
+    assert "x-next-cursor" not in second.headers
+
+    invalid = await client.get(url, params={"cursor": "not-a-cursor"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_pause_workflow_does_not_reload(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test pausing reads and updates the workflow without a refresh SELECT."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/", json=_workflow_payload("pausable")
+    )
+    workflow_id = created.json()["id"]
+    session.expunge_all()
+
+    with QueryCounter(session) as counter:
+        response = await client.post(
+            f"{settings.API_V1_STR}/workflows/{workflow_id}/pause"
+        )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "paused"
+    # One SELECT for the workflow and one UPDATE
+    assert counter.count == 2
+
+    status = await client.get(f"{settings.API_V1_STR}/workflows/{workflow_id}/status")
+    assert status.json()["is_paused"] is True
+    assert status.json()["paused_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_conditional_requests(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test get_workflow answers 304 for a current ETag and 200 after a change."""
+    created = await client.post(
+        f"{settings.API_V1_STR}/workflows/", json=_workflow_payload("conditional")
+    )
+    url = f"{settings.API_V1_STR}/workflows/{created.json()['id']}"
+
+    first = await client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    last_modified = first.headers["last-modified"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    # If-Modified-Since is too coarse for run status changes and is ignored
+    since = await client.get(url, headers={"If-Modified-Since": last_modified})
+    assert since.status_code == 200
+
+    head = await client.head(url)
+    assert head.status_code == 200
+    assert head.headers["etag"] == etag
+
+    await client.post(f"{url}/pause")
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_session_dependency_resolved_once_per_request(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test handlers that use several repositories share a single session."""
+    from orbit.db.session import get_session
+    from orbit.main import app
+
+    calls = 0
+
+    def counting_session():
+        nonlocal calls
+        calls += 1
+        return session
+
+    app.dependency_overrides[get_session] = counting_session
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/workflows/", json=_workflow_payload("one-session")
+    )
+
+    assert response.status_code == 201
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_export_workflows_ndjson(client: AsyncClient):
+    """Test the export streams one workflow with its tasks per line."""
+    for i in range(3):
+        await client.post(
+            f"{settings.API_V1_STR}/workflows/", json=_workflow_payload(f"export-{i}")
+        )
+
+    response = await client.get(f"{settings.API_V1_STR}/workflows/export.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    workflows = [json.loads(line) for line in response.text.splitlines()]
+    assert [w["name"] for w in workflows] == ["export-2", "export-1", "export-0"]
+    assert all(len(w["tasks"]) == 2 for w in workflows)
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_idempotency_key(client: AsyncClient):
+    """Test a retried create with the same Idempotency-Key returns the original."""
+    url = f"{settings.API_V1_STR}/workflows/"
+    headers = {"Idempotency-Key": "create-once"}
+
+    first = await client.post(url, json=_workflow_payload("idem"), headers=headers)
+    retry = await client.post(url, json=_workflow_payload("idem"), headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert len((await client.get(url)).json()) == 1
+
+    reused = await client.post(url, json=_workflow_payload("other"), headers=headers)
+    assert reused.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_idempotency_keys_are_scoped_per_caller(client: AsyncClient):
+    """Test one caller's Idempotency-Key never replays another caller's response."""
+    from uuid import uuid4
+
+    from orbit.core.auth import create_access_token
+
+    url = f"{settings.API_V1_STR}/workflows/"
+
+    def headers_for(user_id: str) -> dict[str, str]:
+        token = create_access_token({"sub": user_id, "user_id": user_id})
+        return {"Idempotency-Key": "shared", "Authorization": f"Bearer {token}"}
+
+    alice, bob = str(uuid4()), str(uuid4())
+    first = await client.post(
+        url, json=_workflow_payload("scoped"), headers=headers_for(alice)
+    )
+    other = await client.post(
+        url, json=_workflow_payload("scoped"), headers=headers_for(bob)
+    )
+    retry = await client.post(
+        url, json=_workflow_payload("scoped"), headers=headers_for(alice)
+    )
+
+    assert first.status_code == other.status_code == 201
+    assert "idempotent-replayed" not in other.headers
+    assert other.json()["id"] != first.json()["id"]
+    assert retry.json()["id"] == first.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_is_reserved_while_in_flight(
+    client: AsyncClient, monkeypatch
+):
+    """Test a duplicate sent while the first request runs gets 409, not a rerun."""
+    import asyncio
+
+    from orbit.services.workflow_service import WorkflowService
+
+    url = f"{settings.API_V1_STR}/workflows/"
+    headers = {"Idempotency-Key": "in-flight"}
+    started, release = asyncio.Event(), asyncio.Event()
+    create = WorkflowService.create_workflow
+
+    async def slow_create(self, workflow_in):
+        started.set()
+        await release.wait()
+        return await create(self, workflow_in)
+
+    monkeypatch.setattr(WorkflowService, "create_workflow", slow_create)
+
+    first = asyncio.create_task(
+        client.post(url, json=_workflow_payload("slow"), headers=headers)
+    )
+    await started.wait()
+    duplicate = await client.post(url, json=_workflow_payload("slow"), headers=headers)
+    release.set()
+
+    assert duplicate.status_code == 409
+    assert (await first).status_code == 201
+    retry = await client.post(url, json=_workflow_payload("slow"), headers=headers)
+    assert retry.headers["idempotent-replayed"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_is_released_when_the_request_fails(
+    client: AsyncClient,
+):
+    """Test a failed request frees its Idempotency-Key for a retry."""
+    url = f"{settings.API_V1_STR}/workflows/"
+    headers = {"Idempotency-Key": "fails"}
+    cyclic = {
+        "name": "cyclic",
+        "tasks": [
+            {"name": "a", "action_type": "http_request", "dependencies": ["b"]},
+            {"name": "b", "action_type": "http_request", "dependencies": ["a"]},
+        ],
+    }
+
+    first = await client.post(url, json=cyclic, headers=headers)
+    retry = await client.post(url, json=cyclic, headers=headers)
+
+    assert first.status_code == retry.status_code == 400
+    assert "idempotent-replayed" not in retry.headers
+
+
+@pytest.mark.asyncio
+async def test_status_rejects_malformed_id_without_querying(
+    client: AsyncClient, session: AsyncSession
+):
+    """Test malformed workflow IDs fail path validation before any SQL runs."""
+    with QueryCounter(session) as counter:
+        response = await client.get(
+            f"{settings.API_V1_STR}/workflows/not-a-uuid/status"
+        )
+
+    assert response.status_code == 422
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_create_many_tasks_in_one_statement(session: AsyncSession):
+    """Test bulk task creation issues one INSERT and no per-task reloads."""
+    from orbit.models.workflow import Task, Workflow
+    from orbit.repositories.workflow_repository import TaskRepository
+
+    workflow = Workflow(name="bulk")
+    session.add(workflow)
+    await session.commit()
+
+    tasks = [
+        Task(workflow_id=workflow.id, name=f"t{i}", action_type="http")
+        for i in range(5)
+    ]
+    with QueryCounter(session) as counter:
+        created = await TaskRepository(session).create_many(tasks)
+
+    assert counter.count == 1
+    assert [t.name for t in created] == ["t0", "t1", "t2", "t3", "t4"]
+    assert created[0].created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_do_not_reload(session: AsyncSession):
+    """Test create and update send only their write, with no refresh SELECT."""
+    from orbit.models.workflow import Workflow
+    from orbit.repositories.workflow_repository import WorkflowRepository
+
+    repo = WorkflowRepository(session)
+    with QueryCounter(session) as counter:
+        workflow = await repo.create(Workflow(name="no-reload"))
+        workflow.status = "running"
+        await repo.update(workflow)
+
+    assert counter.count == 2
+    assert workflow.status == "running"
+
+
+@pytest.mark.asyncio
+async def test_delete_workflow_cascades_in_one_statement(session: AsyncSession):
+    """Test deleting a workflow is one DELETE and removes its tasks."""
+    from sqlmodel import select
+
+    from orbit.core.exceptions import WorkflowNotFoundError
+    from orbit.models.workflow import Task, Workflow
+    from orbit.repositories.workflow_repository import WorkflowRepository
+
+    # SQLite only enforces foreign keys (and their cascades) when asked
+    connection = await session.connection()
+    await connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    workflow = Workflow(name="doomed")
+    session.add(workflow)
+    session.add(Task(workflow_id=workflow.id, name="t", action_type="http"))
+    await session.commit()
+
+    repo = WorkflowRepository(session)
+    with QueryCounter(session) as counter:
+        await repo.delete(workflow.id)
+
+    assert counter.count == 1
+    assert (await session.exec(select(Task))).all() == []
+
+    with pytest.raises(WorkflowNotFoundError):
+        await repo.delete(workflow.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_workflow_cascades_to_every_child_table(session: AsyncSession):
+    """Test the single DELETE also removes variables, versions, schedules and runs."""
+    from sqlmodel import select
+
+    from orbit.models.execution_history import TaskExecution, WorkflowExecution
+    from orbit.models.schedule import WorkflowSchedule
+    from orbit.models.variables import WorkflowVariable
+    from orbit.models.versioning import WorkflowVersion
+    from orbit.models.workflow import Task, Workflow
+    from orbit.repositories.workflow_repository import WorkflowRepository
+
+    connection = await session.connection()
+    await connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    workflow = Workflow(name="doomed with history")
+    task = Task(workflow_id=workflow.id, name="t", action_type="http")
+    session.add_all([workflow, task])
+    await session.commit()
+
+    execution = WorkflowExecution(
+        workflow_id=workflow.id, workflow_name=workflow.name, status="completed"
+    )
+    session.add(execution)
+    await session.commit()
+    session.add_all(
+        [
+            WorkflowVariable(workflow_id=workflow.id, key="k", value="v"),
+            WorkflowVersion(
+                workflow_id=workflow.id,
+                version_number=1,
+                name=workflow.name,
+                workflow_data={},
+            ),
+            WorkflowSchedule(workflow_id=workflow.id, cron_expression="0 * * * *"),
+            TaskExecution(
+                workflow_execution_id=execution.id,
+                task_id=task.id,
+                task_name=task.name,
+                status="completed",
+            ),
+        ]
+    )
+    await session.commit()
+
+    await WorkflowRepository(session).delete(workflow.id)
+
+    for model in (
+        Task,
+        WorkflowVariable,
+        WorkflowVersion,
+        WorkflowSchedule,
+        WorkflowExecution,
+        TaskExecution,
+    ):
+        assert (await session.exec(select(model))).all() == [], model.__name__
+
+
+@pytest.mark.asyncio
+async def test_workflow_tasks_load_eagerly_unless_excluded(session: AsyncSession):
+    """Test tasks are selectin-loaded by default and guarded when excluded."""
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlmodel import select
+
+    from orbit.models.workflow import Task, Workflow
+    from orbit.repositories.workflow_repository import WorkflowRepository
+
+    workflow = Workflow(name="eager")
+    session.add(workflow)
+    session.add(Task(workflow_id=workflow.id, name="t", action_type="http"))
+    await session.commit()
+    session.expunge_all()
+
+    loaded = (await session.exec(select(Workflow))).one()
+    assert [t.name for t in loaded.tasks] == ["t"]
+    session.expunge_all()
+
+    with QueryCounter(session) as counter:
+        bare = await WorkflowRepository(session).get_by_id(
+            workflow.id, include_tasks=False
+        )
+    assert counter.count == 1
+    with pytest.raises(InvalidRequestError):
+        _ = bare.tasks